@@ -0,0 +1,76 @@
+"""Baseline schema
+
+Tables as created by Database.create_database before migrations existed. Existing
+databases already have them, so each table is only created when missing. For the same
+reason the downgrade leaves them in place: it cannot tell created tables from
+pre-existing ones, and dropping them would delete production data.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 12:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("last_name", sa.String(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("password", sa.String(), nullable=False),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+    
+    if "products" not in existing:
+        op.create_table(
+            "products",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("sku", sa.String(), nullable=True),
+        )
+        op.create_index("ix_products_id", "products", ["id"])
+    
+    if "warehouses" not in existing:
+        op.create_table(
+            "warehouses",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+        )
+        op.create_index("ix_warehouses_id", "warehouses", ["id"])
+    
+    if "stock_moves" not in existing:
+        op.create_table(
+            "stock_moves",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("date", sa.Date(), nullable=False),
+            sa.Column("product_id", sa.String(), sa.ForeignKey("products.id"), nullable=False),
+            sa.Column("warehouse_id", sa.String(), sa.ForeignKey("warehouses.id"), nullable=False),
+            sa.Column(
+                "type",
+                sa.Enum("IN", "OUT", "ADJUST", name="stockmovetype"),
+                nullable=False
+            ),
+            sa.Column("quantity", sa.Integer(), nullable=False),
+            sa.Column("reference", sa.String(), nullable=False),
+        )
+        op.create_index("ix_stock_moves_id", "stock_moves", ["id"])
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,49 @@
+"""Composite indexes for stock move filter paths
+
+Match the WHERE/ORDER BY combinations issued by find_all_stock_moves: every listing
+orders by (date DESC, id DESC) and optionally filters on warehouse_id, type and
+product_id. Indexes that already exist (e.g. created by create_all on a fresh
+database) are skipped, so this applies cleanly to populated databases.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:10:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_stock_moves_date_id": ["date", "id"],
+    "ix_stock_moves_warehouse_date": ["warehouse_id", "date", "id"],
+    "ix_stock_moves_type_date": ["type", "date", "id"],
+    "ix_stock_moves_warehouse_type_date": ["warehouse_id", "type", "date", "id"],
+    "ix_stock_moves_product_date": ["product_id", "date", "id"],
+}
+
+
+def _existing_indexes() -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes("stock_moves")}
+
+
+def upgrade() -> None:
+    existing = _existing_indexes()
+    for name, columns in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "stock_moves", columns)
+
+
+def downgrade() -> None:
+    existing = _existing_indexes()
+    for name in INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name="stock_moves")
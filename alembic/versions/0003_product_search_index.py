@@ -0,0 +1,76 @@
+"""Product name/SKU search index
+
+SQLite gets an FTS5 trigram table kept in sync with products by triggers and
+backfilled from existing rows; PostgreSQL gets pg_trgm GIN indexes, which serve
+the ILIKE '%term%' fallback directly.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 12:40:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS products_search "
+    "USING fts5(product_id UNINDEXED, name, sku, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS products_search_ai AFTER INSERT ON products BEGIN "
+    "INSERT INTO products_search(product_id, name, sku) "
+    "VALUES (new.id, new.name, coalesce(new.sku, '')); END",
+    "CREATE TRIGGER IF NOT EXISTS products_search_au AFTER UPDATE ON products BEGIN "
+    "DELETE FROM products_search WHERE product_id = old.id; "
+    "INSERT INTO products_search(product_id, name, sku) "
+    "VALUES (new.id, new.name, coalesce(new.sku, '')); END",
+    "CREATE TRIGGER IF NOT EXISTS products_search_ad AFTER DELETE ON products BEGIN "
+    "DELETE FROM products_search WHERE product_id = old.id; END",
+    "DELETE FROM products_search",
+    "INSERT INTO products_search(product_id, name, sku) "
+    "SELECT id, name, coalesce(sku, '') FROM products",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS products_search_ai",
+    "DROP TRIGGER IF EXISTS products_search_au",
+    "DROP TRIGGER IF EXISTS products_search_ad",
+    "DROP TABLE IF EXISTS products_search",
+]
+
+POSTGRESQL_UPGRADE = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_products_name_trgm ON products USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_products_sku_trgm ON products USING gin (sku gin_trgm_ops)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_products_name_trgm",
+    "DROP INDEX IF EXISTS ix_products_sku_trgm",
+]
+
+
+def _run(statements: list) -> None:
+    for statement in statements:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        _run(SQLITE_UPGRADE)
+    elif dialect == "postgresql":
+        _run(POSTGRESQL_UPGRADE)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        _run(SQLITE_DOWNGRADE)
+    elif dialect == "postgresql":
+        _run(POSTGRESQL_DOWNGRADE)
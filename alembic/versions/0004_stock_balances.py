@@ -0,0 +1,59 @@
+"""Materialized stock balances per product and warehouse
+
+Creates stock_balances (skipped when create_all already built it) and rebuilds
+it from the stock_moves ledger, so existing databases start out consistent. From
+here on the repository keeps it current in the same transaction as each write.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 13:30:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REBUILD = [
+    "DELETE FROM stock_balances",
+    "INSERT INTO stock_balances "
+    "(product_id, warehouse_id, quantity_in, quantity_out, quantity_adjust, quantity) "
+    "SELECT product_id, warehouse_id, "
+    "SUM(CASE WHEN type = 'IN' THEN quantity ELSE 0 END), "
+    "SUM(CASE WHEN type = 'OUT' THEN quantity ELSE 0 END), "
+    "SUM(CASE WHEN type = 'ADJUST' THEN quantity ELSE 0 END), "
+    "SUM(CASE WHEN type = 'OUT' THEN -quantity ELSE quantity END) "
+    "FROM stock_moves GROUP BY product_id, warehouse_id",
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("stock_balances"):
+        op.create_table(
+            "stock_balances",
+            sa.Column("product_id", sa.String(), sa.ForeignKey("products.id"), primary_key=True),
+            sa.Column(
+                "warehouse_id", sa.String(), sa.ForeignKey("warehouses.id"), primary_key=True
+            ),
+            sa.Column("quantity_in", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("quantity_out", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("quantity_adjust", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("quantity", sa.Integer(), nullable=False, server_default="0"),
+        )
+        op.create_index(
+            "ix_stock_balances_warehouse_product", "stock_balances", ["warehouse_id", "product_id"]
+        )
+    
+    for statement in REBUILD:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.drop_table("stock_balances")
@@ -0,0 +1,46 @@
+"""Stock balance snapshots for as-of queries
+
+Stores balances per product and warehouse at period boundaries (end of day).
+Populate or refresh them with rebuild_snapshots.py.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 14:10:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("stock_balance_snapshots"):
+        return
+    
+    op.create_table(
+        "stock_balance_snapshots",
+        sa.Column("snapshot_date", sa.Date(), primary_key=True),
+        sa.Column("product_id", sa.String(), sa.ForeignKey("products.id"), primary_key=True),
+        sa.Column("warehouse_id", sa.String(), sa.ForeignKey("warehouses.id"), primary_key=True),
+        sa.Column("quantity_in", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("quantity_out", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("quantity_adjust", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("quantity", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_stock_balance_snapshots_product_warehouse",
+        "stock_balance_snapshots",
+        ["product_id", "warehouse_id", "snapshot_date"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stock_balance_snapshots")
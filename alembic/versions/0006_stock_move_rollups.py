@@ -0,0 +1,115 @@
+"""Day/week/month stock move rollups
+
+Creates stock_move_rollups keyed by (granularity, bucket, warehouse_id,
+product_id, type) and backfills it from stock_moves. Buckets start on the
+day, on Monday and on the first of the month respectively. The repository
+keeps the rows current in the same transaction as each write.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 15:00:00
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BUCKETS = {
+    "day": lambda day: day,
+    "week": lambda day: day - timedelta(days=day.weekday()),
+    "month": lambda day: day.replace(day=1),
+}
+
+# The enum type already exists on PostgreSQL (created with stock_moves)
+MOVE_TYPE = sa.Enum("IN", "OUT", "ADJUST", name="stockmovetype").with_variant(
+    postgresql.ENUM("IN", "OUT", "ADJUST", name="stockmovetype", create_type=False), "postgresql"
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("stock_move_rollups"):
+        op.create_table(
+            "stock_move_rollups",
+            sa.Column("granularity", sa.String(), primary_key=True),
+            sa.Column("bucket", sa.Date(), primary_key=True),
+            sa.Column(
+                "warehouse_id", sa.String(), sa.ForeignKey("warehouses.id"), primary_key=True
+            ),
+            sa.Column("product_id", sa.String(), sa.ForeignKey("products.id"), primary_key=True),
+            sa.Column("type", MOVE_TYPE, primary_key=True),
+            sa.Column("move_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("quantity", sa.Integer(), nullable=False, server_default="0"),
+        )
+    
+    stock_moves = sa.table(
+        "stock_moves",
+        sa.column("date", sa.Date()),
+        sa.column("warehouse_id", sa.String()),
+        sa.column("product_id", sa.String()),
+        sa.column("type", MOVE_TYPE),
+        sa.column("quantity", sa.Integer()),
+    )
+    rollups = sa.table(
+        "stock_move_rollups",
+        sa.column("granularity", sa.String()),
+        sa.column("bucket", sa.Date()),
+        sa.column("warehouse_id", sa.String()),
+        sa.column("product_id", sa.String()),
+        sa.column("type", MOVE_TYPE),
+        sa.column("move_count", sa.Integer()),
+        sa.column("quantity", sa.Integer()),
+    )
+    
+    daily = bind.execute(
+        sa.select(
+            stock_moves.c.date,
+            stock_moves.c.warehouse_id,
+            stock_moves.c.product_id,
+            stock_moves.c.type,
+            sa.func.count(),
+            sa.func.sum(stock_moves.c.quantity)
+        ).group_by(
+            stock_moves.c.date,
+            stock_moves.c.warehouse_id,
+            stock_moves.c.product_id,
+            stock_moves.c.type
+        )
+    )
+    
+    totals = {}
+    for day, warehouse_id, product_id, move_type, move_count, quantity in daily:
+        for granularity, bucket in BUCKETS.items():
+            key = (granularity, bucket(day), warehouse_id, product_id, move_type)
+            total = totals.setdefault(key, [0, 0])
+            total[0] += move_count
+            total[1] += quantity
+    
+    op.execute(rollups.delete())
+    if totals:
+        op.bulk_insert(rollups, [
+            {
+                "granularity": granularity,
+                "bucket": bucket,
+                "warehouse_id": warehouse_id,
+                "product_id": product_id,
+                "type": move_type,
+                "move_count": move_count,
+                "quantity": quantity,
+            }
+            for (granularity, bucket, warehouse_id, product_id, move_type), (move_count, quantity)
+            in totals.items()
+        ])
+
+
+def downgrade() -> None:
+    op.drop_table("stock_move_rollups")
@@ -0,0 +1,37 @@
+"""Data versions
+
+One row per resource (stock_moves, products, warehouses) whose version is
+bumped in the same transaction as every write. GET endpoints derive their
+ETag / Last-Modified from it and answer 304 without running the list query.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 18:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("data_versions"):
+        return
+    
+    op.create_table(
+        "data_versions",
+        sa.Column("resource", sa.String(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("data_versions")
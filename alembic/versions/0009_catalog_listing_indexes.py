@@ -0,0 +1,43 @@
+"""Catalog listing indexes
+
+Product and warehouse listings page by keyset on (name, id) or id, so name
+ordering walks an index instead of sorting the whole catalog. Indexes that
+already exist (e.g. created by create_all) are skipped.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 19:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_products_name_id": ("products", ["name", "id"]),
+    "ix_warehouses_name_id": ("warehouses", ["name", "id"]),
+}
+
+
+def _existing_indexes(table: str) -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    for name, (table, columns) in INDEXES.items():
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, (table, _) in INDEXES.items():
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
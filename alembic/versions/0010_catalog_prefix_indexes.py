@@ -0,0 +1,38 @@
+"""Catalog prefix indexes
+
+Product and warehouse prefix filters are case-insensitive and compare
+lower(name) and lower(sku) against a range, so each filter is an index range
+scan on these expression indexes instead of a LIKE over the whole catalog.
+The inspector does not reflect expression indexes, so IF NOT EXISTS skips the
+ones create_all already made.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-20 09:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_products_lower_name": ("products", "lower(name)"),
+    "ix_products_lower_sku": ("products", "lower(sku)"),
+    "ix_warehouses_lower_name": ("warehouses", "lower(name)"),
+}
+
+
+def upgrade() -> None:
+    for name, (table, expression) in INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({expression})")
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
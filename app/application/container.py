@@ -5,6 +5,7 @@ from app.application.settings import settings
 from app.domain.usecase.auth_usecase import AuthUseCase
 from app.domain.usecase.user_usecase import UserUseCase
 from app.domain.usecase.stock_usecase import StockUseCase
+from app.domain.usecase.util.security import PasswordHashingPool
 from app.infrastructure.driven_adapter.persistence.config.database import Database
 from app.infrastructure.driven_adapter.persistence.user_repository.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository
@@ -12,12 +13,28 @@ from app.infrastructure.driven_adapter.persistence.user_repository.sqlalchemy_us
 from app.infrastructure.driven_adapter.persistence.stock_repository.sqlalchemy_stock_repository import (
     SQLAlchemyStockRepository
 )
+from app.infrastructure.driven_adapter.persistence.stock_repository.product_search_index import (
+    ProductSearchIndex
+)
+from app.infrastructure.driven_adapter.persistence.stock_repository.count_cache import CountCache
+from app.infrastructure.driven_adapter.persistence.stock_repository.stock_aggregate_writer import (
+    StockAggregateWriter
+)
+from app.infrastructure.driven_adapter.persistence.stock_repository.data_version_tracker import (
+    DataVersionTracker
+)
 from app.infrastructure.driven_adapter.user_adapter.user_data_gateway_impl import (
     UserDataGatewayImpl
 )
 from app.infrastructure.driven_adapter.stock_adapter.stock_data_gateway_impl import (
     StockDataGatewayImpl
 )
+from app.infrastructure.driven_adapter.stock_adapter.cached_stock_data_gateway import (
+    CachedStockDataGateway
+)
+from app.infrastructure.driven_adapter.stock_adapter.catalog_cache import CatalogCache
+from app.infrastructure.driven_adapter.stock_adapter.single_flight import SingleFlight
+from app.infrastructure.entry_point.utils.token_cache import TokenCache
 
 
 class Container(containers.DeclarativeContainer):
@@ -26,17 +43,65 @@ class Container(containers.DeclarativeContainer):
     
     database = providers.Singleton(
         Database,
-        database_url=settings.database_url
+        database_url=settings.database_url,
+        async_database_url=settings.async_database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        sqlite_pragmas=settings.get_sqlite_pragmas()
+    )
+    
+    product_search_index = providers.Singleton(ProductSearchIndex)
+    
+    aggregate_writer = providers.Singleton(StockAggregateWriter)
+    
+    data_version_tracker = providers.Singleton(DataVersionTracker)
+    
+    count_cache = providers.Singleton(
+        CountCache,
+        ttl_seconds=settings.count_cache_ttl_seconds,
+        max_entries=settings.count_cache_max_entries
+    )
+    
+    catalog_cache = providers.Singleton(
+        CatalogCache,
+        ttl_seconds=settings.catalog_cache_ttl_seconds,
+        max_entries=settings.catalog_cache_max_entries
+    )
+    
+    single_flight = providers.Singleton(
+        SingleFlight,
+        enabled=settings.request_coalescing_enabled
+    )
+    
+    token_cache = providers.Singleton(
+        TokenCache,
+        ttl_seconds=settings.token_cache_ttl_seconds,
+        max_entries=settings.token_cache_max_entries
+    )
+    
+    password_pool = providers.Singleton(
+        PasswordHashingPool,
+        max_workers=settings.password_hash_workers,
+        max_queue=settings.password_hash_queue_limit,
+        retry_after_seconds=settings.password_hash_retry_after_seconds
     )
     
     user_repository = providers.Factory(
         SQLAlchemyUserRepository,
-        session_factory=database.provided.session
+        session_factory=database.provided.async_session
     )
     
     stock_repository = providers.Factory(
         SQLAlchemyStockRepository,
-        session_factory=database.provided.session
+        session_factory=database.provided.async_session,
+        loader_strategy=settings.stock_move_loader_strategy,
+        product_search_index=product_search_index,
+        count_cache=count_cache,
+        aggregate_writer=aggregate_writer,
+        data_version_tracker=data_version_tracker
     )
     
     user_gateway = providers.Factory(
@@ -44,14 +109,22 @@ class Container(containers.DeclarativeContainer):
         user_repository=user_repository
     )
     
-    stock_gateway = providers.Factory(
+    stock_data_gateway = providers.Factory(
         StockDataGatewayImpl,
         stock_repository=stock_repository
     )
     
+    stock_gateway = providers.Factory(
+        CachedStockDataGateway,
+        stock_gateway=stock_data_gateway,
+        catalog_cache=catalog_cache,
+        single_flight=single_flight
+    )
+    
     auth_use_case = providers.Factory(
         AuthUseCase,
-        user_gateway=user_gateway
+        user_gateway=user_gateway,
+        password_pool=password_pool
     )
     
     user_use_case = providers.Factory(
@@ -61,5 +134,11 @@ class Container(containers.DeclarativeContainer):
     
     stock_use_case = providers.Factory(
         StockUseCase,
-        stock_gateway=stock_gateway
+        stock_gateway=stock_gateway,
+        bulk_chunk_size=settings.bulk_insert_chunk_size,
+        export_batch_size=settings.export_batch_size,
+        import_chunk_size=settings.import_chunk_size
     )
+
+
+container = Container()
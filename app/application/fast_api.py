@@ -5,6 +5,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.application.settings import settings
 from app.application.logging_config import setup_logging, get_logger
 from app.infrastructure.entry_point.utils.exception_handler import register_exception_handlers
+from app.infrastructure.entry_point.utils.compression import (
+    CompressionMiddleware, BROTLI_AVAILABLE
+)
+from app.infrastructure.entry_point.utils.fast_json import ORJSON_AVAILABLE
 
 
 logger = get_logger(__name__)
@@ -31,8 +35,22 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality
+        )
+    
     register_exception_handlers(app)
     
+    # Both are in requirements.txt; a missing one only slows things down, so say so once
+    if settings.compression_enabled and not BROTLI_AVAILABLE:
+        logger.warning("brotli is not installed: responses are compressed with gzip only")
+    if settings.fast_json_responses and not ORJSON_AVAILABLE:
+        logger.warning("orjson is not installed: fast JSON responses use the stdlib encoder")
+    
     logger.info(f"FastAPI application created: {settings.app_name} v{settings.app_version}")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Debug mode: {settings.debug}")
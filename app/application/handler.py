@@ -4,12 +4,14 @@ from fastapi import FastAPI
 from app.application.container import Container
 from app.infrastructure.entry_point.controller.auth_controller import router as auth_router
 from app.infrastructure.entry_point.controller.stock_controller import router as stock_router
+from app.infrastructure.entry_point.controller.balance_controller import router as balance_router
 
 
 def setup_routes(app: FastAPI, container: Container) -> None:
     
     app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
     app.include_router(stock_router, prefix="/stock-moves", tags=["Stock Moves"])
+    app.include_router(balance_router, prefix="/stock-balances", tags=["Stock Balances"])
     
     @app.get("/", tags=["Health"])
     async def health_check():
@@ -25,3 +27,26 @@ def setup_routes(app: FastAPI, container: Container) -> None:
             "service": "stock-api",
             "version": "1.0.0"
         }
+    
+    @app.get("/health/db", tags=["Health"])
+    async def database_health():
+        return {
+            "status": "healthy",
+            "pool": container.database().pool_stats()
+        }
+    
+    @app.get("/health/cache", tags=["Health"])
+    async def cache_health():
+        return {
+            "status": "healthy",
+            "catalog": container.catalog_cache().stats(),
+            "coalescing": container.single_flight().stats(),
+            "tokens": container.token_cache().stats()
+        }
+    
+    @app.get("/health/auth", tags=["Health"])
+    async def auth_health():
+        return {
+            "status": "healthy",
+            "passwordHashing": container.password_pool().stats()
+        }
@@ -1,5 +1,5 @@
 """Application settings using Pydantic"""
-from typing import List
+from typing import Any, Dict, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -18,6 +18,38 @@ class Settings(BaseSettings):
         default="sqlite:///./stock_api.db",
         alias="DATABASE_URL"
     )
+    async_database_url: Optional[str] = Field(default=None, alias="ASYNC_DATABASE_URL")
+    db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=30.0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    sqlite_journal_mode: str = Field(default="WAL", alias="SQLITE_JOURNAL_MODE")
+    sqlite_synchronous: str = Field(default="NORMAL", alias="SQLITE_SYNCHRONOUS")
+    sqlite_busy_timeout_ms: int = Field(default=5000, alias="SQLITE_BUSY_TIMEOUT_MS")
+    sqlite_cache_size_kib: int = Field(default=65536, alias="SQLITE_CACHE_SIZE_KIB")
+    sqlite_mmap_size: int = Field(default=268435456, alias="SQLITE_MMAP_SIZE")
+    stock_move_loader_strategy: str = Field(
+        default="joined",
+        alias="STOCK_MOVE_LOADER_STRATEGY"
+    )
+    
+    default_count_mode: str = Field(default="exact", alias="DEFAULT_COUNT_MODE")
+    count_cache_ttl_seconds: float = Field(default=30.0, alias="COUNT_CACHE_TTL_SECONDS")
+    count_cache_max_entries: int = Field(default=1024, alias="COUNT_CACHE_MAX_ENTRIES")
+    catalog_cache_ttl_seconds: float = Field(default=60.0, alias="CATALOG_CACHE_TTL_SECONDS")
+    catalog_cache_max_entries: int = Field(default=1024, alias="CATALOG_CACHE_MAX_ENTRIES")
+    request_coalescing_enabled: bool = Field(default=True, alias="REQUEST_COALESCING_ENABLED")
+    bulk_insert_chunk_size: int = Field(default=500, alias="BULK_INSERT_CHUNK_SIZE")
+    export_batch_size: int = Field(default=1000, alias="EXPORT_BATCH_SIZE")
+    import_chunk_size: int = Field(default=2000, alias="IMPORT_CHUNK_SIZE")
+    balance_snapshot_period: str = Field(default="month", alias="BALANCE_SNAPSHOT_PERIOD")
+    
+    compression_enabled: bool = Field(default=True, alias="COMPRESSION_ENABLED")
+    compression_minimum_size: int = Field(default=1024, alias="COMPRESSION_MINIMUM_SIZE")
+    compression_gzip_level: int = Field(default=6, alias="COMPRESSION_GZIP_LEVEL")
+    compression_brotli_quality: int = Field(default=5, alias="COMPRESSION_BROTLI_QUALITY")
+    fast_json_responses: bool = Field(default=False, alias="FAST_JSON_RESPONSES")
     
     secret_key: str = Field(
         default="your-super-secret-key-change-this",
@@ -28,6 +60,14 @@ class Settings(BaseSettings):
         default=30,
         alias="ACCESS_TOKEN_EXPIRE_MINUTES"
     )
+    token_cache_ttl_seconds: float = Field(default=300.0, alias="TOKEN_CACHE_TTL_SECONDS")
+    token_cache_max_entries: int = Field(default=10000, alias="TOKEN_CACHE_MAX_ENTRIES")
+    password_hash_workers: int = Field(default=2, alias="PASSWORD_HASH_WORKERS")
+    password_hash_queue_limit: int = Field(default=32, alias="PASSWORD_HASH_QUEUE_LIMIT")
+    password_hash_retry_after_seconds: int = Field(
+        default=1,
+        alias="PASSWORD_HASH_RETRY_AFTER_SECONDS"
+    )
     
     allowed_origins: str = Field(
         default="http://localhost:3000,http://localhost:5173",
@@ -37,6 +77,15 @@ class Settings(BaseSettings):
     def get_allowed_origins(self) -> List[str]:
         return [origin.strip() for origin in self.allowed_origins.split(",")]
     
+    def get_sqlite_pragmas(self) -> Dict[str, Any]:
+        return {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "busy_timeout": self.sqlite_busy_timeout_ms,
+            "cache_size": -self.sqlite_cache_size_kib,
+            "mmap_size": self.sqlite_mmap_size,
+        }
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,9 +1,15 @@
 """Stock data gateway interface"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from typing import AsyncIterator, List, Optional, Tuple
 
-from app.domain.model.stock import StockMove, Product, Warehouse
-from app.domain.model.pagination import PaginatedResponse
+from app.domain.model.stock import (
+    StockMove, StockMoveBatch, StockBalance, StockMoveRollup, Granularity, Product, Warehouse,
+    BulkCreateResult, StockImportJob, DataResource, DataVersion
+)
+from app.domain.model.pagination import (
+    PaginatedResponse, PageCursor, CountMode, CatalogSort, CatalogCursor
+)
 
 
 class StockDataGateway(ABC):
@@ -12,6 +18,20 @@ class StockDataGateway(ABC):
     async def find_stock_move_by_id(self, stock_move_id: str) -> Optional[StockMove]:
         pass
     
+    @abstractmethod
+    def stream_stock_moves(
+        self,
+        product_filter: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[StockMove]:
+        pass
+    
+    @abstractmethod
+    async def find_stock_moves_by_ids(self, stock_move_ids: List[str]) -> StockMoveBatch:
+        pass
+    
     @abstractmethod
     async def find_all_stock_moves(
         self,
@@ -20,17 +40,89 @@ class StockDataGateway(ABC):
         product_filter: Optional[str] = None,
         warehouse_id: Optional[str] = None,
         move_type: Optional[str] = None,
-    ) -> PaginatedResponse[StockMove]:
+        cursor: Optional[PageCursor] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Optional[List[str]] = None,
+        data_version: Optional[DataVersion] = None,
+    ) -> PaginatedResponse:
         pass
     
     @abstractmethod
     async def update_stock_move(self, stock_move: StockMove) -> StockMove:
         pass
     
+    @abstractmethod
+    async def update_stock_move_reference(
+        self, stock_move_id: str, reference: str
+    ) -> Optional[StockMove]:
+        pass
+    
     @abstractmethod
     async def create_stock_move(self, stock_move: StockMove) -> StockMove:
         pass
     
+    @abstractmethod
+    async def create_stock_moves_bulk(
+        self, stock_moves: List[StockMove], chunk_size: int = 500
+    ) -> BulkCreateResult:
+        pass
+    
+    @abstractmethod
+    async def find_import_job(self, job_id: str) -> Optional[StockImportJob]:
+        pass
+    
+    @abstractmethod
+    async def save_import_job(self, job: StockImportJob) -> StockImportJob:
+        pass
+    
+    @abstractmethod
+    async def import_stock_moves_chunk(
+        self,
+        job_id: str,
+        chunk: List[Tuple[int, StockMove]],
+        rows_processed: int,
+        rejected: int = 0
+    ) -> BulkCreateResult:
+        pass
+    
+    @abstractmethod
+    async def find_stock_balances(
+        self,
+        product_id: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        as_of: Optional[date] = None
+    ) -> List[StockBalance]:
+        pass
+    
+    @abstractmethod
+    async def find_latest_snapshot_date(self) -> Optional[date]:
+        pass
+    
+    @abstractmethod
+    async def find_first_stock_move_date(self) -> Optional[date]:
+        pass
+    
+    @abstractmethod
+    async def rebuild_balance_snapshots(self, boundaries: List[date]) -> int:
+        pass
+    
+    @abstractmethod
+    async def find_stock_move_rollups(
+        self,
+        granularity: Granularity,
+        warehouse_id: Optional[str] = None,
+        product_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        by_product: bool = False
+    ) -> List[StockMoveRollup]:
+        pass
+    
+    @abstractmethod
+    async def find_data_version(self, resources: List[DataResource]) -> DataVersion:
+        pass
+    
     @abstractmethod
     async def find_product_by_id(self, product_id: str) -> Optional[Product]:
         pass
@@ -46,3 +138,33 @@ class StockDataGateway(ABC):
     @abstractmethod
     async def find_all_warehouses(self) -> List[Warehouse]:
         pass
+    
+    @abstractmethod
+    async def find_products_page(
+        self,
+        page_size: int,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[CatalogCursor] = None,
+        data_version: Optional[DataVersion] = None
+    ) -> PaginatedResponse[Product]:
+        pass
+    
+    @abstractmethod
+    async def find_warehouses_page(
+        self,
+        page_size: int,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[CatalogCursor] = None,
+        data_version: Optional[DataVersion] = None
+    ) -> PaginatedResponse[Warehouse]:
+        pass
+    
+    @abstractmethod
+    async def create_product(self, product: Product) -> Product:
+        pass
+    
+    @abstractmethod
+    async def create_warehouse(self, warehouse: Warehouse) -> Warehouse:
+        pass
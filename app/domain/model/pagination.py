@@ -1,17 +1,119 @@
 """Pagination model"""
+import base64
+import binascii
+import json
 from dataclasses import dataclass
-from typing import Generic, List, TypeVar
+from datetime import date
+from enum import Enum
+from typing import Generic, List, Optional, TypeVar
+
+from app.domain.model.util.exceptions import InvalidCursorException
 
 T = TypeVar("T")
 
 
+class CountMode(str, Enum):
+    
+    EXACT = "exact"
+    CACHED = "cached"
+    HAS_MORE = "has_more"
+
+
+@dataclass
+class PageCursor:
+    
+    last_date: date
+    last_id: str
+    page: int
+    
+    def encode(self) -> str:
+        raw = json.dumps(
+            {"d": self.last_date.isoformat(), "i": self.last_id, "p": self.page},
+            separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+    
+    @staticmethod
+    def decode(token: str) -> "PageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            cursor = PageCursor(
+                last_date=date.fromisoformat(raw["d"]),
+                last_id=str(raw["i"]),
+                page=int(raw["p"])
+            )
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise InvalidCursorException()
+        
+        if cursor.page < 1:
+            raise InvalidCursorException()
+        
+        return cursor
+
+
+class CatalogSort(str, Enum):
+    
+    ID = "id"
+    ID_DESC = "-id"
+    NAME = "name"
+    NAME_DESC = "-name"
+    
+    @property
+    def field(self) -> str:
+        return self.value.lstrip("-")
+    
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
+
+
+@dataclass
+class CatalogCursor:
+    
+    sort: CatalogSort
+    last_value: str
+    last_id: str
+    page: int
+    
+    def encode(self) -> str:
+        raw = json.dumps(
+            {"s": self.sort.value, "v": self.last_value, "i": self.last_id, "p": self.page},
+            separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+    
+    @staticmethod
+    def decode(token: str, sort: CatalogSort) -> "CatalogCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            cursor = CatalogCursor(
+                sort=CatalogSort(raw["s"]),
+                last_value=str(raw["v"]),
+                last_id=str(raw["i"]),
+                page=int(raw["p"])
+            )
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise InvalidCursorException()
+        
+        # A cursor only makes sense for the ordering it was issued under
+        if cursor.page < 1 or cursor.sort != sort:
+            raise InvalidCursorException()
+        
+        return cursor
+
+
 @dataclass
 class Pagination:
     
     current_page: int
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int]
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
+    count_mode: CountMode = CountMode.EXACT
+    has_more: bool = False
     
     def to_dict(self) -> dict:
         return {
@@ -19,6 +121,9 @@ class Pagination:
             "pageSize": self.page_size,
             "totalItems": self.total_items,
             "totalPages": self.total_pages,
+            "nextCursor": self.next_cursor,
+            "countMode": self.count_mode.value,
+            "hasMore": self.has_more,
         }
 
 
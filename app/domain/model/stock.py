@@ -1,8 +1,8 @@
 """Stock domain models"""
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 
 class StockMoveType(str, Enum):
@@ -12,6 +12,36 @@ class StockMoveType(str, Enum):
     ADJUST = "ADJUST"
 
 
+class Granularity(str, Enum):
+    
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    
+    def period_start(self, day: date) -> date:
+        if self == Granularity.DAY:
+            return day
+        if self == Granularity.WEEK:
+            return day - timedelta(days=day.weekday())
+        return day.replace(day=1)
+    
+    def period_end(self, day: date) -> date:
+        if self == Granularity.DAY:
+            return day
+        if self == Granularity.WEEK:
+            return day + timedelta(days=6 - day.weekday())
+        next_month = day.replace(day=28) + timedelta(days=4)
+        return next_month - timedelta(days=next_month.day)
+    
+    def boundaries(self, start: date, end: date) -> List[date]:
+        boundaries: List[date] = []
+        boundary = self.period_end(start)
+        while boundary <= end:
+            boundaries.append(boundary)
+            boundary = self.period_end(boundary + timedelta(days=1))
+        return boundaries
+
+
 @dataclass
 class Product:
     
@@ -40,6 +70,10 @@ class Warehouse:
         }
 
 
+# Selectable through GET /stock-moves?fields=, in response order
+STOCK_MOVE_FIELDS = ("id", "date", "product", "warehouse", "type", "quantity", "reference")
+
+
 @dataclass
 class StockMove:
     
@@ -57,10 +91,17 @@ class StockMove:
         self.validate_reference()
     
     def validate_reference(self) -> None:
-        if not self.reference or len(self.reference) < 3 or len(self.reference) > 60:
+        StockMove.check_reference(self.reference)
+    
+    @staticmethod
+    def check_reference(reference: str) -> None:
+        if not reference or len(reference) < 3 or len(reference) > 60:
             from app.domain.model.util.exceptions import InvalidReferenceException
             raise InvalidReferenceException()
     
+    def signed_quantity(self) -> int:
+        return -self.quantity if self.type == StockMoveType.OUT else self.quantity
+    
     def update_reference(self, new_reference: str) -> None:
         self.reference = new_reference
         self.validate_reference()
@@ -75,3 +116,153 @@ class StockMove:
             "quantity": self.quantity,
             "reference": self.reference,
         }
+
+
+@dataclass
+class StockBalance:
+    
+    product_id: str
+    warehouse_id: str
+    quantity_in: int
+    quantity_out: int
+    quantity_adjust: int
+    quantity: int
+    
+    def to_dict(self) -> dict:
+        return {
+            "productId": self.product_id,
+            "warehouseId": self.warehouse_id,
+            "quantityIn": self.quantity_in,
+            "quantityOut": self.quantity_out,
+            "quantityAdjust": self.quantity_adjust,
+            "quantity": self.quantity,
+        }
+
+
+@dataclass
+class StockMoveRollup:
+    
+    bucket: date
+    warehouse_id: str
+    type: StockMoveType
+    move_count: int
+    quantity: int
+    product_id: Optional[str] = None
+    
+    def to_dict(self) -> dict:
+        return {
+            "bucket": self.bucket.isoformat(),
+            "warehouseId": self.warehouse_id,
+            "productId": self.product_id,
+            "type": self.type.value,
+            "moveCount": self.move_count,
+            "quantity": self.quantity,
+        }
+
+
+@dataclass
+class StockMoveBatch:
+    
+    data: List[StockMove]
+    missing_ids: List[str]
+    
+    def to_dict(self) -> dict:
+        return {
+            "data": [stock_move.to_dict() for stock_move in self.data],
+            "missingIds": self.missing_ids,
+        }
+
+
+@dataclass
+class BulkItemError:
+    
+    index: int
+    id: Optional[str]
+    message: str
+    
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "id": self.id,
+            "message": self.message,
+        }
+
+
+@dataclass
+class BulkCreateResult:
+    
+    received: int
+    created_ids: List[str]
+    errors: List[BulkItemError]
+    
+    def to_dict(self) -> dict:
+        return {
+            "received": self.received,
+            "created": len(self.created_ids),
+            "failed": len(self.errors),
+            "errors": [error.to_dict() for error in self.errors],
+        }
+
+
+class ImportStatus(str, Enum):
+    
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class StockImportJob:
+    
+    id: str
+    source: str
+    status: ImportStatus = ImportStatus.RUNNING
+    rows_processed: int = 0
+    created: int = 0
+    failed: int = 0
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "source": self.source,
+            "status": self.status.value,
+            "rowsProcessed": self.rows_processed,
+            "created": self.created,
+            "failed": self.failed,
+            "startedAt": self.started_at.isoformat() if self.started_at else None,
+            "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+@dataclass
+class StockImportResult:
+    
+    job: StockImportJob
+    errors: List[BulkItemError]
+    elapsed_seconds: float
+    
+    @property
+    def rows_per_second(self) -> float:
+        return self.job.rows_processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class DataResource(str, Enum):
+    
+    STOCK_MOVES = "stock_moves"
+    PRODUCTS = "products"
+    WAREHOUSES = "warehouses"
+
+
+@dataclass
+class DataVersion:
+    
+    version: int = 0
+    last_modified: Optional[datetime] = None
+    
+    @property
+    def tag(self) -> str:
+        # The timestamp keeps tags distinct when a database is recreated and versions restart
+        stamp = int(self.last_modified.timestamp() * 1_000_000) if self.last_modified else 0
+        return f"{self.version}-{stamp:x}"
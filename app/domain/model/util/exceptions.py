@@ -50,6 +50,37 @@ class InvalidReferenceException(DomainException):
         super().__init__("Reference must be between 3 and 60 characters")
 
 
+class InvalidCursorException(DomainException):
+    
+    def __init__(self):
+        super().__init__("Invalid or malformed pagination cursor")
+
+
+class ImportJobNotFoundException(DomainException):
+    
+    def __init__(self, job_id: str):
+        super().__init__(f"Import job with ID {job_id} not found")
+
+
+class InvalidImportFileException(DomainException):
+    
+    def __init__(self, message: str = "Unsupported or unreadable import file"):
+        super().__init__(message)
+
+
+class InvalidFieldsException(DomainException):
+    
+    def __init__(self, fields: str):
+        super().__init__(f"Invalid fields selection: {fields}")
+
+
+class ServiceOverloadedException(DomainException):
+    
+    def __init__(self, retry_after: int, message: str = "Service is busy, retry later"):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
 class UnauthorizedException(DomainException):
     
     def __init__(self, message: str = "Unauthorized access"):
@@ -0,0 +1,19 @@
+"""Per-batch identity map so repeated catalog references share one instance"""
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Optional
+
+
+class IdentityMap:
+    
+    def __init__(self) -> None:
+        self._objects: Dict[type, Dict[Hashable, Any]] = defaultdict(dict)
+    
+    def get(self, kind: type, key: Hashable) -> Optional[Any]:
+        return self._objects[kind].get(key)
+    
+    def add(self, kind: type, key: Hashable, instance: Any) -> Any:
+        self._objects[kind][key] = instance
+        return instance
+    
+    def __len__(self) -> int:
+        return sum(len(objects) for objects in self._objects.values())
@@ -1,5 +1,5 @@
 """Authentication use case"""
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from app.domain.gateway.user_data_gateway import UserDataGateway
 from app.domain.model.user import User
@@ -7,7 +7,7 @@ from app.domain.model.util.exceptions import (
     InvalidCredentialsException,
     UserAlreadyExistsException
 )
-from app.domain.usecase.util.security import SecurityService
+from app.domain.usecase.util.security import PasswordHashingPool
 from app.domain.usecase.util.jwt import JWTService
 from app.application.logging_config import get_logger
 
@@ -16,9 +16,9 @@ logger = get_logger(__name__)
 
 class AuthUseCase:
     
-    def __init__(self, user_gateway: UserDataGateway) -> None:
+    def __init__(self, user_gateway: UserDataGateway, password_pool: PasswordHashingPool) -> None:
         self.user_gateway = user_gateway
-        self.security_service = SecurityService()
+        self.password_pool = password_pool
         self.jwt_service = JWTService()
     
     async def login(self, email: str, password: str) -> User:
@@ -30,7 +30,7 @@ class AuthUseCase:
             logger.warning(f"User not found: {email}")
             raise InvalidCredentialsException()
         
-        if not self.security_service.verify_password(password, user.password):
+        if not await self.password_pool.verify_password(password, user.password):
             logger.warning(f"Invalid password for user: {email}")
             raise InvalidCredentialsException()
         
@@ -51,7 +51,7 @@ class AuthUseCase:
             logger.warning(f"User already exists: {email}")
             raise UserAlreadyExistsException(email)
         
-        hashed_password = self.security_service.hash_password(password)
+        hashed_password = await self.password_pool.hash_password(password)
         
         user = User(
             id=user_id,
@@ -68,3 +68,6 @@ class AuthUseCase:
     
     async def validate_token(self, token: str) -> Optional[str]:
         return self.jwt_service.extract_user_id(token)
+    
+    async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+        return self.jwt_service.decode_token(token)
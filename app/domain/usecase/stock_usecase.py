@@ -1,22 +1,44 @@
 """Stock use case"""
-from typing import Optional, List
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional, List, Tuple
+from uuid import uuid4
 
 from app.domain.gateway.stock_data_gateway import StockDataGateway
-from app.domain.model.stock import StockMove, Product, Warehouse
-from app.domain.model.pagination import PaginatedResponse
+from app.domain.model.stock import (
+    StockMove, StockMoveBatch, StockBalance, StockMoveRollup, StockMoveType, Granularity,
+    Product, Warehouse, BulkCreateResult, BulkItemError, StockImportJob, StockImportResult,
+    ImportStatus, DataResource, DataVersion, STOCK_MOVE_FIELDS
+)
+from app.domain.model.pagination import (
+    PaginatedResponse, PageCursor, CountMode, CatalogSort, CatalogCursor
+)
 from app.domain.model.util.exceptions import (
+    DomainException,
     StockMoveNotFoundException,
-    InvalidReferenceException
+    ImportJobNotFoundException,
+    InvalidFieldsException
 )
 from app.application.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+MAX_REPORTED_IMPORT_ERRORS = 100
+
 
 class StockUseCase:
     
-    def __init__(self, stock_gateway: StockDataGateway) -> None:
+    def __init__(
+        self,
+        stock_gateway: StockDataGateway,
+        bulk_chunk_size: int = 500,
+        export_batch_size: int = 1000,
+        import_chunk_size: int = 2000
+    ) -> None:
         self.stock_gateway = stock_gateway
+        self.bulk_chunk_size = bulk_chunk_size
+        self.export_batch_size = export_batch_size
+        self.import_chunk_size = import_chunk_size
     
     async def get_stock_moves(
         self,
@@ -25,7 +47,11 @@ class StockUseCase:
         product_filter: Optional[str] = None,
         warehouse_id: Optional[str] = None,
         move_type: Optional[str] = None,
-    ) -> PaginatedResponse[StockMove]:
+        cursor: Optional[str] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Optional[str] = None,
+        data_version: Optional[DataVersion] = None,
+    ) -> PaginatedResponse:
         logger.info(f"Fetching stock moves - page: {page}, size: {page_size}")
         
         return await self.stock_gateway.find_all_stock_moves(
@@ -33,7 +59,36 @@ class StockUseCase:
             page_size=page_size,
             product_filter=product_filter,
             warehouse_id=warehouse_id,
-            move_type=move_type
+            move_type=move_type,
+            cursor=PageCursor.decode(cursor) if cursor else None,
+            count_mode=count_mode,
+            fields=self._parse_fields(fields) if fields else None,
+            data_version=data_version
+        )
+    
+    @staticmethod
+    def _parse_fields(fields: str) -> List[str]:
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        if not requested or not requested.issubset(STOCK_MOVE_FIELDS):
+            raise InvalidFieldsException(fields)
+        return [field for field in STOCK_MOVE_FIELDS if field in requested]
+    
+    def export_stock_moves(
+        self,
+        product_filter: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+    ) -> AsyncIterator[StockMove]:
+        logger.info(
+            f"Exporting stock moves - product: {product_filter}, warehouse: {warehouse_id}, "
+            f"type: {move_type}"
+        )
+        
+        return self.stock_gateway.stream_stock_moves(
+            product_filter=product_filter,
+            warehouse_id=warehouse_id,
+            move_type=move_type,
+            batch_size=self.export_batch_size
         )
     
     async def get_stock_move_by_id(self, stock_move_id: str) -> StockMove:
@@ -45,27 +100,324 @@ class StockUseCase:
         
         return stock_move
     
+    async def get_stock_moves_by_ids(self, stock_move_ids: List[str]) -> StockMoveBatch:
+        logger.info(f"Fetching stock moves by ids - count: {len(stock_move_ids)}")
+        
+        batch = await self.stock_gateway.find_stock_moves_by_ids(stock_move_ids)
+        
+        if batch.missing_ids:
+            logger.warning(f"Stock moves not found: {len(batch.missing_ids)}")
+        
+        return batch
+    
+    async def create_stock_moves_bulk(self, items: List[Dict[str, Any]]) -> BulkCreateResult:
+        logger.info(f"Bulk creating stock moves - received: {len(items)}")
+        
+        stock_moves: List[StockMove] = []
+        positions: List[int] = []
+        errors: List[BulkItemError] = []
+        
+        for index, item in enumerate(items):
+            try:
+                stock_moves.append(self._build_stock_move(item))
+                positions.append(index)
+            except (DomainException, ValueError) as e:
+                errors.append(BulkItemError(index=index, id=item.get("id"), message=str(e)))
+        
+        result = await self.stock_gateway.create_stock_moves_bulk(
+            stock_moves, chunk_size=self.bulk_chunk_size
+        )
+        
+        errors.extend(
+            BulkItemError(index=positions[error.index], id=error.id, message=error.message)
+            for error in result.errors
+        )
+        errors.sort(key=lambda error: error.index)
+        
+        logger.info(
+            f"Bulk create finished - created: {len(result.created_ids)}, failed: {len(errors)}"
+        )
+        
+        return BulkCreateResult(
+            received=len(items),
+            created_ids=result.created_ids,
+            errors=errors
+        )
+    
+    async def import_stock_moves(
+        self,
+        records: AsyncIterable[Dict[str, Any]],
+        source: str,
+        job_id: Optional[str] = None
+    ) -> StockImportResult:
+        job = await self.stock_gateway.find_import_job(job_id) if job_id else None
+        if job and job.status == ImportStatus.COMPLETED:
+            logger.info(f"Import {job.id} already completed")
+            return StockImportResult(job=job, errors=[], elapsed_seconds=0.0)
+        
+        now = datetime.utcnow()
+        if job is None:
+            job = StockImportJob(
+                id=job_id or str(uuid4()), source=source, started_at=now, updated_at=now
+            )
+            logger.info(f"Starting import {job.id} from {source}")
+        else:
+            logger.info(f"Resuming import {job.id} after row {job.rows_processed}")
+            job.status = ImportStatus.RUNNING
+        job = await self.stock_gateway.save_import_job(job)
+        
+        products, warehouses = await self._reference_maps()
+        resume_from = job.rows_processed
+        started = time.monotonic()
+        errors: List[BulkItemError] = []
+        chunk: List[Tuple[int, StockMove]] = []
+        rejected = 0
+        rows_seen = resume_from
+        
+        try:
+            index = -1
+            async for item in records:
+                index += 1
+                if index < resume_from:
+                    continue
+                rows_seen = index + 1
+                try:
+                    chunk.append((index, self._build_stock_move(
+                        self._resolve_references(item, products, warehouses)
+                    )))
+                except (DomainException, ValueError, KeyError, TypeError) as e:
+                    rejected += 1
+                    self._report_import_error(errors, index, item.get("id"), e)
+                
+                if len(chunk) + rejected >= self.import_chunk_size:
+                    await self._commit_import_chunk(job, chunk, rows_seen, rejected, errors)
+                    self._log_import_progress(job, resume_from, started)
+                    chunk, rejected = [], 0
+            
+            if rows_seen > job.rows_processed:
+                await self._commit_import_chunk(job, chunk, rows_seen, rejected, errors)
+            job.status = ImportStatus.COMPLETED
+        except Exception:
+            job.status = ImportStatus.FAILED
+            logger.error(f"Import {job.id} failed after row {job.rows_processed}")
+            raise
+        finally:
+            job.updated_at = datetime.utcnow()
+            job = await self.stock_gateway.save_import_job(job)
+        
+        self._log_import_progress(job, resume_from, started)
+        errors.sort(key=lambda error: error.index)
+        return StockImportResult(
+            job=job, errors=errors, elapsed_seconds=time.monotonic() - started
+        )
+    
+    async def get_import_job(self, job_id: str) -> StockImportJob:
+        job = await self.stock_gateway.find_import_job(job_id)
+        
+        if not job:
+            logger.warning(f"Import job not found: {job_id}")
+            raise ImportJobNotFoundException(job_id)
+        
+        return job
+    
+    async def _reference_maps(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        products: Dict[str, str] = {}
+        for product in await self.stock_gateway.find_all_products():
+            products[product.id] = product.id
+            if product.sku:
+                products.setdefault(product.sku, product.id)
+        
+        warehouses: Dict[str, str] = {}
+        for warehouse in await self.stock_gateway.find_all_warehouses():
+            warehouses[warehouse.id] = warehouse.id
+            warehouses.setdefault(warehouse.name, warehouse.id)
+        
+        return products, warehouses
+    
+    @staticmethod
+    def _resolve_references(
+        item: Dict[str, Any], products: Dict[str, str], warehouses: Dict[str, str]
+    ) -> Dict[str, Any]:
+        if item.get("error"):
+            raise ValueError(item["error"])
+        
+        product_id = products.get(item.get("product_id"))
+        if product_id is None:
+            raise ValueError(f"Product {item.get('product_id')} not found")
+        warehouse_id = warehouses.get(item.get("warehouse_id"))
+        if warehouse_id is None:
+            raise ValueError(f"Warehouse {item.get('warehouse_id')} not found")
+        
+        return {**item, "product_id": product_id, "warehouse_id": warehouse_id}
+    
+    async def _commit_import_chunk(
+        self,
+        job: StockImportJob,
+        chunk: List[Tuple[int, StockMove]],
+        rows_processed: int,
+        rejected: int,
+        errors: List[BulkItemError]
+    ) -> None:
+        result = await self.stock_gateway.import_stock_moves_chunk(
+            job.id, chunk, rows_processed, rejected
+        )
+        for error in result.errors:
+            self._report_import_error(errors, error.index, error.id, error.message)
+        
+        job.rows_processed = rows_processed
+        job.created += len(result.created_ids)
+        job.failed += rejected + len(result.errors)
+    
+    @staticmethod
+    def _report_import_error(
+        errors: List[BulkItemError], index: int, stock_move_id: Optional[str], error: Any
+    ) -> None:
+        if len(errors) < MAX_REPORTED_IMPORT_ERRORS:
+            errors.append(BulkItemError(index=index, id=stock_move_id, message=str(error)))
+    
+    @staticmethod
+    def _log_import_progress(job: StockImportJob, resume_from: int, started: float) -> None:
+        elapsed = time.monotonic() - started
+        rate = (job.rows_processed - resume_from) / elapsed if elapsed else 0.0
+        logger.info(
+            f"Import {job.id}: {job.rows_processed} rows, created: {job.created}, "
+            f"failed: {job.failed}, {rate:.0f} rows/s"
+        )
+    
+    @staticmethod
+    def _build_stock_move(item: Dict[str, Any]) -> StockMove:
+        move_date = item["date"]
+        if isinstance(move_date, str):
+            move_date = date.fromisoformat(move_date)
+        
+        return StockMove(
+            id=item["id"],
+            date=move_date,
+            product=Product(id=item["product_id"], name=""),
+            warehouse=Warehouse(id=item["warehouse_id"], name=""),
+            type=StockMoveType(item["type"]),
+            quantity=int(item["quantity"]),
+            reference=item["reference"]
+        )
+    
     async def update_stock_move_reference(
         self, stock_move_id: str, new_reference: str
     ) -> StockMove:
         logger.info(f"Updating reference for stock move: {stock_move_id}")
         
-        stock_move = await self.get_stock_move_by_id(stock_move_id)
+        StockMove.check_reference(new_reference)
         
-        try:
-            stock_move.update_reference(new_reference)
-        except ValueError:
-            raise InvalidReferenceException()
+        updated = await self.stock_gateway.update_stock_move_reference(
+            stock_move_id, new_reference
+        )
+        
+        if not updated:
+            logger.warning(f"Stock move not found: {stock_move_id}")
+            raise StockMoveNotFoundException(stock_move_id)
         
-        updated = await self.stock_gateway.update_stock_move(stock_move)
         logger.info(f"Stock move reference updated: {stock_move_id}")
         
         return updated
     
-    async def get_all_products(self) -> List[Product]:
-        logger.info("Fetching all products")
-        return await self.stock_gateway.find_all_products()
+    async def get_stock_balances(
+        self,
+        product_id: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        as_of: Optional[date] = None
+    ) -> List[StockBalance]:
+        logger.info(
+            f"Fetching stock balances - product: {product_id}, warehouse: {warehouse_id}, "
+            f"as of: {as_of}"
+        )
+        return await self.stock_gateway.find_stock_balances(product_id, warehouse_id, as_of)
+    
+    async def get_stock_move_rollups(
+        self,
+        granularity: Granularity,
+        warehouse_id: Optional[str] = None,
+        product_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        by_product: bool = False
+    ) -> List[StockMoveRollup]:
+        logger.info(
+            f"Fetching {granularity.value} rollups - warehouse: {warehouse_id}, "
+            f"product: {product_id}, type: {move_type}, from: {date_from}, to: {date_to}"
+        )
+        
+        return await self.stock_gateway.find_stock_move_rollups(
+            granularity=granularity,
+            warehouse_id=warehouse_id,
+            product_id=product_id,
+            move_type=move_type,
+            date_from=date_from,
+            date_to=date_to,
+            by_product=by_product
+        )
+    
+    async def rebuild_balance_snapshots(
+        self,
+        period: Granularity,
+        since: Optional[date] = None,
+        until: Optional[date] = None
+    ) -> List[date]:
+        until = until or date.today() - timedelta(days=1)
+        if since is None:
+            latest = await self.stock_gateway.find_latest_snapshot_date()
+            since = latest + timedelta(days=1) if latest else (
+                await self.stock_gateway.find_first_stock_move_date()
+            )
+        if since is None:
+            logger.info("No stock moves to snapshot")
+            return []
+        
+        boundaries = period.boundaries(since, until)
+        logger.info(
+            f"Rebuilding {period.value} balance snapshots from {since} to {until}: "
+            f"{len(boundaries)} boundaries"
+        )
+        
+        written = await self.stock_gateway.rebuild_balance_snapshots(boundaries)
+        logger.info(f"Balance snapshots rebuilt - rows: {written}")
+        
+        return boundaries
+    
+    async def get_data_version(self, resources: List[DataResource]) -> DataVersion:
+        return await self.stock_gateway.find_data_version(resources)
     
-    async def get_all_warehouses(self) -> List[Warehouse]:
-        logger.info("Fetching all warehouses")
-        return await self.stock_gateway.find_all_warehouses()
+    async def get_products(
+        self,
+        page_size: int = 100,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[str] = None,
+        data_version: Optional[DataVersion] = None
+    ) -> PaginatedResponse[Product]:
+        logger.info(f"Fetching products - size: {page_size}, prefix: {prefix}, sort: {sort.value}")
+        return await self.stock_gateway.find_products_page(
+            page_size=page_size,
+            prefix=prefix,
+            sort=sort,
+            cursor=CatalogCursor.decode(cursor, sort) if cursor else None,
+            data_version=data_version
+        )
+    
+    async def get_warehouses(
+        self,
+        page_size: int = 100,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[str] = None,
+        data_version: Optional[DataVersion] = None
+    ) -> PaginatedResponse[Warehouse]:
+        logger.info(
+            f"Fetching warehouses - size: {page_size}, prefix: {prefix}, sort: {sort.value}"
+        )
+        return await self.stock_gateway.find_warehouses_page(
+            page_size=page_size,
+            prefix=prefix,
+            sort=sort,
+            cursor=CatalogCursor.decode(cursor, sort) if cursor else None,
+            data_version=data_version
+        )
@@ -1,6 +1,13 @@
 """Security utilities - Password hashing and verification"""
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
 from passlib.context import CryptContext
 
+from app.domain.model.util.exceptions import ServiceOverloadedException
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -13,3 +20,73 @@ class SecurityService:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHashingPool:
+    """Run bcrypt on a bounded thread pool so hashing never blocks the event loop"""
+    
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue: int = 32,
+        retry_after_seconds: int = 1
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after_seconds = retry_after_seconds
+        # bcrypt releases the GIL while hashing, so threads give real off-loop work
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+        self.peak_queued = 0
+        self.completed = 0
+        self.rejected = 0
+    
+    async def hash_password(self, password: str) -> str:
+        return await self._submit(SecurityService.hash_password, password)
+    
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(SecurityService.verify_password, plain_password, hashed_password)
+    
+    async def _submit(self, work: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self.pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise ServiceOverloadedException(self.retry_after_seconds)
+            self.pending += 1
+            self.peak_queued = max(self.peak_queued, self.pending - self.max_workers)
+        
+        future = self._executor.submit(self._run, work, args)
+        # Counted down when the work ends, even if the awaiting request was cancelled
+        future.add_done_callback(self._finished)
+        return await asyncio.wrap_future(future)
+    
+    def _run(self, work: Callable[..., Any], args: tuple) -> Any:
+        with self._lock:
+            self.running += 1
+        try:
+            return work(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+    
+    def _finished(self, future: Future) -> None:
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+    
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "maxWorkers": self.max_workers,
+                "maxQueue": self.max_queue,
+                "running": self.running,
+                "queued": self.pending - self.running,
+                "peakQueued": self.peak_queued,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
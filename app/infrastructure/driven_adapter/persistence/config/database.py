@@ -1,8 +1,11 @@
-from typing import Callable
-from contextlib import contextmanager
-from sqlalchemy import create_engine
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+from contextlib import contextmanager, asynccontextmanager
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.application.logging_config import get_logger
 
@@ -10,23 +13,108 @@ logger = get_logger(__name__)
 
 Base = declarative_base()
 
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if url.get_driver_name() in ASYNC_DRIVERS.values():
+        return database_url
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend: {backend}")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+def is_memory_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
 
 class Database:
     
-    def __init__(self, database_url: str) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        async_database_url: Optional[str] = None,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        sqlite_pragmas: Optional[Dict[str, Any]] = None
+    ) -> None:
         self.database_url = database_url
+        self.async_database_url = async_database_url or to_async_url(database_url)
+        self.sqlite_pragmas = sqlite_pragmas or {}
+        connect_args = {"check_same_thread": False} if "sqlite" in database_url else {}
+        engine_args: Dict[str, Any] = {"pool_pre_ping": pool_pre_ping, "pool_recycle": pool_recycle}
+        queue_pool = not is_memory_sqlite(database_url)
+        if queue_pool:
+            engine_args.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout
+            )
         self.engine = create_engine(
             database_url,
-            connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
-            echo=False
+            connect_args=connect_args,
+            echo=False,
+            **({"poolclass": QueuePool} if queue_pool else {}),
+            **engine_args
         )
         self._session_factory = sessionmaker(
             autocommit=False,
             autoflush=False,
             bind=self.engine
         )
+        self.async_engine = create_async_engine(
+            self.async_database_url,
+            connect_args=connect_args,
+            echo=False,
+            **({"poolclass": AsyncAdaptedQueuePool} if queue_pool else {}),
+            **engine_args
+        )
+        if self.engine.dialect.name == "sqlite" and self.sqlite_pragmas:
+            event.listen(self.engine, "connect", self._apply_sqlite_pragmas)
+            event.listen(self.async_engine.sync_engine, "connect", self._apply_sqlite_pragmas)
+        self._async_session_factory = async_sessionmaker(
+            bind=self.async_engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
         logger.info(f"Database initialized: {database_url}")
     
+    def _apply_sqlite_pragmas(self, dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.sqlite_pragmas.items():
+                if value is not None:
+                    cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+    
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "async": self._describe_pool(self.async_engine.pool),
+            "sync": self._describe_pool(self.engine.pool),
+        }
+    
+    @staticmethod
+    def _describe_pool(pool) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"class": type(pool).__name__, "status": pool.status()}
+        for metric in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, metric, None)
+            if callable(method):
+                stats[metric] = method()
+        return stats
+    
     def create_database(self) -> None:
         Base.metadata.create_all(bind=self.engine)
         logger.info("Database tables created")
@@ -45,3 +133,22 @@ class Database:
     
     def get_session(self) -> Session:
         return self._session_factory()
+    
+    @asynccontextmanager
+    async def async_session(self) -> AsyncIterator[AsyncSession]:
+        session: AsyncSession = self._async_session_factory()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+    
+    def get_async_session(self) -> AsyncSession:
+        return self._async_session_factory()
+    
+    async def dispose(self) -> None:
+        await self.async_engine.dispose()
+        self.engine.dispose()
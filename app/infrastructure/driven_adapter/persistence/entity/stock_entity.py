@@ -1,12 +1,18 @@
-from sqlalchemy import Column, String, Integer, Date, Enum as SQLEnum, ForeignKey
+from sqlalchemy import (
+    Column, String, Integer, Date, DateTime, Enum as SQLEnum, ForeignKey, Index, DDL, event,
+    select, insert, func
+)
 from sqlalchemy.orm import relationship
 from app.infrastructure.driven_adapter.persistence.config.database import Base
-from app.domain.model.stock import StockMoveType
+from app.domain.model.stock import StockMoveType, Granularity
 
 
 class ProductEntity(Base):
     
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_name_id", "name", "id"),
+    )
     
     id = Column(String, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -18,9 +24,51 @@ class ProductEntity(Base):
         return f"<ProductEntity(id={self.id}, name={self.name})>"
 
 
+# Case-insensitive prefix filters range-scan these instead of running LIKE over the catalog
+Index("ix_products_lower_name", func.lower(ProductEntity.name))
+Index("ix_products_lower_sku", func.lower(ProductEntity.sku))
+
+PRODUCT_SEARCH_TABLE = "products_search"
+
+# Rows are matched on product_id: products has a String primary key, so its implicit
+# rowid is not stable and VACUUM may renumber it
+SQLITE_PRODUCT_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {PRODUCT_SEARCH_TABLE} "
+    "USING fts5(product_id UNINDEXED, name, sku, tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {PRODUCT_SEARCH_TABLE}_ai AFTER INSERT ON products BEGIN "
+    f"INSERT INTO {PRODUCT_SEARCH_TABLE}(product_id, name, sku) "
+    "VALUES (new.id, new.name, coalesce(new.sku, '')); END",
+    f"CREATE TRIGGER IF NOT EXISTS {PRODUCT_SEARCH_TABLE}_au AFTER UPDATE ON products BEGIN "
+    f"DELETE FROM {PRODUCT_SEARCH_TABLE} WHERE product_id = old.id; "
+    f"INSERT INTO {PRODUCT_SEARCH_TABLE}(product_id, name, sku) "
+    "VALUES (new.id, new.name, coalesce(new.sku, '')); END",
+    f"CREATE TRIGGER IF NOT EXISTS {PRODUCT_SEARCH_TABLE}_ad AFTER DELETE ON products BEGIN "
+    f"DELETE FROM {PRODUCT_SEARCH_TABLE} WHERE product_id = old.id; END",
+]
+
+POSTGRESQL_PRODUCT_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_products_name_trgm ON products USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_products_sku_trgm ON products USING gin (sku gin_trgm_ops)",
+]
+
+for statement in SQLITE_PRODUCT_SEARCH_DDL:
+    event.listen(
+        ProductEntity.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+
+for statement in POSTGRESQL_PRODUCT_SEARCH_DDL:
+    event.listen(
+        ProductEntity.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+
+
 class WarehouseEntity(Base):
     
     __tablename__ = "warehouses"
+    __table_args__ = (
+        Index("ix_warehouses_name_id", "name", "id"),
+    )
     
     id = Column(String, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -31,9 +79,19 @@ class WarehouseEntity(Base):
         return f"<WarehouseEntity(id={self.id}, name={self.name})>"
 
 
+Index("ix_warehouses_lower_name", func.lower(WarehouseEntity.name))
+
+
 class StockMoveEntity(Base):
     
     __tablename__ = "stock_moves"
+    __table_args__ = (
+        Index("ix_stock_moves_date_id", "date", "id"),
+        Index("ix_stock_moves_warehouse_date", "warehouse_id", "date", "id"),
+        Index("ix_stock_moves_type_date", "type", "date", "id"),
+        Index("ix_stock_moves_warehouse_type_date", "warehouse_id", "type", "date", "id"),
+        Index("ix_stock_moves_product_date", "product_id", "date", "id"),
+    )
     
     id = Column(String, primary_key=True, index=True)
     date = Column(Date, nullable=False)
@@ -48,3 +106,177 @@ class StockMoveEntity(Base):
     
     def __repr__(self) -> str:
         return f"<StockMoveEntity(id={self.id}, type={self.type}, quantity={self.quantity})>"
+
+
+class StockBalanceEntity(Base):
+    
+    __tablename__ = "stock_balances"
+    __table_args__ = (
+        Index("ix_stock_balances_warehouse_product", "warehouse_id", "product_id"),
+    )
+    
+    product_id = Column(String, ForeignKey("products.id"), primary_key=True)
+    warehouse_id = Column(String, ForeignKey("warehouses.id"), primary_key=True)
+    quantity_in = Column(Integer, nullable=False, default=0)
+    quantity_out = Column(Integer, nullable=False, default=0)
+    quantity_adjust = Column(Integer, nullable=False, default=0)
+    quantity = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self) -> str:
+        return (
+            f"<StockBalanceEntity(product_id={self.product_id}, "
+            f"warehouse_id={self.warehouse_id}, quantity={self.quantity})>"
+        )
+
+
+class StockBalanceSnapshotEntity(Base):
+    
+    __tablename__ = "stock_balance_snapshots"
+    __table_args__ = (
+        Index(
+            "ix_stock_balance_snapshots_product_warehouse",
+            "product_id", "warehouse_id", "snapshot_date"
+        ),
+    )
+    
+    snapshot_date = Column(Date, primary_key=True)
+    product_id = Column(String, ForeignKey("products.id"), primary_key=True)
+    warehouse_id = Column(String, ForeignKey("warehouses.id"), primary_key=True)
+    quantity_in = Column(Integer, nullable=False, default=0)
+    quantity_out = Column(Integer, nullable=False, default=0)
+    quantity_adjust = Column(Integer, nullable=False, default=0)
+    quantity = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self) -> str:
+        return (
+            f"<StockBalanceSnapshotEntity(snapshot_date={self.snapshot_date}, "
+            f"product_id={self.product_id}, warehouse_id={self.warehouse_id}, "
+            f"quantity={self.quantity})>"
+        )
+
+
+class StockMoveRollupEntity(Base):
+    
+    __tablename__ = "stock_move_rollups"
+    
+    granularity = Column(String, primary_key=True)
+    bucket = Column(Date, primary_key=True)
+    warehouse_id = Column(String, ForeignKey("warehouses.id"), primary_key=True)
+    product_id = Column(String, ForeignKey("products.id"), primary_key=True)
+    type = Column(SQLEnum(StockMoveType), primary_key=True)
+    move_count = Column(Integer, nullable=False, default=0)
+    quantity = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self) -> str:
+        return (
+            f"<StockMoveRollupEntity(granularity={self.granularity}, bucket={self.bucket}, "
+            f"warehouse_id={self.warehouse_id}, type={self.type}, quantity={self.quantity})>"
+        )
+
+
+class StockImportJobEntity(Base):
+    
+    __tablename__ = "stock_import_jobs"
+    
+    id = Column(String, primary_key=True)
+    source = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    rows_processed = Column(Integer, nullable=False, default=0)
+    created = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    
+    def __repr__(self) -> str:
+        return (
+            f"<StockImportJobEntity(id={self.id}, status={self.status}, "
+            f"rows_processed={self.rows_processed})>"
+        )
+
+
+class DataVersionEntity(Base):
+    
+    __tablename__ = "data_versions"
+    
+    resource = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<DataVersionEntity(resource={self.resource}, version={self.version})>"
+
+
+STOCK_BALANCE_REBUILD_SQL = [
+    "DELETE FROM stock_balances",
+    "INSERT INTO stock_balances "
+    "(product_id, warehouse_id, quantity_in, quantity_out, quantity_adjust, quantity) "
+    "SELECT product_id, warehouse_id, "
+    "SUM(CASE WHEN type = 'IN' THEN quantity ELSE 0 END), "
+    "SUM(CASE WHEN type = 'OUT' THEN quantity ELSE 0 END), "
+    "SUM(CASE WHEN type = 'ADJUST' THEN quantity ELSE 0 END), "
+    "SUM(CASE WHEN type = 'OUT' THEN -quantity ELSE quantity END) "
+    "FROM stock_moves GROUP BY product_id, warehouse_id",
+]
+
+
+def rebuild_stock_move_rollups(connection) -> None:
+    daily = connection.execute(
+        select(
+            StockMoveEntity.date,
+            StockMoveEntity.warehouse_id,
+            StockMoveEntity.product_id,
+            StockMoveEntity.type,
+            func.count(),
+            func.sum(StockMoveEntity.quantity)
+        ).group_by(
+            StockMoveEntity.date,
+            StockMoveEntity.warehouse_id,
+            StockMoveEntity.product_id,
+            StockMoveEntity.type
+        )
+    )
+    
+    totals = {}
+    for day, warehouse_id, product_id, move_type, move_count, quantity in daily:
+        for granularity in Granularity:
+            bucket = granularity.period_start(day)
+            key = (granularity.value, bucket, warehouse_id, product_id, move_type)
+            total = totals.setdefault(key, [0, 0])
+            total[0] += move_count
+            total[1] += quantity
+    
+    connection.execute(StockMoveRollupEntity.__table__.delete())
+    if totals:
+        connection.execute(insert(StockMoveRollupEntity), [
+            {
+                "granularity": granularity,
+                "bucket": bucket,
+                "warehouse_id": warehouse_id,
+                "product_id": product_id,
+                "type": move_type,
+                "move_count": move_count,
+                "quantity": quantity,
+            }
+            for (granularity, bucket, warehouse_id, product_id, move_type), (move_count, quantity)
+            in totals.items()
+        ])
+
+
+@event.listens_for(StockBalanceEntity.__table__, "after_create")
+def _mark_stock_balances_created(target, connection, **kw) -> None:
+    connection.info["stock_balances_created"] = True
+
+
+@event.listens_for(StockMoveRollupEntity.__table__, "after_create")
+def _mark_stock_move_rollups_created(target, connection, **kw) -> None:
+    connection.info["stock_move_rollups_created"] = True
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _backfill_aggregates(target, connection, **kw) -> None:
+    # stock_moves may be created after the aggregate tables, so backfill once every table exists
+    if connection.info.pop("stock_balances_created", False):
+        for statement in STOCK_BALANCE_REBUILD_SQL:
+            connection.exec_driver_sql(statement)
+    if connection.info.pop("stock_move_rollups_created", False):
+        rebuild_stock_move_rollups(connection)
@@ -0,0 +1,30 @@
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class CountCache:
+    
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 1024) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[int, float]] = {}
+    
+    def get(self, key: Hashable) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        count, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return count
+    
+    def set(self, key: Hashable, count: int) -> None:
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (count, time.monotonic() + self.ttl_seconds)
+    
+    def invalidate(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Iterable
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.driven_adapter.persistence.entity.stock_entity import DataVersionEntity
+from app.infrastructure.driven_adapter.persistence.stock_repository.stock_aggregate_writer import (
+    UPSERT_INSERTS
+)
+from app.domain.model.stock import DataResource, DataVersion
+
+
+class DataVersionTracker:
+    
+    async def touch(self, session: AsyncSession, *resources: DataResource) -> None:
+        # Runs inside the writer's transaction so the version moves only if the write commits
+        now = datetime.utcnow()
+        rows = [
+            {"resource": resource.value, "version": 1, "updated_at": now}
+            for resource in resources
+        ]
+        
+        upsert_insert = UPSERT_INSERTS.get(session.get_bind().dialect.name)
+        if upsert_insert:
+            table = DataVersionEntity.__table__
+            statement = upsert_insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.resource],
+                set_={
+                    "version": table.c.version + 1,
+                    "updated_at": statement.excluded.updated_at,
+                }
+            )
+            await session.execute(statement, rows)
+            return
+        
+        for row in rows:
+            result = await session.execute(
+                select(DataVersionEntity).where(
+                    DataVersionEntity.resource == row["resource"]
+                ).with_for_update()
+            )
+            entity = result.scalars().first()
+            if entity is None:
+                session.add(DataVersionEntity(**row))
+                continue
+            entity.version += 1
+            entity.updated_at = now
+        await session.flush()
+    
+    @staticmethod
+    async def find(session: AsyncSession, resources: Iterable[DataResource]) -> DataVersion:
+        # Versions only grow, so their sum changes whenever any of the resources does
+        result = await session.execute(
+            select(
+                func.coalesce(func.sum(DataVersionEntity.version), 0),
+                func.max(DataVersionEntity.updated_at)
+            ).where(DataVersionEntity.resource.in_([resource.value for resource in resources]))
+        )
+        version, last_modified = result.one()
+        return DataVersion(version=version, last_modified=last_modified)
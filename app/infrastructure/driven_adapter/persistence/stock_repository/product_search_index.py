@@ -0,0 +1,49 @@
+from typing import Dict, List
+from sqlalchemy import inspect, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.driven_adapter.persistence.entity.stock_entity import (
+    ProductEntity, PRODUCT_SEARCH_TABLE
+)
+
+MIN_TRIGRAM_LENGTH = 3
+
+
+class ProductSearchIndex:
+    
+    def __init__(self) -> None:
+        self._fts_available: Dict[str, bool] = {}
+    
+    async def _use_fts(self, session: AsyncSession, term: str) -> bool:
+        bind = session.get_bind()
+        if bind.dialect.name != "sqlite" or len(term) < MIN_TRIGRAM_LENGTH:
+            return False
+        
+        key = str(bind.url)
+        if key not in self._fts_available:
+            connection = await session.connection()
+            self._fts_available[key] = await connection.run_sync(
+                lambda sync_connection: inspect(sync_connection).has_table(PRODUCT_SEARCH_TABLE)
+            )
+        return self._fts_available[key]
+    
+    async def find_product_ids(self, session: AsyncSession, term: str) -> List[str]:
+        if await self._use_fts(session, term):
+            phrase = '"' + term.replace('"', '""') + '"'
+            result = await session.execute(
+                text(
+                    f"SELECT product_id FROM {PRODUCT_SEARCH_TABLE} "
+                    f"WHERE {PRODUCT_SEARCH_TABLE} MATCH :phrase"
+                ),
+                {"phrase": phrase}
+            )
+        else:
+            result = await session.execute(
+                select(ProductEntity.id).where(
+                    or_(
+                        ProductEntity.name.ilike(f"%{term}%"),
+                        ProductEntity.sku.ilike(f"%{term}%")
+                    )
+                )
+            )
+        return list(result.scalars().all())
@@ -1,28 +1,236 @@
-from typing import Optional, List, Callable
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from datetime import date, datetime
+from typing import Optional, List, AsyncIterator, Callable, Set, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload, selectinload
+from sqlalchemy import (
+    select, insert, update, delete, or_, and_, func, case, literal, literal_column, union_all
+)
+from sqlalchemy.exc import IntegrityError
 from math import ceil
 
 from app.infrastructure.driven_adapter.persistence.entity.stock_entity import (
-    StockMoveEntity, ProductEntity, WarehouseEntity
+    StockMoveEntity, ProductEntity, WarehouseEntity, StockBalanceEntity,
+    StockBalanceSnapshotEntity, StockMoveRollupEntity, StockImportJobEntity
 )
 from app.infrastructure.driven_adapter.persistence.stock_repository.stock_mapper import StockMapper
-from app.domain.model.stock import StockMove, Product, Warehouse
-from app.domain.model.pagination import PaginatedResponse, Pagination
+from app.infrastructure.driven_adapter.persistence.stock_repository.product_search_index import (
+    ProductSearchIndex
+)
+from app.infrastructure.driven_adapter.persistence.stock_repository.count_cache import CountCache
+from app.infrastructure.driven_adapter.persistence.stock_repository.stock_aggregate_writer import (
+    StockAggregateWriter
+)
+from app.infrastructure.driven_adapter.persistence.stock_repository.data_version_tracker import (
+    DataVersionTracker
+)
+from app.domain.model.stock import (
+    StockMove, StockMoveBatch, StockBalance, StockMoveRollup, StockMoveType, Granularity,
+    StockImportJob, Product, Warehouse, BulkCreateResult, BulkItemError, DataResource,
+    DataVersion
+)
+from app.domain.model.pagination import (
+    PaginatedResponse, Pagination, PageCursor, CountMode, CatalogSort, CatalogCursor
+)
+from app.domain.model.util.identity_map import IdentityMap
+
+LOADER_STRATEGIES = {
+    "joined": joinedload,
+    "selectin": selectinload,
+}
+
+# Counts change with the moves and, through the product filter, with the products
+COUNT_RESOURCES = [DataResource.STOCK_MOVES, DataResource.PRODUCTS]
+
+# Every string that starts with a prefix sorts before the prefix followed by this code point
+PREFIX_UPPER_BOUND = "\U0010ffff"
 
 
 class SQLAlchemyStockRepository:
     
-    def __init__(self, session_factory: Callable[..., Session]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[..., AsyncSession],
+        loader_strategy: str = "joined",
+        product_search_index: Optional[ProductSearchIndex] = None,
+        count_cache: Optional[CountCache] = None,
+        aggregate_writer: Optional[StockAggregateWriter] = None,
+        data_version_tracker: Optional[DataVersionTracker] = None
+    ) -> None:
+        if loader_strategy not in LOADER_STRATEGIES:
+            raise ValueError(f"Unsupported loader strategy: {loader_strategy}")
         self.session_factory = session_factory
+        self.loader_strategy = loader_strategy
+        self.product_search_index = product_search_index or ProductSearchIndex()
+        self.count_cache = count_cache or CountCache()
+        self.aggregate_writer = aggregate_writer or StockAggregateWriter()
+        self.data_version_tracker = data_version_tracker or DataVersionTracker()
     
-    async def find_stock_move_by_id(self, stock_move_id: str) -> Optional[StockMove]:
-        with self.session_factory() as session:
-            entity = session.query(StockMoveEntity).filter(
+    def _stock_move_load_options(self) -> list:
+        loader = LOADER_STRATEGIES[self.loader_strategy]
+        return [
+            loader(StockMoveEntity.product),
+            loader(StockMoveEntity.warehouse),
+        ]
+    
+    async def _load_stock_move(
+        self, session: AsyncSession, stock_move_id: str
+    ) -> Optional[StockMoveEntity]:
+        result = await session.execute(
+            select(StockMoveEntity).options(
+                *self._stock_move_load_options()
+            ).where(
                 StockMoveEntity.id == stock_move_id
-            ).first()
+            ).execution_options(populate_existing=True)
+        )
+        return result.scalars().first()
+    
+    @staticmethod
+    def _stock_move_returning_columns() -> list:
+        # SQLite drops table names from everything inside RETURNING, subqueries included, so
+        # the correlation is spelled out against aliased catalog tables
+        product = aliased(ProductEntity, name="returning_product")
+        warehouse = aliased(WarehouseEntity, name="returning_warehouse")
+        product_key = literal_column("returning_product.id") == literal_column(
+            f"{StockMoveEntity.__tablename__}.product_id"
+        )
+        warehouse_key = literal_column("returning_warehouse.id") == literal_column(
+            f"{StockMoveEntity.__tablename__}.warehouse_id"
+        )
+        return [
+            StockMoveEntity.id,
+            StockMoveEntity.date,
+            StockMoveEntity.product_id,
+            StockMoveEntity.warehouse_id,
+            StockMoveEntity.type,
+            StockMoveEntity.quantity,
+            StockMoveEntity.reference,
+            select(product.name).where(product_key).scalar_subquery().label("product_name"),
+            select(product.sku).where(product_key).scalar_subquery().label("product_sku"),
+            select(warehouse.name).where(warehouse_key).scalar_subquery().label("warehouse_name"),
+        ]
+    
+    async def find_stock_move_by_id(self, stock_move_id: str) -> Optional[StockMove]:
+        async with self.session_factory() as session:
+            entity = await self._load_stock_move(session, stock_move_id)
             return StockMapper.stock_move_to_domain(entity) if entity else None
     
+    async def find_stock_moves_by_ids(self, stock_move_ids: List[str]) -> StockMoveBatch:
+        requested_ids = list(dict.fromkeys(stock_move_ids))
+        if not requested_ids:
+            return StockMoveBatch(data=[], missing_ids=[])
+        
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(StockMoveEntity).options(
+                    *self._stock_move_load_options()
+                ).where(StockMoveEntity.id.in_(requested_ids))
+            )
+            entities = {entity.id: entity for entity in result.scalars().all()}
+            identity_map = IdentityMap()
+            
+            return StockMoveBatch(
+                data=[
+                    StockMapper.stock_move_to_domain(entities[stock_move_id], identity_map)
+                    for stock_move_id in requested_ids if stock_move_id in entities
+                ],
+                missing_ids=[
+                    stock_move_id for stock_move_id in requested_ids
+                    if stock_move_id not in entities
+                ]
+            )
+    
+    @staticmethod
+    def _stock_move_projection(fields: List[str]):
+        # id and date are always read: they drive the ordering and the next cursor
+        columns = [StockMoveEntity.id, StockMoveEntity.date]
+        columns.extend(
+            getattr(StockMoveEntity, field) for field in fields
+            if field in ("type", "quantity", "reference")
+        )
+        if "product" in fields:
+            columns.extend([
+                StockMoveEntity.product_id,
+                ProductEntity.name.label("product_name"),
+                ProductEntity.sku.label("product_sku"),
+            ])
+        if "warehouse" in fields:
+            columns.extend([
+                StockMoveEntity.warehouse_id,
+                WarehouseEntity.name.label("warehouse_name"),
+            ])
+        
+        statement = select(*columns).select_from(StockMoveEntity)
+        if "product" in fields:
+            statement = statement.join(
+                ProductEntity, ProductEntity.id == StockMoveEntity.product_id
+            )
+        if "warehouse" in fields:
+            statement = statement.join(
+                WarehouseEntity, WarehouseEntity.id == StockMoveEntity.warehouse_id
+            )
+        return statement
+    
+    async def _stock_move_conditions(
+        self,
+        session: AsyncSession,
+        product_filter: Optional[str],
+        warehouse_id: Optional[str],
+        move_type: Optional[str]
+    ) -> list:
+        conditions = []
+        
+        if product_filter:
+            product_ids = await self.product_search_index.find_product_ids(
+                session, product_filter
+            )
+            conditions.append(StockMoveEntity.product_id.in_(product_ids))
+        
+        if warehouse_id:
+            conditions.append(StockMoveEntity.warehouse_id == warehouse_id)
+        
+        if move_type:
+            conditions.append(StockMoveEntity.type == move_type)
+        
+        return conditions
+    
+    async def stream_stock_moves(
+        self,
+        product_filter: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[StockMove]:
+        async with self.session_factory() as session:
+            conditions = await self._stock_move_conditions(
+                session, product_filter, warehouse_id, move_type
+            )
+            
+            # Plain rows instead of entities: nothing accumulates in the identity map
+            result = await session.stream(
+                select(
+                    StockMoveEntity.id,
+                    StockMoveEntity.date,
+                    StockMoveEntity.product_id,
+                    StockMoveEntity.warehouse_id,
+                    StockMoveEntity.type,
+                    StockMoveEntity.quantity,
+                    StockMoveEntity.reference,
+                    ProductEntity.name.label("product_name"),
+                    ProductEntity.sku.label("product_sku"),
+                    WarehouseEntity.name.label("warehouse_name"),
+                ).join(
+                    ProductEntity, ProductEntity.id == StockMoveEntity.product_id
+                ).join(
+                    WarehouseEntity, WarehouseEntity.id == StockMoveEntity.warehouse_id
+                ).where(*conditions).order_by(
+                    StockMoveEntity.date.desc(), StockMoveEntity.id.desc()
+                ).execution_options(yield_per=batch_size)
+            )
+            async for rows in result.mappings().partitions():
+                identity_map = IdentityMap()
+                for row in rows:
+                    yield StockMapper.stock_move_row_to_domain(row, identity_map)
+    
     async def find_all_stock_moves(
         self,
         page: int,
@@ -30,98 +238,670 @@ class SQLAlchemyStockRepository:
         product_filter: Optional[str] = None,
         warehouse_id: Optional[str] = None,
         move_type: Optional[str] = None,
-    ) -> PaginatedResponse[StockMove]:
-        with self.session_factory() as session:
-            query = session.query(StockMoveEntity)
+        cursor: Optional[PageCursor] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Optional[List[str]] = None,
+        data_version: Optional[DataVersion] = None,
+    ) -> PaginatedResponse:
+        async with self.session_factory() as session:
+            conditions = await self._stock_move_conditions(
+                session, product_filter, warehouse_id, move_type
+            )
             
-            if product_filter:
-                query = query.join(ProductEntity).filter(
+            count_statement = select(func.count()).select_from(StockMoveEntity).where(*conditions)
+            
+            total_items = None
+            if count_mode == CountMode.EXACT:
+                total_items = await session.scalar(count_statement)
+            elif count_mode == CountMode.CACHED:
+                # Keyed on the data version, so a write in any worker retires the cached count
+                if data_version is None:
+                    data_version = await self.data_version_tracker.find(session, COUNT_RESOURCES)
+                cache_key = (product_filter, warehouse_id, move_type, data_version.tag)
+                total_items = self.count_cache.get(cache_key)
+                if total_items is None:
+                    total_items = await session.scalar(count_statement)
+                    self.count_cache.set(cache_key, total_items)
+            
+            offset = (page - 1) * page_size
+            if cursor:
+                page = cursor.page
+                offset = 0
+                conditions.append(
                     or_(
-                        ProductEntity.name.ilike(f"%{product_filter}%"),
-                        ProductEntity.sku.ilike(f"%{product_filter}%")
+                        StockMoveEntity.date < cursor.last_date,
+                        and_(
+                            StockMoveEntity.date == cursor.last_date,
+                            StockMoveEntity.id < cursor.last_id
+                        )
                     )
                 )
             
-            if warehouse_id:
-                query = query.filter(StockMoveEntity.warehouse_id == warehouse_id)
-            
-            if move_type:
-                query = query.filter(StockMoveEntity.type == move_type)
+            # A cursor may come from a request with another pageSize, so its page number cannot
+            # tell whether rows remain; one extra row can
+            probe_next = cursor is not None or count_mode == CountMode.HAS_MORE
+            fetch_size = page_size + 1 if probe_next else page_size
+            if fields is None:
+                statement = select(StockMoveEntity).options(*self._stock_move_load_options())
+            else:
+                statement = self._stock_move_projection(fields)
+            result = await session.execute(
+                statement.where(*conditions).order_by(
+                    StockMoveEntity.date.desc(), StockMoveEntity.id.desc()
+                ).offset(offset).limit(fetch_size)
+            )
+            # Entities and projected rows both expose .date and .id for the cursor below
+            rows = list(result.scalars().all() if fields is None else result.all())
             
-            total_items = query.count()
+            if probe_next:
+                has_more = len(rows) > page_size
+                rows = rows[:page_size]
+            else:
+                has_more = page * page_size < total_items
+            total_pages = None
+            if total_items is not None:
+                total_pages = ceil(total_items / page_size) if page_size > 0 else 0
             
-            offset = (page - 1) * page_size
-            entities = query.order_by(StockMoveEntity.date.desc()).offset(offset).limit(page_size).all()
+            identity_map = IdentityMap()
+            if fields is None:
+                stock_moves = [
+                    StockMapper.stock_move_to_domain(entity, identity_map) for entity in rows
+                ]
+            else:
+                stock_moves = [
+                    StockMapper.stock_move_row_to_fields(row, fields, identity_map) for row in rows
+                ]
             
-            stock_moves = [StockMapper.stock_move_to_domain(entity) for entity in entities]
+            next_cursor = None
+            if rows and has_more:
+                last = rows[-1]
+                next_cursor = PageCursor(
+                    last_date=last.date, last_id=last.id, page=page + 1
+                ).encode()
             
-            total_pages = ceil(total_items / page_size) if page_size > 0 else 0
             pagination = Pagination(
                 current_page=page,
                 page_size=page_size,
                 total_items=total_items,
-                total_pages=total_pages
+                total_pages=total_pages,
+                next_cursor=next_cursor,
+                count_mode=count_mode,
+                has_more=has_more
             )
             
             return PaginatedResponse(data=stock_moves, pagination=pagination)
     
     async def update_stock_move(self, stock_move: StockMove) -> StockMove:
-        with self.session_factory() as session:
-            entity = session.query(StockMoveEntity).filter(
-                StockMoveEntity.id == stock_move.id
-            ).first()
+        async with self.session_factory() as session:
+            entity = await self._load_stock_move(session, stock_move.id)
             
             if entity:
+                previous = StockMapper.stock_move_to_domain(entity)
                 entity.reference = stock_move.reference
                 entity.date = stock_move.date
                 entity.quantity = stock_move.quantity
                 entity.type = stock_move.type
-                session.commit()
-                session.refresh(entity)
+                await self.aggregate_writer.apply(session, [previous], sign=-1)
+                await self.aggregate_writer.apply(
+                    session, [StockMapper.stock_move_to_domain(entity)]
+                )
+                await self.data_version_tracker.touch(session, DataResource.STOCK_MOVES)
+                await session.commit()
+                self.count_cache.invalidate()
                 return StockMapper.stock_move_to_domain(entity)
             
             raise ValueError(f"Stock move {stock_move.id} not found")
     
+    async def update_stock_move_reference(
+        self, stock_move_id: str, reference: str
+    ) -> Optional[StockMove]:
+        async with self.session_factory() as session:
+            statement = update(StockMoveEntity).where(
+                StockMoveEntity.id == stock_move_id
+            ).values(reference=reference).execution_options(synchronize_session=False)
+            
+            if session.get_bind().dialect.update_returning:
+                result = await session.execute(
+                    statement.returning(*self._stock_move_returning_columns())
+                )
+                row = result.mappings().first()
+                if row:
+                    await self.data_version_tracker.touch(session, DataResource.STOCK_MOVES)
+                await session.commit()
+                return StockMapper.stock_move_row_to_domain(row) if row else None
+            
+            result = await session.execute(statement)
+            if result.rowcount == 0:
+                return None
+            entity = await self._load_stock_move(session, stock_move_id)
+            await self.data_version_tracker.touch(session, DataResource.STOCK_MOVES)
+            await session.commit()
+            return StockMapper.stock_move_to_domain(entity)
+    
     async def create_stock_move(self, stock_move: StockMove) -> StockMove:
-        with self.session_factory() as session:
+        async with self.session_factory() as session:
             entity = StockMapper.stock_move_to_entity(stock_move)
             session.add(entity)
-            session.commit()
-            session.refresh(entity)
+            await session.flush()
+            await self.aggregate_writer.apply(session, [stock_move])
+            await self.data_version_tracker.touch(session, DataResource.STOCK_MOVES)
+            await session.commit()
+            self.count_cache.invalidate()
+            entity = await self._load_stock_move(session, entity.id)
             return StockMapper.stock_move_to_domain(entity)
     
+    async def create_stock_moves_bulk(
+        self, stock_moves: List[StockMove], chunk_size: int = 500
+    ) -> BulkCreateResult:
+        created_ids: List[str] = []
+        errors: List[BulkItemError] = []
+        seen_ids: Set[str] = set()
+        
+        async with self.session_factory() as session:
+            for start in range(0, len(stock_moves), chunk_size):
+                chunk = list(enumerate(stock_moves[start:start + chunk_size], start))
+                insertable = await self._filter_insertable(session, chunk, seen_ids, errors)
+                if not insertable:
+                    continue
+                
+                try:
+                    await session.execute(
+                        insert(StockMoveEntity.__table__),
+                        [StockMapper.stock_move_to_row(stock_move) for _, stock_move in insertable]
+                    )
+                    await self.aggregate_writer.apply(
+                        session, [stock_move for _, stock_move in insertable]
+                    )
+                    await self.data_version_tracker.touch(session, DataResource.STOCK_MOVES)
+                    await session.commit()
+                    created_ids.extend(stock_move.id for _, stock_move in insertable)
+                except IntegrityError:
+                    await session.rollback()
+                    await self._insert_one_by_one(session, insertable, created_ids, errors)
+        
+        if created_ids:
+            self.count_cache.invalidate()
+        
+        errors.sort(key=lambda error: error.index)
+        return BulkCreateResult(received=len(stock_moves), created_ids=created_ids, errors=errors)
+    
+    async def _filter_insertable(
+        self,
+        session: AsyncSession,
+        chunk: List[Tuple[int, StockMove]],
+        seen_ids: Set[str],
+        errors: List[BulkItemError],
+        check_references: bool = True
+    ) -> List[Tuple[int, StockMove]]:
+        move_ids = {stock_move.id for _, stock_move in chunk}
+        product_ids = {stock_move.product.id for _, stock_move in chunk}
+        warehouse_ids = {stock_move.warehouse.id for _, stock_move in chunk}
+        
+        existing_moves = set((await session.execute(
+            select(StockMoveEntity.id).where(StockMoveEntity.id.in_(move_ids))
+        )).scalars().all())
+        known_products, known_warehouses = product_ids, warehouse_ids
+        if check_references:
+            known_products = set((await session.execute(
+                select(ProductEntity.id).where(ProductEntity.id.in_(product_ids))
+            )).scalars().all())
+            known_warehouses = set((await session.execute(
+                select(WarehouseEntity.id).where(WarehouseEntity.id.in_(warehouse_ids))
+            )).scalars().all())
+        
+        insertable = []
+        for index, stock_move in chunk:
+            if stock_move.id in existing_moves or stock_move.id in seen_ids:
+                message = f"Stock move with ID {stock_move.id} already exists"
+            elif stock_move.product.id not in known_products:
+                message = f"Product with ID {stock_move.product.id} not found"
+            elif stock_move.warehouse.id not in known_warehouses:
+                message = f"Warehouse with ID {stock_move.warehouse.id} not found"
+            else:
+                seen_ids.add(stock_move.id)
+                insertable.append((index, stock_move))
+                continue
+            errors.append(BulkItemError(index=index, id=stock_move.id, message=message))
+        return insertable
+    
+    async def _insert_one_by_one(
+        self,
+        session: AsyncSession,
+        insertable: List[Tuple[int, StockMove]],
+        created_ids: List[str],
+        errors: List[BulkItemError]
+    ) -> None:
+        for index, stock_move in insertable:
+            try:
+                await session.execute(
+                    insert(StockMoveEntity.__table__), [StockMapper.stock_move_to_row(stock_move)]
+                )
+                await self.aggregate_writer.apply(session, [stock_move])
+                await self.data_version_tracker.touch(session, DataResource.STOCK_MOVES)
+                await session.commit()
+                created_ids.append(stock_move.id)
+            except IntegrityError as e:
+                await session.rollback()
+                errors.append(BulkItemError(index=index, id=stock_move.id, message=str(e.orig)))
+    
+    async def _insert_in_savepoints(
+        self,
+        session: AsyncSession,
+        insertable: List[Tuple[int, StockMove]],
+        errors: List[BulkItemError]
+    ) -> List[str]:
+        created_ids: List[str] = []
+        for index, stock_move in insertable:
+            try:
+                async with session.begin_nested():
+                    await session.execute(
+                        insert(StockMoveEntity.__table__),
+                        [StockMapper.stock_move_to_row(stock_move)]
+                    )
+                    await self.aggregate_writer.apply(session, [stock_move])
+                created_ids.append(stock_move.id)
+            except IntegrityError as e:
+                errors.append(BulkItemError(index=index, id=stock_move.id, message=str(e.orig)))
+        if created_ids:
+            await self.data_version_tracker.touch(session, DataResource.STOCK_MOVES)
+        return created_ids
+    
+    async def find_import_job(self, job_id: str) -> Optional[StockImportJob]:
+        async with self.session_factory() as session:
+            entity = await session.get(StockImportJobEntity, job_id)
+            return StockMapper.import_job_to_domain(entity) if entity else None
+    
+    async def save_import_job(self, job: StockImportJob) -> StockImportJob:
+        async with self.session_factory() as session:
+            entity = await session.merge(StockMapper.import_job_to_entity(job))
+            await session.commit()
+            return StockMapper.import_job_to_domain(entity)
+    
+    async def import_stock_moves_chunk(
+        self,
+        job_id: str,
+        chunk: List[Tuple[int, StockMove]],
+        rows_processed: int,
+        rejected: int = 0
+    ) -> BulkCreateResult:
+        # References were resolved by the caller; job progress commits with the rows
+        created_ids: List[str] = []
+        errors: List[BulkItemError] = []
+        
+        async with self.session_factory() as session:
+            insertable = await self._filter_insertable(
+                session, chunk, set(), errors, check_references=False
+            )
+            
+            try:
+                if insertable:
+                    await session.execute(
+                        insert(StockMoveEntity.__table__),
+                        [StockMapper.stock_move_to_row(stock_move) for _, stock_move in insertable]
+                    )
+                    await self.aggregate_writer.apply(
+                        session, [stock_move for _, stock_move in insertable]
+                    )
+                    await self.data_version_tracker.touch(session, DataResource.STOCK_MOVES)
+                    created_ids.extend(stock_move.id for _, stock_move in insertable)
+                await self._advance_import_job(
+                    session, job_id, rows_processed, len(created_ids), rejected + len(errors)
+                )
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                # Retry row by row in savepoints of one transaction, so the rows that go in
+                # commit together with the job position. The job update runs first: on SQLite
+                # it opens the transaction, otherwise releasing a savepoint would commit it
+                await self._advance_import_job(session, job_id, rows_processed, 0, 0)
+                created_ids = await self._insert_in_savepoints(session, insertable, errors)
+                await self._advance_import_job(
+                    session, job_id, rows_processed, len(created_ids), rejected + len(errors)
+                )
+                await session.commit()
+        
+        if created_ids:
+            self.count_cache.invalidate()
+        
+        return BulkCreateResult(received=len(chunk), created_ids=created_ids, errors=errors)
+    
+    @staticmethod
+    async def _advance_import_job(
+        session: AsyncSession, job_id: str, rows_processed: int, created: int, failed: int
+    ) -> None:
+        await session.execute(
+            update(StockImportJobEntity).where(
+                StockImportJobEntity.id == job_id
+            ).values(
+                rows_processed=rows_processed,
+                created=StockImportJobEntity.created + created,
+                failed=StockImportJobEntity.failed + failed,
+                updated_at=datetime.utcnow()
+            ).execution_options(synchronize_session=False)
+        )
+    
+    async def find_stock_balances(
+        self,
+        product_id: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        as_of: Optional[date] = None
+    ) -> List[StockBalance]:
+        async with self.session_factory() as session:
+            if as_of:
+                return await self._find_stock_balances_as_of(
+                    session, product_id, warehouse_id, as_of
+                )
+            
+            query = select(StockBalanceEntity)
+            if product_id:
+                query = query.where(StockBalanceEntity.product_id == product_id)
+            if warehouse_id:
+                query = query.where(StockBalanceEntity.warehouse_id == warehouse_id)
+            query = query.order_by(StockBalanceEntity.product_id, StockBalanceEntity.warehouse_id)
+            
+            entities = (await session.execute(query)).scalars().all()
+            return [StockMapper.stock_balance_to_domain(entity) for entity in entities]
+    
+    @staticmethod
+    def _ledger_totals() -> list:
+        def total(move_type: StockMoveType):
+            return func.coalesce(func.sum(case(
+                (StockMoveEntity.type == move_type, StockMoveEntity.quantity), else_=0
+            )), 0)
+        
+        return [
+            total(StockMoveType.IN).label("quantity_in"),
+            total(StockMoveType.OUT).label("quantity_out"),
+            total(StockMoveType.ADJUST).label("quantity_adjust"),
+            func.coalesce(func.sum(case(
+                (StockMoveEntity.type == StockMoveType.OUT, -StockMoveEntity.quantity),
+                else_=StockMoveEntity.quantity
+            )), 0).label("quantity"),
+        ]
+    
+    @classmethod
+    def _balances_from_snapshot(
+        cls, snapshot_date: Optional[date], until: date, conditions: Optional[list] = None
+    ):
+        # Nearest snapshot rows plus only the moves recorded after it, folded per key
+        conditions = conditions or []
+        move_conditions = [StockMoveEntity.date <= until]
+        if snapshot_date:
+            move_conditions.append(StockMoveEntity.date > snapshot_date)
+        parts = [
+            select(
+                StockMoveEntity.product_id, StockMoveEntity.warehouse_id, *cls._ledger_totals()
+            ).where(
+                *move_conditions,
+                *[condition(StockMoveEntity) for condition in conditions]
+            ).group_by(StockMoveEntity.product_id, StockMoveEntity.warehouse_id)
+        ]
+        if snapshot_date:
+            parts.append(
+                select(
+                    StockBalanceSnapshotEntity.product_id,
+                    StockBalanceSnapshotEntity.warehouse_id,
+                    StockBalanceSnapshotEntity.quantity_in,
+                    StockBalanceSnapshotEntity.quantity_out,
+                    StockBalanceSnapshotEntity.quantity_adjust,
+                    StockBalanceSnapshotEntity.quantity,
+                ).where(
+                    StockBalanceSnapshotEntity.snapshot_date == snapshot_date,
+                    *[condition(StockBalanceSnapshotEntity) for condition in conditions]
+                )
+            )
+        
+        combined = union_all(*parts).subquery()
+        return select(
+            combined.c.product_id,
+            combined.c.warehouse_id,
+            func.sum(combined.c.quantity_in).label("quantity_in"),
+            func.sum(combined.c.quantity_out).label("quantity_out"),
+            func.sum(combined.c.quantity_adjust).label("quantity_adjust"),
+            func.sum(combined.c.quantity).label("quantity"),
+        ).group_by(combined.c.product_id, combined.c.warehouse_id)
+    
+    @staticmethod
+    async def _nearest_snapshot_date(session: AsyncSession, until: date) -> Optional[date]:
+        return (await session.execute(
+            select(func.max(StockBalanceSnapshotEntity.snapshot_date)).where(
+                StockBalanceSnapshotEntity.snapshot_date <= until
+            )
+        )).scalar()
+    
+    async def _find_stock_balances_as_of(
+        self,
+        session: AsyncSession,
+        product_id: Optional[str],
+        warehouse_id: Optional[str],
+        as_of: date
+    ) -> List[StockBalance]:
+        conditions = []
+        if product_id:
+            conditions.append(lambda entity: entity.product_id == product_id)
+        if warehouse_id:
+            conditions.append(lambda entity: entity.warehouse_id == warehouse_id)
+        
+        snapshot_date = await self._nearest_snapshot_date(session, as_of)
+        query = self._balances_from_snapshot(snapshot_date, as_of, conditions)
+        rows = (await session.execute(query.order_by("product_id", "warehouse_id"))).all()
+        return [StockMapper.stock_balance_to_domain(row) for row in rows]
+    
+    async def find_latest_snapshot_date(self) -> Optional[date]:
+        async with self.session_factory() as session:
+            return (await session.execute(
+                select(func.max(StockBalanceSnapshotEntity.snapshot_date))
+            )).scalar()
+    
+    async def find_first_stock_move_date(self) -> Optional[date]:
+        async with self.session_factory() as session:
+            return (await session.execute(select(func.min(StockMoveEntity.date)))).scalar()
+    
+    async def rebuild_balance_snapshots(self, boundaries: List[date]) -> int:
+        if not boundaries:
+            return 0
+        
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(StockBalanceSnapshotEntity).where(
+                    StockBalanceSnapshotEntity.snapshot_date.between(boundaries[0], boundaries[-1])
+                )
+            )
+            
+            written = 0
+            previous = await self._nearest_snapshot_date(session, boundaries[0])
+            for boundary in boundaries:
+                balances = self._balances_from_snapshot(previous, boundary).subquery()
+                result = await session.execute(
+                    insert(StockBalanceSnapshotEntity).from_select(
+                        [
+                            "snapshot_date", "product_id", "warehouse_id",
+                            "quantity_in", "quantity_out", "quantity_adjust", "quantity"
+                        ],
+                        select(
+                            literal(boundary, StockBalanceSnapshotEntity.snapshot_date.type),
+                            *balances.c
+                        )
+                    )
+                )
+                await session.commit()
+                written += result.rowcount
+                previous = boundary
+            
+            return written
+    
+    async def find_stock_move_rollups(
+        self,
+        granularity: Granularity,
+        warehouse_id: Optional[str] = None,
+        product_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        by_product: bool = False
+    ) -> List[StockMoveRollup]:
+        async with self.session_factory() as session:
+            keys = [StockMoveRollupEntity.bucket, StockMoveRollupEntity.warehouse_id]
+            if by_product:
+                keys.append(StockMoveRollupEntity.product_id)
+            keys.append(StockMoveRollupEntity.type)
+            
+            conditions = [StockMoveRollupEntity.granularity == granularity.value]
+            if warehouse_id:
+                conditions.append(StockMoveRollupEntity.warehouse_id == warehouse_id)
+            if product_id:
+                conditions.append(StockMoveRollupEntity.product_id == product_id)
+            if move_type:
+                conditions.append(StockMoveRollupEntity.type == move_type)
+            if date_from:
+                conditions.append(
+                    StockMoveRollupEntity.bucket >= granularity.period_start(date_from)
+                )
+            if date_to:
+                conditions.append(StockMoveRollupEntity.bucket <= date_to)
+            
+            move_count = func.sum(StockMoveRollupEntity.move_count)
+            query = select(
+                *keys,
+                move_count.label("move_count"),
+                func.sum(StockMoveRollupEntity.quantity).label("quantity")
+            ).where(*conditions).group_by(*keys).having(move_count > 0).order_by(*keys)
+            
+            rows = (await session.execute(query)).all()
+            return [StockMapper.stock_move_rollup_row_to_domain(row) for row in rows]
+    
+    async def find_data_version(self, resources: List[DataResource]) -> DataVersion:
+        async with self.session_factory() as session:
+            return await self.data_version_tracker.find(session, resources)
+    
     async def find_product_by_id(self, product_id: str) -> Optional[Product]:
-        with self.session_factory() as session:
-            entity = session.query(ProductEntity).filter(ProductEntity.id == product_id).first()
+        async with self.session_factory() as session:
+            entity = await session.get(ProductEntity, product_id)
             return StockMapper.product_to_domain(entity) if entity else None
     
     async def find_all_products(self) -> List[Product]:
-        with self.session_factory() as session:
-            entities = session.query(ProductEntity).all()
+        async with self.session_factory() as session:
+            entities = (await session.execute(select(ProductEntity))).scalars().all()
             return [StockMapper.product_to_domain(entity) for entity in entities]
     
     async def find_warehouse_by_id(self, warehouse_id: str) -> Optional[Warehouse]:
-        with self.session_factory() as session:
-            entity = session.query(WarehouseEntity).filter(WarehouseEntity.id == warehouse_id).first()
+        async with self.session_factory() as session:
+            entity = await session.get(WarehouseEntity, warehouse_id)
             return StockMapper.warehouse_to_domain(entity) if entity else None
     
     async def find_all_warehouses(self) -> List[Warehouse]:
-        with self.session_factory() as session:
-            entities = session.query(WarehouseEntity).all()
+        async with self.session_factory() as session:
+            entities = (await session.execute(select(WarehouseEntity))).scalars().all()
             return [StockMapper.warehouse_to_domain(entity) for entity in entities]
     
+    async def find_products_page(
+        self,
+        page_size: int,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[CatalogCursor] = None
+    ) -> PaginatedResponse[Product]:
+        return await self._find_catalog_page(
+            ProductEntity, StockMapper.product_to_domain,
+            [ProductEntity.name, ProductEntity.sku], page_size, prefix, sort, cursor
+        )
+    
+    async def find_warehouses_page(
+        self,
+        page_size: int,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[CatalogCursor] = None
+    ) -> PaginatedResponse[Warehouse]:
+        return await self._find_catalog_page(
+            WarehouseEntity, StockMapper.warehouse_to_domain,
+            [WarehouseEntity.name], page_size, prefix, sort, cursor
+        )
+    
+    async def _find_catalog_page(
+        self,
+        entity_class,
+        to_domain: Callable,
+        prefix_columns: list,
+        page_size: int,
+        prefix: Optional[str],
+        sort: CatalogSort,
+        cursor: Optional[CatalogCursor]
+    ) -> PaginatedResponse:
+        # Keyset on (sort column, id): each page is an index range scan, never a full load
+        sort_column = getattr(entity_class, sort.field)
+        tie_break = sort.field != "id"
+        order_columns = [sort_column, entity_class.id] if tie_break else [sort_column]
+        
+        conditions = []
+        if prefix:
+            # A range on lower(column) walks the ix_*_lower_* indexes; LIKE would scan them all
+            lower_bound = func.lower(prefix)
+            upper_bound = func.lower(prefix + PREFIX_UPPER_BOUND)
+            conditions.append(or_(*[
+                and_(func.lower(column) >= lower_bound, func.lower(column) < upper_bound)
+                for column in prefix_columns
+            ]))
+        
+        page = 1
+        if cursor:
+            page = cursor.page
+            if sort.descending:
+                after_value = sort_column < cursor.last_value
+                after_id = entity_class.id < cursor.last_id
+            else:
+                after_value = sort_column > cursor.last_value
+                after_id = entity_class.id > cursor.last_id
+            conditions.append(
+                or_(after_value, and_(sort_column == cursor.last_value, after_id))
+                if tie_break else after_value
+            )
+        
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(entity_class).where(*conditions).order_by(*[
+                    column.desc() if sort.descending else column.asc()
+                    for column in order_columns
+                ]).limit(page_size + 1)
+            )
+            entities = list(result.scalars().all())
+        
+        has_more = len(entities) > page_size
+        entities = entities[:page_size]
+        
+        next_cursor = None
+        if has_more:
+            last = entities[-1]
+            next_cursor = CatalogCursor(
+                sort=sort, last_value=getattr(last, sort.field), last_id=last.id, page=page + 1
+            ).encode()
+        
+        return PaginatedResponse(
+            data=[to_domain(entity) for entity in entities],
+            pagination=Pagination(
+                current_page=page,
+                page_size=page_size,
+                total_items=None,
+                total_pages=None,
+                next_cursor=next_cursor,
+                count_mode=CountMode.HAS_MORE,
+                has_more=has_more
+            )
+        )
+    
     async def create_product(self, product: Product) -> Product:
-        with self.session_factory() as session:
+        async with self.session_factory() as session:
             entity = StockMapper.product_to_entity(product)
             session.add(entity)
-            session.commit()
-            session.refresh(entity)
+            await self.data_version_tracker.touch(session, DataResource.PRODUCTS)
+            await session.commit()
+            self.count_cache.invalidate()
             return StockMapper.product_to_domain(entity)
     
     async def create_warehouse(self, warehouse: Warehouse) -> Warehouse:
-        with self.session_factory() as session:
+        async with self.session_factory() as session:
             entity = StockMapper.warehouse_to_entity(warehouse)
             session.add(entity)
-            session.commit()
-            session.refresh(entity)
+            await self.data_version_tracker.touch(session, DataResource.WAREHOUSES)
+            await session.commit()
             return StockMapper.warehouse_to_domain(entity)
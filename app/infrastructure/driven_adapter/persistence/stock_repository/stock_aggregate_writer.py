@@ -0,0 +1,160 @@
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.driven_adapter.persistence.entity.stock_entity import (
+    StockBalanceEntity, StockBalanceSnapshotEntity, StockMoveRollupEntity
+)
+from app.domain.model.stock import StockMove, StockMoveType, Granularity
+
+BALANCE_COLUMNS = ("quantity_in", "quantity_out", "quantity_adjust", "quantity")
+
+ROLLUP_KEY_COLUMNS = ("granularity", "bucket", "warehouse_id", "product_id", "type")
+
+ROLLUP_COLUMNS = ("move_count", "quantity")
+
+TYPE_COLUMNS = {
+    StockMoveType.IN: "quantity_in",
+    StockMoveType.OUT: "quantity_out",
+    StockMoveType.ADJUST: "quantity_adjust",
+}
+
+UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+class StockAggregateWriter:
+    
+    @staticmethod
+    def _aggregate(
+        stock_moves: Iterable[StockMove], sign: int, until: Optional[date] = None
+    ) -> Dict[Tuple[str, str], Dict[str, int]]:
+        deltas: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for stock_move in stock_moves:
+            if until is not None and stock_move.date > until:
+                continue
+            key = (stock_move.product.id, stock_move.warehouse.id)
+            delta = deltas.setdefault(key, dict.fromkeys(BALANCE_COLUMNS, 0))
+            delta[TYPE_COLUMNS[stock_move.type]] += sign * stock_move.quantity
+            delta["quantity"] += sign * stock_move.signed_quantity()
+        return deltas
+    
+    async def apply(
+        self, session: AsyncSession, stock_moves: Iterable[StockMove], sign: int = 1
+    ) -> None:
+        stock_moves = list(stock_moves)
+        if not stock_moves:
+            return
+        
+        deltas = self._aggregate(stock_moves, sign)
+        await self._upsert(
+            session,
+            StockBalanceEntity,
+            ("product_id", "warehouse_id"),
+            BALANCE_COLUMNS,
+            [
+                {"product_id": product_id, "warehouse_id": warehouse_id, **delta}
+                for (product_id, warehouse_id), delta in deltas.items()
+            ]
+        )
+        await self._apply_to_snapshots(session, stock_moves, sign)
+        await self._apply_to_rollups(session, stock_moves, sign)
+    
+    async def _apply_to_snapshots(
+        self, session: AsyncSession, stock_moves: List[StockMove], sign: int
+    ) -> None:
+        # Back-dated moves also change every snapshot taken on or after their date
+        snapshot_dates = (await session.execute(
+            select(StockBalanceSnapshotEntity.snapshot_date).where(
+                StockBalanceSnapshotEntity.snapshot_date >= min(sm.date for sm in stock_moves)
+            ).distinct()
+        )).scalars().all()
+        
+        rows = []
+        for snapshot_date in snapshot_dates:
+            deltas = self._aggregate(stock_moves, sign, until=snapshot_date)
+            rows.extend(
+                {
+                    "snapshot_date": snapshot_date,
+                    "product_id": product_id,
+                    "warehouse_id": warehouse_id,
+                    **delta
+                }
+                for (product_id, warehouse_id), delta in deltas.items()
+            )
+        await self._upsert(
+            session,
+            StockBalanceSnapshotEntity,
+            ("snapshot_date", "product_id", "warehouse_id"),
+            BALANCE_COLUMNS,
+            rows
+        )
+    
+    async def _apply_to_rollups(
+        self, session: AsyncSession, stock_moves: List[StockMove], sign: int
+    ) -> None:
+        totals: Dict[tuple, Dict[str, int]] = {}
+        for stock_move in stock_moves:
+            for granularity in Granularity:
+                key = (
+                    granularity.value,
+                    granularity.period_start(stock_move.date),
+                    stock_move.warehouse.id,
+                    stock_move.product.id,
+                    stock_move.type,
+                )
+                total = totals.setdefault(key, dict.fromkeys(ROLLUP_COLUMNS, 0))
+                total["move_count"] += sign
+                total["quantity"] += sign * stock_move.quantity
+        
+        await self._upsert(
+            session,
+            StockMoveRollupEntity,
+            ROLLUP_KEY_COLUMNS,
+            ROLLUP_COLUMNS,
+            [dict(zip(ROLLUP_KEY_COLUMNS, key), **total) for key, total in totals.items()]
+        )
+    
+    @staticmethod
+    async def _upsert(
+        session: AsyncSession,
+        entity_class,
+        key_columns: Sequence[str],
+        value_columns: Sequence[str],
+        rows: List[dict]
+    ) -> None:
+        if not rows:
+            return
+        
+        upsert_insert = UPSERT_INSERTS.get(session.get_bind().dialect.name)
+        if upsert_insert:
+            # Core insert on the table: skips the per-row ORM bulk bookkeeping
+            table = entity_class.__table__
+            statement = upsert_insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c[column] for column in key_columns],
+                set_={
+                    column: table.c[column] + statement.excluded[column]
+                    for column in value_columns
+                }
+            )
+            await session.execute(statement, rows)
+            return
+        
+        for row in rows:
+            result = await session.execute(
+                select(entity_class).where(
+                    *[getattr(entity_class, column) == row[column] for column in key_columns]
+                ).with_for_update()
+            )
+            entity = result.scalars().first()
+            if entity is None:
+                session.add(entity_class(**row))
+                continue
+            for column in value_columns:
+                setattr(entity, column, getattr(entity, column) + row[column])
+        await session.flush()
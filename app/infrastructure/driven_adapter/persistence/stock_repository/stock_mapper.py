@@ -1,7 +1,13 @@
 from datetime import date as date_type
-from app.domain.model.stock import StockMove, Product, Warehouse, StockMoveType
+from typing import List, Optional
+
+from app.domain.model.stock import (
+    StockMove, StockBalance, StockMoveRollup, StockImportJob, ImportStatus, Product, Warehouse,
+    StockMoveType
+)
+from app.domain.model.util.identity_map import IdentityMap
 from app.infrastructure.driven_adapter.persistence.entity.stock_entity import (
-    StockMoveEntity, ProductEntity, WarehouseEntity
+    StockMoveEntity, ProductEntity, WarehouseEntity, StockBalanceEntity, StockImportJobEntity
 )
 
 
@@ -38,17 +44,96 @@ class StockMapper:
         )
     
     @staticmethod
-    def stock_move_to_domain(entity: StockMoveEntity) -> StockMove:
+    def _interned_product(
+        identity_map: Optional[IdentityMap], product_id: str, name: str, sku: Optional[str]
+    ) -> Product:
+        product = identity_map.get(Product, product_id) if identity_map is not None else None
+        if product is None:
+            product = Product(id=product_id, name=name, sku=sku)
+            if identity_map is not None:
+                identity_map.add(Product, product_id, product)
+        return product
+    
+    @staticmethod
+    def _interned_warehouse(
+        identity_map: Optional[IdentityMap], warehouse_id: str, name: str
+    ) -> Warehouse:
+        warehouse = identity_map.get(Warehouse, warehouse_id) if identity_map is not None else None
+        if warehouse is None:
+            warehouse = Warehouse(id=warehouse_id, name=name)
+            if identity_map is not None:
+                identity_map.add(Warehouse, warehouse_id, warehouse)
+        return warehouse
+    
+    @staticmethod
+    def stock_move_to_domain(
+        entity: StockMoveEntity,
+        identity_map: Optional[IdentityMap] = None
+    ) -> StockMove:
+        product = entity.product
+        warehouse = entity.warehouse
         return StockMove(
             id=entity.id,
             date=entity.date,
-            product=StockMapper.product_to_domain(entity.product),
-            warehouse=StockMapper.warehouse_to_domain(entity.warehouse),
+            product=StockMapper._interned_product(
+                identity_map, product.id, product.name, product.sku
+            ),
+            warehouse=StockMapper._interned_warehouse(identity_map, warehouse.id, warehouse.name),
             type=StockMoveType(entity.type),
             quantity=entity.quantity,
             reference=entity.reference
         )
     
+    @staticmethod
+    def stock_move_row_to_domain(row, identity_map: Optional[IdentityMap] = None) -> StockMove:
+        return StockMove(
+            id=row["id"],
+            date=row["date"],
+            product=StockMapper._interned_product(
+                identity_map, row["product_id"], row["product_name"], row["product_sku"]
+            ),
+            warehouse=StockMapper._interned_warehouse(
+                identity_map, row["warehouse_id"], row["warehouse_name"]
+            ),
+            type=StockMoveType(row["type"]),
+            quantity=row["quantity"],
+            reference=row["reference"]
+        )
+    
+    @staticmethod
+    def stock_move_row_to_fields(
+        row, fields: List[str], identity_map: Optional[IdentityMap] = None
+    ) -> dict:
+        mapping = row._mapping
+        values = {}
+        for field in fields:
+            if field == "product":
+                values[field] = StockMapper._interned_product(
+                    identity_map, mapping["product_id"], mapping["product_name"],
+                    mapping["product_sku"]
+                )
+            elif field == "warehouse":
+                values[field] = StockMapper._interned_warehouse(
+                    identity_map, mapping["warehouse_id"], mapping["warehouse_name"]
+                )
+            elif field == "type":
+                values[field] = StockMoveType(mapping["type"])
+            else:
+                values[field] = mapping[field]
+        return values
+    
+    @staticmethod
+    def stock_move_to_row(domain: StockMove) -> dict:
+        return {
+            "id": domain.id,
+            "date": domain.date,
+            "product_id": domain.product.id,
+            "warehouse_id": domain.warehouse.id,
+            "type": domain.type,
+            "quantity": domain.quantity,
+            "reference": domain.reference,
+        }
+    
     @staticmethod
     def stock_move_to_entity(domain: StockMove) -> StockMoveEntity:
         return StockMoveEntity(
@@ -60,3 +145,52 @@ class StockMapper:
             quantity=domain.quantity,
             reference=domain.reference
         )
+    
+    @staticmethod
+    def stock_balance_to_domain(entity: StockBalanceEntity) -> StockBalance:
+        return StockBalance(
+            product_id=entity.product_id,
+            warehouse_id=entity.warehouse_id,
+            quantity_in=entity.quantity_in,
+            quantity_out=entity.quantity_out,
+            quantity_adjust=entity.quantity_adjust,
+            quantity=entity.quantity
+        )
+    
+    @staticmethod
+    def stock_move_rollup_row_to_domain(row) -> StockMoveRollup:
+        mapping = row._mapping
+        return StockMoveRollup(
+            bucket=mapping["bucket"],
+            warehouse_id=mapping["warehouse_id"],
+            product_id=mapping.get("product_id"),
+            type=StockMoveType(mapping["type"]),
+            move_count=mapping["move_count"],
+            quantity=mapping["quantity"]
+        )
+    
+    @staticmethod
+    def import_job_to_domain(entity: StockImportJobEntity) -> StockImportJob:
+        return StockImportJob(
+            id=entity.id,
+            source=entity.source,
+            status=ImportStatus(entity.status),
+            rows_processed=entity.rows_processed,
+            created=entity.created,
+            failed=entity.failed,
+            started_at=entity.started_at,
+            updated_at=entity.updated_at
+        )
+    
+    @staticmethod
+    def import_job_to_entity(domain: StockImportJob) -> StockImportJobEntity:
+        return StockImportJobEntity(
+            id=domain.id,
+            source=domain.source,
+            status=domain.status.value,
+            rows_processed=domain.rows_processed,
+            created=domain.created,
+            failed=domain.failed,
+            started_at=domain.started_at,
+            updated_at=domain.updated_at
+        )
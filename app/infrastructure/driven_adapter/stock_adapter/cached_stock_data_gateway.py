@@ -0,0 +1,261 @@
+from datetime import date
+from functools import partial
+from typing import Optional, List, AsyncIterator, Awaitable, Callable, Hashable, Tuple
+
+from app.domain.gateway.stock_data_gateway import StockDataGateway
+from app.domain.model.stock import (
+    StockMove, StockMoveBatch, StockBalance, StockMoveRollup, Granularity, Product, Warehouse,
+    BulkCreateResult, StockImportJob, DataResource, DataVersion
+)
+from app.domain.model.pagination import (
+    PaginatedResponse, PageCursor, CountMode, CatalogSort, CatalogCursor
+)
+from app.infrastructure.driven_adapter.stock_adapter.catalog_cache import CatalogCache
+from app.infrastructure.driven_adapter.stock_adapter.single_flight import SingleFlight
+
+
+class CachedStockDataGateway(StockDataGateway):
+    
+    def __init__(
+        self,
+        stock_gateway: StockDataGateway,
+        catalog_cache: CatalogCache,
+        single_flight: SingleFlight
+    ) -> None:
+        self.stock_gateway = stock_gateway
+        self.catalog_cache = catalog_cache
+        self.single_flight = single_flight
+    
+    async def find_stock_move_by_id(self, stock_move_id: str) -> Optional[StockMove]:
+        return await self.stock_gateway.find_stock_move_by_id(stock_move_id)
+    
+    def stream_stock_moves(
+        self,
+        product_filter: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[StockMove]:
+        return self.stock_gateway.stream_stock_moves(
+            product_filter=product_filter,
+            warehouse_id=warehouse_id,
+            move_type=move_type,
+            batch_size=batch_size
+        )
+    
+    async def find_stock_moves_by_ids(self, stock_move_ids: List[str]) -> StockMoveBatch:
+        return await self.stock_gateway.find_stock_moves_by_ids(stock_move_ids)
+    
+    async def find_all_stock_moves(
+        self,
+        page: int,
+        page_size: int,
+        product_filter: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        cursor: Optional[PageCursor] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Optional[List[str]] = None,
+        data_version: Optional[DataVersion] = None,
+    ) -> PaginatedResponse:
+        # The version keeps a reader that saw a newer write from joining an older call
+        key = (
+            "stock_moves", page, page_size, product_filter, warehouse_id, move_type,
+            cursor.encode() if cursor else None, count_mode, tuple(fields) if fields else None,
+            data_version.tag if data_version else None
+        )
+        return await self.single_flight.do(key, lambda: self.stock_gateway.find_all_stock_moves(
+            page=page,
+            page_size=page_size,
+            product_filter=product_filter,
+            warehouse_id=warehouse_id,
+            move_type=move_type,
+            cursor=cursor,
+            count_mode=count_mode,
+            fields=fields,
+            data_version=data_version
+        ))
+    
+    async def update_stock_move(self, stock_move: StockMove) -> StockMove:
+        try:
+            return await self.stock_gateway.update_stock_move(stock_move)
+        finally:
+            self.single_flight.forget()
+    
+    async def update_stock_move_reference(
+        self, stock_move_id: str, reference: str
+    ) -> Optional[StockMove]:
+        try:
+            return await self.stock_gateway.update_stock_move_reference(stock_move_id, reference)
+        finally:
+            self.single_flight.forget()
+    
+    async def create_stock_move(self, stock_move: StockMove) -> StockMove:
+        try:
+            return await self.stock_gateway.create_stock_move(stock_move)
+        finally:
+            self.single_flight.forget()
+    
+    async def create_stock_moves_bulk(
+        self, stock_moves: List[StockMove], chunk_size: int = 500
+    ) -> BulkCreateResult:
+        try:
+            return await self.stock_gateway.create_stock_moves_bulk(stock_moves, chunk_size)
+        finally:
+            self.single_flight.forget()
+    
+    async def find_import_job(self, job_id: str) -> Optional[StockImportJob]:
+        return await self.stock_gateway.find_import_job(job_id)
+    
+    async def save_import_job(self, job: StockImportJob) -> StockImportJob:
+        return await self.stock_gateway.save_import_job(job)
+    
+    async def import_stock_moves_chunk(
+        self,
+        job_id: str,
+        chunk: List[Tuple[int, StockMove]],
+        rows_processed: int,
+        rejected: int = 0
+    ) -> BulkCreateResult:
+        try:
+            return await self.stock_gateway.import_stock_moves_chunk(
+                job_id, chunk, rows_processed, rejected
+            )
+        finally:
+            self.single_flight.forget()
+    
+    async def find_stock_balances(
+        self,
+        product_id: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        as_of: Optional[date] = None
+    ) -> List[StockBalance]:
+        return await self.stock_gateway.find_stock_balances(product_id, warehouse_id, as_of)
+    
+    async def find_latest_snapshot_date(self) -> Optional[date]:
+        return await self.stock_gateway.find_latest_snapshot_date()
+    
+    async def find_first_stock_move_date(self) -> Optional[date]:
+        return await self.stock_gateway.find_first_stock_move_date()
+    
+    async def rebuild_balance_snapshots(self, boundaries: List[date]) -> int:
+        return await self.stock_gateway.rebuild_balance_snapshots(boundaries)
+    
+    async def find_stock_move_rollups(
+        self,
+        granularity: Granularity,
+        warehouse_id: Optional[str] = None,
+        product_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        by_product: bool = False
+    ) -> List[StockMoveRollup]:
+        return await self.stock_gateway.find_stock_move_rollups(
+            granularity=granularity,
+            warehouse_id=warehouse_id,
+            product_id=product_id,
+            move_type=move_type,
+            date_from=date_from,
+            date_to=date_to,
+            by_product=by_product
+        )
+    
+    async def find_data_version(self, resources: List[DataResource]) -> DataVersion:
+        key = ("data_version", tuple(resources))
+        return await self.single_flight.do(
+            key, lambda: self.stock_gateway.find_data_version(resources)
+        )
+    
+    async def find_product_by_id(self, product_id: str) -> Optional[Product]:
+        key = ("product", product_id)
+        product = self.catalog_cache.get(key)
+        if product is None:
+            product = await self.single_flight.do(
+                key, lambda: self.stock_gateway.find_product_by_id(product_id)
+            )
+            if product is not None:
+                self.catalog_cache.set(key, product)
+        return product
+    
+    async def find_all_products(self) -> List[Product]:
+        # Imports validate rows against this list, so it must see other workers' creates
+        products = await self.single_flight.do(("products",), self.stock_gateway.find_all_products)
+        return list(products)
+    
+    async def find_warehouse_by_id(self, warehouse_id: str) -> Optional[Warehouse]:
+        key = ("warehouse", warehouse_id)
+        warehouse = self.catalog_cache.get(key)
+        if warehouse is None:
+            warehouse = await self.single_flight.do(
+                key, lambda: self.stock_gateway.find_warehouse_by_id(warehouse_id)
+            )
+            if warehouse is not None:
+                self.catalog_cache.set(key, warehouse)
+        return warehouse
+    
+    async def find_all_warehouses(self) -> List[Warehouse]:
+        warehouses = await self.single_flight.do(
+            ("warehouses",), self.stock_gateway.find_all_warehouses
+        )
+        return list(warehouses)
+    
+    async def find_products_page(
+        self,
+        page_size: int,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[CatalogCursor] = None,
+        data_version: Optional[DataVersion] = None
+    ) -> PaginatedResponse[Product]:
+        key = ("products_page", page_size, prefix, sort, cursor.encode() if cursor else None)
+        call = partial(self.stock_gateway.find_products_page, page_size, prefix, sort, cursor)
+        if prefix is None and sort == CatalogSort.ID and cursor is None:
+            return await self._cached_first_page(DataResource.PRODUCTS, key, call, data_version)
+        return await self.single_flight.do(key, call)
+    
+    async def find_warehouses_page(
+        self,
+        page_size: int,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[CatalogCursor] = None,
+        data_version: Optional[DataVersion] = None
+    ) -> PaginatedResponse[Warehouse]:
+        key = ("warehouses_page", page_size, prefix, sort, cursor.encode() if cursor else None)
+        call = partial(self.stock_gateway.find_warehouses_page, page_size, prefix, sort, cursor)
+        if prefix is None and sort == CatalogSort.ID and cursor is None:
+            return await self._cached_first_page(DataResource.WAREHOUSES, key, call, data_version)
+        return await self.single_flight.do(key, call)
+    
+    async def _cached_first_page(
+        self,
+        resource: DataResource,
+        key: Hashable,
+        call: Callable[[], Awaitable[PaginatedResponse]],
+        data_version: Optional[DataVersion] = None
+    ) -> PaginatedResponse:
+        # Keyed on the data version, so a create in any process retires the cached page
+        version = data_version
+        if version is None:
+            version = await self.find_data_version([resource])
+        cache_key = (key, version.tag)
+        page = self.catalog_cache.get(cache_key)
+        if page is None:
+            page = await self.single_flight.do(key, call)
+            self.catalog_cache.set(cache_key, page)
+        return page
+    
+    async def create_product(self, product: Product) -> Product:
+        try:
+            return await self.stock_gateway.create_product(product)
+        finally:
+            self.catalog_cache.invalidate()
+            self.single_flight.forget()
+    
+    async def create_warehouse(self, warehouse: Warehouse) -> Warehouse:
+        try:
+            return await self.stock_gateway.create_warehouse(warehouse)
+        finally:
+            self.catalog_cache.invalidate()
+            self.single_flight.forget()
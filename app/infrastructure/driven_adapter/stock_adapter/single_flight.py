@@ -0,0 +1,55 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Let concurrent identical reads share one in-flight call"""
+    
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.forgets = 0
+    
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        if not self.enabled:
+            self.executions += 1
+            return await call()
+        
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        # A caller that goes away must not cancel the call the others are waiting on
+        return await asyncio.shield(task)
+    
+    def forget(self) -> None:
+        """Detach in-flight calls so reads issued after a write start a fresh one"""
+        if self._in_flight:
+            self._in_flight.clear()
+            self.forgets += 1
+    
+    def _release(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the error as retrieved even if every waiter was cancelled
+            task.exception()
+    
+    def stats(self) -> Dict[str, Any]:
+        coalesced = self.calls - self.executions
+        return {
+            "enabled": self.enabled,
+            "inFlight": len(self._in_flight),
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": coalesced,
+            "coalescingRatio": round(coalesced / self.calls, 4) if self.calls else 0.0,
+            "forgets": self.forgets,
+        }
@@ -1,8 +1,14 @@
-from typing import Optional, List
+from datetime import date
+from typing import Optional, List, AsyncIterator, Tuple
 
 from app.domain.gateway.stock_data_gateway import StockDataGateway
-from app.domain.model.stock import StockMove, Product, Warehouse
-from app.domain.model.pagination import PaginatedResponse
+from app.domain.model.stock import (
+    StockMove, StockMoveBatch, StockBalance, StockMoveRollup, Granularity, Product, Warehouse,
+    BulkCreateResult, StockImportJob, DataResource, DataVersion
+)
+from app.domain.model.pagination import (
+    PaginatedResponse, PageCursor, CountMode, CatalogSort, CatalogCursor
+)
 from app.infrastructure.driven_adapter.persistence.stock_repository.sqlalchemy_stock_repository import (
     SQLAlchemyStockRepository
 )
@@ -16,6 +22,23 @@ class StockDataGatewayImpl(StockDataGateway):
     async def find_stock_move_by_id(self, stock_move_id: str) -> Optional[StockMove]:
         return await self.stock_repository.find_stock_move_by_id(stock_move_id)
     
+    def stream_stock_moves(
+        self,
+        product_filter: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[StockMove]:
+        return self.stock_repository.stream_stock_moves(
+            product_filter=product_filter,
+            warehouse_id=warehouse_id,
+            move_type=move_type,
+            batch_size=batch_size
+        )
+    
+    async def find_stock_moves_by_ids(self, stock_move_ids: List[str]) -> StockMoveBatch:
+        return await self.stock_repository.find_stock_moves_by_ids(stock_move_ids)
+    
     async def find_all_stock_moves(
         self,
         page: int,
@@ -23,21 +46,96 @@ class StockDataGatewayImpl(StockDataGateway):
         product_filter: Optional[str] = None,
         warehouse_id: Optional[str] = None,
         move_type: Optional[str] = None,
-    ) -> PaginatedResponse[StockMove]:
+        cursor: Optional[PageCursor] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Optional[List[str]] = None,
+        data_version: Optional[DataVersion] = None,
+    ) -> PaginatedResponse:
         return await self.stock_repository.find_all_stock_moves(
             page=page,
             page_size=page_size,
             product_filter=product_filter,
             warehouse_id=warehouse_id,
-            move_type=move_type
+            move_type=move_type,
+            cursor=cursor,
+            count_mode=count_mode,
+            fields=fields,
+            data_version=data_version
         )
     
     async def update_stock_move(self, stock_move: StockMove) -> StockMove:
         return await self.stock_repository.update_stock_move(stock_move)
     
+    async def update_stock_move_reference(
+        self, stock_move_id: str, reference: str
+    ) -> Optional[StockMove]:
+        return await self.stock_repository.update_stock_move_reference(stock_move_id, reference)
+    
     async def create_stock_move(self, stock_move: StockMove) -> StockMove:
         return await self.stock_repository.create_stock_move(stock_move)
     
+    async def create_stock_moves_bulk(
+        self, stock_moves: List[StockMove], chunk_size: int = 500
+    ) -> BulkCreateResult:
+        return await self.stock_repository.create_stock_moves_bulk(stock_moves, chunk_size)
+    
+    async def find_import_job(self, job_id: str) -> Optional[StockImportJob]:
+        return await self.stock_repository.find_import_job(job_id)
+    
+    async def save_import_job(self, job: StockImportJob) -> StockImportJob:
+        return await self.stock_repository.save_import_job(job)
+    
+    async def import_stock_moves_chunk(
+        self,
+        job_id: str,
+        chunk: List[Tuple[int, StockMove]],
+        rows_processed: int,
+        rejected: int = 0
+    ) -> BulkCreateResult:
+        return await self.stock_repository.import_stock_moves_chunk(
+            job_id, chunk, rows_processed, rejected
+        )
+    
+    async def find_stock_balances(
+        self,
+        product_id: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        as_of: Optional[date] = None
+    ) -> List[StockBalance]:
+        return await self.stock_repository.find_stock_balances(product_id, warehouse_id, as_of)
+    
+    async def find_latest_snapshot_date(self) -> Optional[date]:
+        return await self.stock_repository.find_latest_snapshot_date()
+    
+    async def find_first_stock_move_date(self) -> Optional[date]:
+        return await self.stock_repository.find_first_stock_move_date()
+    
+    async def rebuild_balance_snapshots(self, boundaries: List[date]) -> int:
+        return await self.stock_repository.rebuild_balance_snapshots(boundaries)
+    
+    async def find_stock_move_rollups(
+        self,
+        granularity: Granularity,
+        warehouse_id: Optional[str] = None,
+        product_id: Optional[str] = None,
+        move_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        by_product: bool = False
+    ) -> List[StockMoveRollup]:
+        return await self.stock_repository.find_stock_move_rollups(
+            granularity=granularity,
+            warehouse_id=warehouse_id,
+            product_id=product_id,
+            move_type=move_type,
+            date_from=date_from,
+            date_to=date_to,
+            by_product=by_product
+        )
+    
+    async def find_data_version(self, resources: List[DataResource]) -> DataVersion:
+        return await self.stock_repository.find_data_version(resources)
+    
     async def find_product_by_id(self, product_id: str) -> Optional[Product]:
         return await self.stock_repository.find_product_by_id(product_id)
     
@@ -49,3 +147,29 @@ class StockDataGatewayImpl(StockDataGateway):
     
     async def find_all_warehouses(self) -> List[Warehouse]:
         return await self.stock_repository.find_all_warehouses()
+    
+    async def find_products_page(
+        self,
+        page_size: int,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[CatalogCursor] = None,
+        data_version: Optional[DataVersion] = None
+    ) -> PaginatedResponse[Product]:
+        return await self.stock_repository.find_products_page(page_size, prefix, sort, cursor)
+    
+    async def find_warehouses_page(
+        self,
+        page_size: int,
+        prefix: Optional[str] = None,
+        sort: CatalogSort = CatalogSort.ID,
+        cursor: Optional[CatalogCursor] = None,
+        data_version: Optional[DataVersion] = None
+    ) -> PaginatedResponse[Warehouse]:
+        return await self.stock_repository.find_warehouses_page(page_size, prefix, sort, cursor)
+    
+    async def create_product(self, product: Product) -> Product:
+        return await self.stock_repository.create_product(product)
+    
+    async def create_warehouse(self, warehouse: Warehouse) -> Warehouse:
+        return await self.stock_repository.create_warehouse(warehouse)
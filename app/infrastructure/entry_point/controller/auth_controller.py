@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException
 
-from app.application.container import Container
+from app.application.container import container
 from app.infrastructure.entry_point.dto.user_dto import (
     LoginRequest, RegisterRequest, UserResponse
 )
@@ -10,7 +10,6 @@ from app.application.logging_config import get_logger
 logger = get_logger(__name__)
 
 router = APIRouter()
-container = Container()
 
 
 @router.post("/login", response_model=UserResponse)
@@ -0,0 +1,36 @@
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+
+from app.application.container import container
+from app.infrastructure.entry_point.dto.stock_dto import StockBalancesListResponse
+from app.infrastructure.entry_point.mapper.stock_mapper import StockDTOMapper
+from app.infrastructure.entry_point.handler.auth_handler import get_current_user_id
+from app.application.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter()
+
+
+@router.get("", response_model=StockBalancesListResponse)
+async def get_stock_balances(
+    productId: Optional[str] = Query(None, description="Filter by product ID", alias="productId"),
+    warehouseId: Optional[str] = Query(
+        None, description="Filter by warehouse ID", alias="warehouseId"
+    ),
+    asOf: Optional[date] = Query(
+        None, description="Balance at the end of this date (YYYY-MM-DD)", alias="asOf"
+    ),
+    current_user_id: str = Depends(get_current_user_id)
+):
+    logger.info(f"Get stock balances - User: {current_user_id}")
+    
+    stock_use_case = container.stock_use_case()
+    balances = await stock_use_case.get_stock_balances(
+        product_id=productId,
+        warehouse_id=warehouseId,
+        as_of=asOf
+    )
+    
+    return StockDTOMapper.balances_to_list_response(balances)
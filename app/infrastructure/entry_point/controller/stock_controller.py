@@ -1,77 +1,306 @@
+import io
+from datetime import date
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
 
-from app.application.container import Container
+from app.application.container import container
+from app.domain.model.pagination import CountMode, CatalogSort
+from app.domain.model.stock import Granularity, DataResource
 from app.infrastructure.entry_point.dto.stock_dto import (
     StockMoveDTO, UpdateReferenceRequest, StockMovesListResponse,
-    ProductsListResponse, WarehousesListResponse
+    ProductsListResponse, WarehousesListResponse, CountModeDTO,
+    BatchGetRequest, BatchGetResponse, BulkCreateRequest, BulkCreateResponse,
+    GranularityDTO, StockMoveTypeDTO, StockMoveRollupsResponse, FileFormatDTO,
+    StockImportJobDTO, StockImportResponse, CatalogSortDTO, DEFAULT_CATALOG_PAGE_SIZE,
+    MAX_CATALOG_PAGE_SIZE
 )
 from app.infrastructure.entry_point.mapper.stock_mapper import StockDTOMapper
 from app.infrastructure.entry_point.handler.auth_handler import get_current_user_id
+from app.infrastructure.entry_point.utils.stock_export import ndjson_stream, csv_stream
+from app.infrastructure.entry_point.utils.stock_import import (
+    detect_format, parse_stock_moves_in_threadpool
+)
+from app.infrastructure.entry_point.utils.conditional_get import conditional_get
+from app.infrastructure.entry_point.utils.fast_json import fast_json_response
 from app.application.logging_config import get_logger
+from app.application.settings import settings
 
 logger = get_logger(__name__)
 
 router = APIRouter()
-container = Container()
+
+# Stock move responses embed product and warehouse data, so their version covers all three
+STOCK_MOVE_RESOURCES = [DataResource.STOCK_MOVES, DataResource.PRODUCTS, DataResource.WAREHOUSES]
 
 
 @router.get("/products", response_model=ProductsListResponse, tags=["Products"])
-async def get_all_products(
+async def get_products(
+    request: Request,
+    response: Response,
+    pageSize: int = Query(
+        DEFAULT_CATALOG_PAGE_SIZE, ge=1, le=MAX_CATALOG_PAGE_SIZE,
+        description="Items per page", alias="pageSize"
+    ),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from pagination.nextCursor"),
+    prefix: Optional[str] = Query(
+        None, min_length=1, description="Case-insensitive name or SKU prefix"
+    ),
+    sort: CatalogSortDTO = Query(CatalogSortDTO.ID, description="id, -id, name or -name"),
     current_user_id: str = Depends(get_current_user_id)
 ):
-    logger.info(f"Get all products - User: {current_user_id}")
+    logger.info(f"Get products - User: {current_user_id}, Prefix: {prefix}, Sort: {sort.value}")
     
     stock_use_case = container.stock_use_case()
-    products = await stock_use_case.get_all_products()
+    version = await stock_use_case.get_data_version([DataResource.PRODUCTS])
+    not_modified = conditional_get(request, response, version)
+    if not_modified:
+        return not_modified
+    
+    products = await stock_use_case.get_products(
+        page_size=pageSize,
+        prefix=prefix,
+        sort=CatalogSort(sort.value),
+        cursor=cursor,
+        data_version=version
+    )
     
+    if settings.fast_json_responses:
+        return fast_json_response(StockDTOMapper.products_to_payload(products), response)
     return StockDTOMapper.products_to_list_response(products)
 
 
 @router.get("/warehouses", response_model=WarehousesListResponse, tags=["Warehouses"])
-async def get_all_warehouses(
+async def get_warehouses(
+    request: Request,
+    response: Response,
+    pageSize: int = Query(
+        DEFAULT_CATALOG_PAGE_SIZE, ge=1, le=MAX_CATALOG_PAGE_SIZE,
+        description="Items per page", alias="pageSize"
+    ),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from pagination.nextCursor"),
+    prefix: Optional[str] = Query(None, min_length=1, description="Case-insensitive name prefix"),
+    sort: CatalogSortDTO = Query(CatalogSortDTO.ID, description="id, -id, name or -name"),
     current_user_id: str = Depends(get_current_user_id)
 ):
-    logger.info(f"Get all warehouses - User: {current_user_id}")
+    logger.info(f"Get warehouses - User: {current_user_id}, Prefix: {prefix}, Sort: {sort.value}")
     
     stock_use_case = container.stock_use_case()
-    warehouses = await stock_use_case.get_all_warehouses()
+    version = await stock_use_case.get_data_version([DataResource.WAREHOUSES])
+    not_modified = conditional_get(request, response, version)
+    if not_modified:
+        return not_modified
     
+    warehouses = await stock_use_case.get_warehouses(
+        page_size=pageSize,
+        prefix=prefix,
+        sort=CatalogSort(sort.value),
+        cursor=cursor,
+        data_version=version
+    )
+    
+    if settings.fast_json_responses:
+        return fast_json_response(StockDTOMapper.warehouses_to_payload(warehouses), response)
     return StockDTOMapper.warehouses_to_list_response(warehouses)
 
 
 @router.get("", response_model=StockMovesListResponse)
 async def get_stock_moves(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="Page number"),
     pageSize: int = Query(10, ge=1, le=100, description="Items per page", alias="pageSize"),
     product: Optional[str] = Query(None, description="Filter by product name or SKU"),
     warehouse: Optional[str] = Query(None, description="Filter by warehouse ID"),
     type: Optional[str] = Query(None, description="Filter by type (IN, OUT, ADJUST)"),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from pagination.nextCursor; overrides page"
+    ),
+    countMode: Optional[CountModeDTO] = Query(
+        None,
+        description="Total count strategy (exact, cached, has_more)",
+        alias="countMode"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description=(
+            "Comma-separated subset of id, date, product, warehouse, type, quantity, "
+            "reference; items then carry only those keys"
+        )
+    ),
     current_user_id: str = Depends(get_current_user_id)
 ):
     logger.info(f"Get stock moves - User: {current_user_id}, Page: {page}")
     
     stock_use_case = container.stock_use_case()
+    version = await stock_use_case.get_data_version(STOCK_MOVE_RESOURCES)
+    not_modified = conditional_get(request, response, version)
+    if not_modified:
+        return not_modified
+    
     paginated = await stock_use_case.get_stock_moves(
         page=page,
         page_size=pageSize,
         product_filter=product,
         warehouse_id=warehouse,
-        move_type=type
+        move_type=type,
+        cursor=cursor,
+        count_mode=CountMode(countMode.value if countMode else settings.default_count_mode),
+        fields=fields,
+        data_version=version
     )
     
+    if fields:
+        # Partial items do not fit StockMoveDTO, so they skip response_model like the fast path
+        return fast_json_response(StockDTOMapper.projected_to_payload(paginated), response)
+    if settings.fast_json_responses:
+        return fast_json_response(StockDTOMapper.paginated_to_payload(paginated), response)
     return StockDTOMapper.paginated_to_list_response(paginated)
 
 
+EXPORT_FORMATS = {
+    FileFormatDTO.NDJSON: (ndjson_stream, "application/x-ndjson"),
+    FileFormatDTO.CSV: (csv_stream, "text/csv; charset=utf-8"),
+}
+
+
+@router.get("/export")
+async def export_stock_moves(
+    format: FileFormatDTO = Query(FileFormatDTO.NDJSON, description="ndjson or csv"),
+    product: Optional[str] = Query(None, description="Filter by product name or SKU"),
+    warehouse: Optional[str] = Query(None, description="Filter by warehouse ID"),
+    type: Optional[str] = Query(None, description="Filter by type (IN, OUT, ADJUST)"),
+    current_user_id: str = Depends(get_current_user_id)
+):
+    logger.info(f"Export stock moves: {format.value} - User: {current_user_id}")
+    
+    stock_use_case = container.stock_use_case()
+    stock_moves = stock_use_case.export_stock_moves(
+        product_filter=product,
+        warehouse_id=warehouse,
+        move_type=type
+    )
+    
+    serializer, media_type = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        serializer(stock_moves),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="stock_moves.{format.value}"'}
+    )
+
+
+@router.post("/import", response_model=StockImportResponse)
+async def import_stock_moves(
+    file: UploadFile = File(..., description="CSV or NDJSON file of stock moves"),
+    format: Optional[FileFormatDTO] = Query(None, description="Defaults to the file extension"),
+    jobId: Optional[str] = Query(
+        None, description="Resume this import job from its last committed chunk", alias="jobId"
+    ),
+    current_user_id: str = Depends(get_current_user_id)
+):
+    logger.info(f"Import stock moves: {file.filename} - User: {current_user_id}")
+    
+    file_format = detect_format(file.filename, format.value if format else None)
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    
+    stock_use_case = container.stock_use_case()
+    result = await stock_use_case.import_stock_moves(
+        parse_stock_moves_in_threadpool(lines, file_format),
+        source=file.filename or "upload",
+        job_id=jobId
+    )
+    
+    return StockDTOMapper.import_result_to_response(result)
+
+
+@router.get("/imports/{job_id}", response_model=StockImportJobDTO)
+async def get_import_job(
+    job_id: str,
+    current_user_id: str = Depends(get_current_user_id)
+):
+    logger.info(f"Get import job: {job_id} - User: {current_user_id}")
+    
+    stock_use_case = container.stock_use_case()
+    job = await stock_use_case.get_import_job(job_id)
+    
+    return StockDTOMapper.import_job_to_dto(job)
+
+
+@router.get("/rollups", response_model=StockMoveRollupsResponse)
+async def get_stock_move_rollups(
+    granularity: GranularityDTO = Query(GranularityDTO.DAY, description="Bucket size"),
+    warehouse: Optional[str] = Query(None, description="Filter by warehouse ID"),
+    productId: Optional[str] = Query(None, description="Filter by product ID", alias="productId"),
+    type: Optional[StockMoveTypeDTO] = Query(None, description="Filter by type"),
+    dateFrom: Optional[date] = Query(
+        None, description="First date; includes the whole bucket it falls in", alias="dateFrom"
+    ),
+    dateTo: Optional[date] = Query(None, description="Last bucket start date", alias="dateTo"),
+    byProduct: bool = Query(False, description="Break buckets down per product", alias="byProduct"),
+    current_user_id: str = Depends(get_current_user_id)
+):
+    logger.info(f"Get stock move rollups: {granularity.value} - User: {current_user_id}")
+    
+    stock_use_case = container.stock_use_case()
+    rollups = await stock_use_case.get_stock_move_rollups(
+        granularity=Granularity(granularity.value),
+        warehouse_id=warehouse,
+        product_id=productId,
+        move_type=type.value if type else None,
+        date_from=dateFrom,
+        date_to=dateTo,
+        by_product=byProduct or productId is not None
+    )
+    
+    return StockDTOMapper.rollups_to_response(Granularity(granularity.value), rollups)
+
+
+@router.post("/batch-get", response_model=BatchGetResponse)
+async def batch_get_stock_moves(
+    request: BatchGetRequest,
+    current_user_id: str = Depends(get_current_user_id)
+):
+    logger.info(f"Batch get stock moves: {len(request.ids)} ids - User: {current_user_id}")
+    
+    stock_use_case = container.stock_use_case()
+    batch = await stock_use_case.get_stock_moves_by_ids(request.ids)
+    
+    if settings.fast_json_responses:
+        return fast_json_response(StockDTOMapper.batch_to_payload(batch))
+    return StockDTOMapper.batch_to_response(batch)
+
+
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def bulk_create_stock_moves(
+    request: BulkCreateRequest,
+    current_user_id: str = Depends(get_current_user_id)
+):
+    logger.info(f"Bulk create stock moves: {len(request.items)} items - User: {current_user_id}")
+    
+    stock_use_case = container.stock_use_case()
+    result = await stock_use_case.create_stock_moves_bulk(
+        [StockDTOMapper.create_request_to_item(item) for item in request.items]
+    )
+    
+    return StockDTOMapper.bulk_result_to_response(result)
+
+
 @router.get("/{stock_move_id}", response_model=StockMoveDTO)
 async def get_stock_move_by_id(
     stock_move_id: str,
+    request: Request,
+    response: Response,
     current_user_id: str = Depends(get_current_user_id)
 ):
     logger.info(f"Get stock move: {stock_move_id} - User: {current_user_id}")
     
     stock_use_case = container.stock_use_case()
+    version = await stock_use_case.get_data_version(STOCK_MOVE_RESOURCES)
+    # Looked up before answering 304 so an unknown id is a 404 whatever the client's tag
     stock_move = await stock_use_case.get_stock_move_by_id(stock_move_id)
+    not_modified = conditional_get(request, response, version)
+    if not_modified:
+        return not_modified
     
     return StockDTOMapper.stock_move_to_dto(stock_move)
 
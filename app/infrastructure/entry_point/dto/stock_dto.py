@@ -10,6 +10,23 @@ class StockMoveTypeDTO(str, Enum):
     ADJUST = "ADJUST"
 
 
+class CountModeDTO(str, Enum):
+    EXACT = "exact"
+    CACHED = "cached"
+    HAS_MORE = "has_more"
+
+
+class GranularityDTO(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class FileFormatDTO(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 class ProductDTO(BaseModel):
     id: str
     name: str
@@ -31,6 +48,48 @@ class StockMoveDTO(BaseModel):
     reference: str
 
 
+MAX_BATCH_GET_IDS = 500
+
+
+class BatchGetRequest(BaseModel):
+    ids: list[str] = Field(..., min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
+class BatchGetResponse(BaseModel):
+    data: list[StockMoveDTO]
+    missingIds: list[str]
+
+
+MAX_BULK_ITEMS = 10000
+
+
+class CreateStockMoveRequest(BaseModel):
+    id: str
+    date: date
+    productId: str
+    warehouseId: str
+    type: StockMoveTypeDTO
+    quantity: int
+    reference: str
+
+
+class BulkCreateRequest(BaseModel):
+    items: list[CreateStockMoveRequest] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemErrorDTO(BaseModel):
+    index: int
+    id: Optional[str] = None
+    message: str
+
+
+class BulkCreateResponse(BaseModel):
+    received: int
+    created: int
+    failed: int
+    errors: list[BulkItemErrorDTO]
+
+
 class UpdateReferenceRequest(BaseModel):
     reference: str = Field(..., min_length=3, max_length=60)
 
@@ -38,8 +97,11 @@ class UpdateReferenceRequest(BaseModel):
 class PaginationDTO(BaseModel):
     currentPage: int
     pageSize: int
-    totalItems: int
-    totalPages: int
+    totalItems: Optional[int] = None
+    totalPages: Optional[int] = None
+    nextCursor: Optional[str] = None
+    countMode: CountModeDTO = CountModeDTO.EXACT
+    hasMore: bool = False
 
 
 class StockMovesListResponse(BaseModel):
@@ -47,9 +109,67 @@ class StockMovesListResponse(BaseModel):
     pagination: PaginationDTO
 
 
+DEFAULT_CATALOG_PAGE_SIZE = 100
+MAX_CATALOG_PAGE_SIZE = 1000
+
+
+class CatalogSortDTO(str, Enum):
+    ID = "id"
+    ID_DESC = "-id"
+    NAME = "name"
+    NAME_DESC = "-name"
+
+
 class ProductsListResponse(BaseModel):
     data: list[ProductDTO]
+    pagination: PaginationDTO
 
 
 class WarehousesListResponse(BaseModel):
     data: list[WarehouseDTO]
+    pagination: PaginationDTO
+
+
+class StockBalanceDTO(BaseModel):
+    productId: str
+    warehouseId: str
+    quantityIn: int
+    quantityOut: int
+    quantityAdjust: int
+    quantity: int
+
+
+class StockBalancesListResponse(BaseModel):
+    data: list[StockBalanceDTO]
+
+
+class StockMoveRollupDTO(BaseModel):
+    bucket: str
+    warehouseId: str
+    productId: Optional[str] = None
+    type: StockMoveTypeDTO
+    moveCount: int
+    quantity: int
+
+
+class StockMoveRollupsResponse(BaseModel):
+    granularity: GranularityDTO
+    data: list[StockMoveRollupDTO]
+
+
+class StockImportJobDTO(BaseModel):
+    id: str
+    source: str
+    status: str
+    rowsProcessed: int
+    created: int
+    failed: int
+    startedAt: Optional[str] = None
+    updatedAt: Optional[str] = None
+
+
+class StockImportResponse(BaseModel):
+    job: StockImportJobDTO
+    errors: list[BulkItemErrorDTO]
+    elapsedSeconds: float
+    rowsPerSecond: float
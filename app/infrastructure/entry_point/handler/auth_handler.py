@@ -1,14 +1,12 @@
 from typing import Optional
 from fastapi import Header, HTTPException
 
-from app.application.container import Container
+from app.application.container import container
 from app.domain.model.util.exceptions import UnauthorizedException
 from app.application.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-container = Container()
-
 
 async def get_current_user_id(authorization: Optional[str] = Header(None)) -> str:
     if not authorization:
@@ -21,12 +19,19 @@ async def get_current_user_id(authorization: Optional[str] = Header(None)) -> st
         
         token = parts[1]
         
+        token_cache = container.token_cache()
+        user_id = token_cache.get(token)
+        if user_id:
+            return user_id
+        
         auth_use_case = container.auth_use_case()
-        user_id = await auth_use_case.validate_token(token)
+        claims = await auth_use_case.verify_token(token)
+        user_id = claims.get("sub") if claims else None
         
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid or expired token")
         
+        token_cache.set(token, user_id, claims.get("exp"))
         return user_id
         
     except Exception as e:
@@ -1,8 +1,17 @@
-from app.domain.model.stock import StockMove, Product, Warehouse
-from app.domain.model.pagination import PaginatedResponse
+from typing import Optional
+
+from app.domain.model.stock import (
+    StockMove, StockMoveBatch, StockBalance, StockMoveRollup, Granularity, Product, Warehouse,
+    BulkCreateResult, StockImportJob, StockImportResult
+)
+from app.domain.model.pagination import PaginatedResponse, Pagination
+from app.domain.model.util.identity_map import IdentityMap
 from app.infrastructure.entry_point.dto.stock_dto import (
     StockMoveDTO, ProductDTO, WarehouseDTO, StockMovesListResponse, PaginationDTO,
-    ProductsListResponse, WarehousesListResponse
+    ProductsListResponse, WarehousesListResponse, BatchGetResponse,
+    CreateStockMoveRequest, BulkCreateResponse, BulkItemErrorDTO,
+    StockBalanceDTO, StockBalancesListResponse, StockMoveRollupDTO, StockMoveRollupsResponse,
+    StockImportJobDTO, StockImportResponse
 )
 
 
@@ -24,39 +33,212 @@ class StockDTOMapper:
         )
     
     @staticmethod
-    def stock_move_to_dto(stock_move: StockMove) -> StockMoveDTO:
+    def _interned_product_dto(
+        product: Product, identity_map: Optional[IdentityMap]
+    ) -> ProductDTO:
+        if identity_map is None:
+            return StockDTOMapper.product_to_dto(product)
+        dto = identity_map.get(ProductDTO, product.id)
+        if dto is None:
+            dto = identity_map.add(ProductDTO, product.id, StockDTOMapper.product_to_dto(product))
+        return dto
+    
+    @staticmethod
+    def _interned_warehouse_dto(
+        warehouse: Warehouse, identity_map: Optional[IdentityMap]
+    ) -> WarehouseDTO:
+        if identity_map is None:
+            return StockDTOMapper.warehouse_to_dto(warehouse)
+        dto = identity_map.get(WarehouseDTO, warehouse.id)
+        if dto is None:
+            dto = identity_map.add(
+                WarehouseDTO, warehouse.id, StockDTOMapper.warehouse_to_dto(warehouse)
+            )
+        return dto
+    
+    @staticmethod
+    def stock_move_to_dto(
+        stock_move: StockMove,
+        identity_map: Optional[IdentityMap] = None
+    ) -> StockMoveDTO:
         return StockMoveDTO(
             id=stock_move.id,
             date=stock_move.date.isoformat(),
-            product=StockDTOMapper.product_to_dto(stock_move.product),
-            warehouse=StockDTOMapper.warehouse_to_dto(stock_move.warehouse),
+            product=StockDTOMapper._interned_product_dto(stock_move.product, identity_map),
+            warehouse=StockDTOMapper._interned_warehouse_dto(stock_move.warehouse, identity_map),
             type=stock_move.type,
             quantity=stock_move.quantity,
             reference=stock_move.reference
         )
     
+    @staticmethod
+    def pagination_to_dto(pagination: Pagination) -> PaginationDTO:
+        return PaginationDTO(
+            currentPage=pagination.current_page,
+            pageSize=pagination.page_size,
+            totalItems=pagination.total_items,
+            totalPages=pagination.total_pages,
+            nextCursor=pagination.next_cursor,
+            countMode=pagination.count_mode,
+            hasMore=pagination.has_more
+        )
+    
     @staticmethod
     def paginated_to_list_response(
         paginated: PaginatedResponse[StockMove]
     ) -> StockMovesListResponse:
+        identity_map = IdentityMap()
         return StockMovesListResponse(
-            data=[StockDTOMapper.stock_move_to_dto(sm) for sm in paginated.data],
-            pagination=PaginationDTO(
-                currentPage=paginated.pagination.current_page,
-                pageSize=paginated.pagination.page_size,
-                totalItems=paginated.pagination.total_items,
-                totalPages=paginated.pagination.total_pages
-            )
+            data=[StockDTOMapper.stock_move_to_dto(sm, identity_map) for sm in paginated.data],
+            pagination=StockDTOMapper.pagination_to_dto(paginated.pagination)
         )
     
     @staticmethod
-    def products_to_list_response(products: list[Product]) -> ProductsListResponse:
+    def batch_to_response(batch: StockMoveBatch) -> BatchGetResponse:
+        identity_map = IdentityMap()
+        return BatchGetResponse(
+            data=[StockDTOMapper.stock_move_to_dto(sm, identity_map) for sm in batch.data],
+            missingIds=batch.missing_ids
+        )
+    
+    @staticmethod
+    def create_request_to_item(request: CreateStockMoveRequest) -> dict:
+        return {
+            "id": request.id,
+            "date": request.date,
+            "product_id": request.productId,
+            "warehouse_id": request.warehouseId,
+            "type": request.type.value,
+            "quantity": request.quantity,
+            "reference": request.reference,
+        }
+    
+    @staticmethod
+    def bulk_result_to_response(result: BulkCreateResult) -> BulkCreateResponse:
+        return BulkCreateResponse(
+            received=result.received,
+            created=len(result.created_ids),
+            failed=len(result.errors),
+            errors=[
+                BulkItemErrorDTO(index=error.index, id=error.id, message=error.message)
+                for error in result.errors
+            ]
+        )
+    
+    @staticmethod
+    def products_to_list_response(
+        paginated: PaginatedResponse[Product]
+    ) -> ProductsListResponse:
         return ProductsListResponse(
-            data=[StockDTOMapper.product_to_dto(p) for p in products]
+            data=[StockDTOMapper.product_to_dto(p) for p in paginated.data],
+            pagination=StockDTOMapper.pagination_to_dto(paginated.pagination)
         )
     
     @staticmethod
-    def warehouses_to_list_response(warehouses: list[Warehouse]) -> WarehousesListResponse:
+    def warehouses_to_list_response(
+        paginated: PaginatedResponse[Warehouse]
+    ) -> WarehousesListResponse:
         return WarehousesListResponse(
-            data=[StockDTOMapper.warehouse_to_dto(w) for w in warehouses]
+            data=[StockDTOMapper.warehouse_to_dto(w) for w in paginated.data],
+            pagination=StockDTOMapper.pagination_to_dto(paginated.pagination)
+        )
+    
+    # Plain payloads for the fast JSON path; shapes and key order match the DTOs above
+    
+    @staticmethod
+    def paginated_to_payload(paginated: PaginatedResponse[StockMove]) -> dict:
+        return paginated.to_dict()
+    
+    @staticmethod
+    def stock_move_fields_to_payload(values: dict) -> dict:
+        payload = dict(values)
+        if "date" in payload:
+            payload["date"] = payload["date"].isoformat()
+        if "product" in payload:
+            payload["product"] = payload["product"].to_dict()
+        if "warehouse" in payload:
+            payload["warehouse"] = payload["warehouse"].to_dict()
+        if "type" in payload:
+            payload["type"] = payload["type"].value
+        return payload
+    
+    @staticmethod
+    def projected_to_payload(paginated: PaginatedResponse[dict]) -> dict:
+        return paginated.to_dict(item_converter=StockDTOMapper.stock_move_fields_to_payload)
+    
+    @staticmethod
+    def batch_to_payload(batch: StockMoveBatch) -> dict:
+        return {
+            "data": [sm.to_dict() for sm in batch.data],
+            "missingIds": batch.missing_ids,
+        }
+    
+    @staticmethod
+    def products_to_payload(paginated: PaginatedResponse[Product]) -> dict:
+        return paginated.to_dict()
+    
+    @staticmethod
+    def warehouses_to_payload(paginated: PaginatedResponse[Warehouse]) -> dict:
+        return paginated.to_dict()
+    
+    @staticmethod
+    def stock_balance_to_dto(balance: StockBalance) -> StockBalanceDTO:
+        return StockBalanceDTO(
+            productId=balance.product_id,
+            warehouseId=balance.warehouse_id,
+            quantityIn=balance.quantity_in,
+            quantityOut=balance.quantity_out,
+            quantityAdjust=balance.quantity_adjust,
+            quantity=balance.quantity
+        )
+    
+    @staticmethod
+    def balances_to_list_response(balances: list[StockBalance]) -> StockBalancesListResponse:
+        return StockBalancesListResponse(
+            data=[StockDTOMapper.stock_balance_to_dto(b) for b in balances]
+        )
+    
+    @staticmethod
+    def stock_move_rollup_to_dto(rollup: StockMoveRollup) -> StockMoveRollupDTO:
+        return StockMoveRollupDTO(
+            bucket=rollup.bucket.isoformat(),
+            warehouseId=rollup.warehouse_id,
+            productId=rollup.product_id,
+            type=rollup.type,
+            moveCount=rollup.move_count,
+            quantity=rollup.quantity
+        )
+    
+    @staticmethod
+    def rollups_to_response(
+        granularity: Granularity, rollups: list[StockMoveRollup]
+    ) -> StockMoveRollupsResponse:
+        return StockMoveRollupsResponse(
+            granularity=granularity.value,
+            data=[StockDTOMapper.stock_move_rollup_to_dto(r) for r in rollups]
+        )
+    
+    @staticmethod
+    def import_job_to_dto(job: StockImportJob) -> StockImportJobDTO:
+        return StockImportJobDTO(
+            id=job.id,
+            source=job.source,
+            status=job.status.value,
+            rowsProcessed=job.rows_processed,
+            created=job.created,
+            failed=job.failed,
+            startedAt=job.started_at.isoformat() if job.started_at else None,
+            updatedAt=job.updated_at.isoformat() if job.updated_at else None
+        )
+    
+    @staticmethod
+    def import_result_to_response(result: StockImportResult) -> StockImportResponse:
+        return StockImportResponse(
+            job=StockDTOMapper.import_job_to_dto(result.job),
+            errors=[
+                BulkItemErrorDTO(index=error.index, id=error.id, message=error.message)
+                for error in result.errors
+            ],
+            elapsedSeconds=round(result.elapsed_seconds, 3),
+            rowsPerSecond=round(result.rows_per_second, 1)
         )
@@ -0,0 +1,45 @@
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Optional
+from fastapi import Request, Response
+
+from app.domain.model.stock import DataVersion
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison, so a W/ prefix on either side is ignored
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def _query_digest(request: Request) -> str:
+    # Parameter order does not change the result, so it does not change the tag either
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    return hashlib.blake2b(
+        f"{request.url.path}?{query}".encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+
+def conditional_get(
+    request: Request, response: Response, version: DataVersion
+) -> Optional[Response]:
+    """Set validators on the response; return a 304 if the client copy is still current"""
+    # Weak: the tag tracks data versions, not bytes, and matches what compression would send
+    etag = f'W/"{version.tag}-{_query_digest(request)}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if version.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            version.last_modified.replace(tzinfo=timezone.utc), usegmt=True
+        )
+    
+    # If-Modified-Since is ignored: its one-second resolution cannot tell apart writes made
+    # in the same second as the response, so only the ETag can answer 304
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -8,6 +8,11 @@ from app.domain.model.util.exceptions import (
     InvalidCredentialsException,
     StockMoveNotFoundException,
     InvalidReferenceException,
+    InvalidCursorException,
+    ImportJobNotFoundException,
+    InvalidImportFileException,
+    InvalidFieldsException,
+    ServiceOverloadedException,
     UnauthorizedException
 )
 from app.application.logging_config import get_logger
@@ -77,6 +82,67 @@ def register_exception_handlers(app: FastAPI) -> None:
             }
         )
     
+    @app.exception_handler(InvalidCursorException)
+    async def invalid_cursor_handler(request: Request, exc: InvalidCursorException):
+        logger.warning(f"Invalid cursor: {exc.message}")
+        return JSONResponse(
+            status_code=400,
+            content={
+                "success": False,
+                "error": "InvalidCursor",
+                "message": exc.message
+            }
+        )
+    
+    @app.exception_handler(ImportJobNotFoundException)
+    async def import_job_not_found_handler(request: Request, exc: ImportJobNotFoundException):
+        logger.warning(f"Import job not found: {exc.message}")
+        return JSONResponse(
+            status_code=404,
+            content={
+                "success": False,
+                "error": "ImportJobNotFound",
+                "message": exc.message
+            }
+        )
+    
+    @app.exception_handler(InvalidImportFileException)
+    async def invalid_import_file_handler(request: Request, exc: InvalidImportFileException):
+        logger.warning(f"Invalid import file: {exc.message}")
+        return JSONResponse(
+            status_code=400,
+            content={
+                "success": False,
+                "error": "InvalidImportFile",
+                "message": exc.message
+            }
+        )
+    
+    @app.exception_handler(InvalidFieldsException)
+    async def invalid_fields_handler(request: Request, exc: InvalidFieldsException):
+        logger.warning(f"Invalid fields: {exc.message}")
+        return JSONResponse(
+            status_code=400,
+            content={
+                "success": False,
+                "error": "InvalidFields",
+                "message": exc.message
+            }
+        )
+    
+    @app.exception_handler(ServiceOverloadedException)
+    async def service_overloaded_handler(request: Request, exc: ServiceOverloadedException):
+        logger.warning(f"Service overloaded: {exc.message}")
+        return JSONResponse(
+            status_code=503,
+            content={
+                "success": False,
+                "error": "ServiceOverloaded",
+                "message": exc.message
+            },
+            headers={"Retry-After": str(exc.retry_after)}
+        )
+    
     @app.exception_handler(UnauthorizedException)
     async def unauthorized_handler(request: Request, exc: UnauthorizedException):
         logger.warning(f"Unauthorized: {exc.message}")
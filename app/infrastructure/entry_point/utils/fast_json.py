@@ -0,0 +1,24 @@
+from typing import Any, Optional
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib writer gives the same bytes, only slower
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+class FastJSONResponse(JSONResponse):
+    """Writes an already-trusted payload without response_model validation"""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return super().render(content)
+
+
+def fast_json_response(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    # Returning a Response skips the injected one, so carry over its headers (ETag and friends)
+    return FastJSONResponse(content, headers=dict(response.headers) if response else None)
@@ -0,0 +1,52 @@
+import csv
+import io
+import json
+from typing import AsyncIterator
+
+from app.domain.model.stock import StockMove
+
+CSV_COLUMNS = [
+    "id", "date", "productId", "productName", "productSku",
+    "warehouseId", "warehouseName", "type", "quantity", "reference",
+]
+
+ROWS_PER_CHUNK = 500
+
+
+async def ndjson_stream(stock_moves: AsyncIterator[StockMove]) -> AsyncIterator[str]:
+    lines = []
+    async for stock_move in stock_moves:
+        lines.append(json.dumps(stock_move.to_dict(), ensure_ascii=False, separators=(",", ":")))
+        if len(lines) >= ROWS_PER_CHUNK:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+async def csv_stream(stock_moves: AsyncIterator[StockMove]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    rows = 0
+    
+    async for stock_move in stock_moves:
+        writer.writerow([
+            stock_move.id,
+            stock_move.date.isoformat(),
+            stock_move.product.id,
+            stock_move.product.name,
+            stock_move.product.sku or "",
+            stock_move.warehouse.id,
+            stock_move.warehouse.name,
+            stock_move.type.value,
+            stock_move.quantity,
+            stock_move.reference,
+        ])
+        rows += 1
+        if rows % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    
+    yield buffer.getvalue()
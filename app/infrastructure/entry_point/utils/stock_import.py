@@ -0,0 +1,96 @@
+import csv
+import json
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.domain.model.util.exceptions import InvalidImportFileException
+
+IMPORT_FORMATS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+REQUIRED_FIELDS = ("id", "date", "product_id", "warehouse_id", "type", "quantity", "reference")
+
+PARSE_BATCH_SIZE = 1000
+
+
+def detect_format(filename: Optional[str], requested: Optional[str] = None) -> str:
+    if requested:
+        return requested
+    for extension, file_format in IMPORT_FORMATS.items():
+        if filename and filename.lower().endswith(extension):
+            return file_format
+    raise InvalidImportFileException(
+        f"Cannot infer import format from {filename!r}; use .csv, .ndjson or .jsonl"
+    )
+
+
+def parse_stock_moves(lines: Iterable[str], file_format: str) -> Iterator[Dict[str, Any]]:
+    if file_format == "csv":
+        records = csv.DictReader(lines)
+    elif file_format == "ndjson":
+        records = _json_lines(lines)
+    else:
+        raise InvalidImportFileException(f"Unsupported import format: {file_format}")
+    
+    for record in records:
+        yield _normalize(record)
+
+
+async def parse_stock_moves_in_threadpool(
+    lines: Iterable[str], file_format: str, batch_size: int = PARSE_BATCH_SIZE
+) -> AsyncIterator[Dict[str, Any]]:
+    """Parse on a worker thread, a batch at a time, so a large file never blocks the event loop"""
+    records = parse_stock_moves(lines, file_format)
+    while True:
+        batch = await run_in_threadpool(lambda: list(islice(records, batch_size)))
+        if not batch:
+            return
+        for record in batch:
+            yield record
+
+
+def _json_lines(lines: Iterable[str]) -> Iterator[Any]:
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield {"error": f"Invalid JSON line: {e}"}
+
+
+def _reference(record: Dict[str, Any], nested: str, *flat: str) -> Any:
+    # Accept both the flat CSV columns and the nested shape produced by the export
+    if isinstance(record.get(nested), dict):
+        return record[nested].get("id")
+    for key in flat:
+        if record.get(key):
+            return record[key]
+    return None
+
+
+def _normalize(record: Any) -> Dict[str, Any]:
+    if not isinstance(record, dict):
+        return {"error": "Record must be an object"}
+    if record.get("error"):
+        return record
+    
+    item = {
+        "id": record.get("id"),
+        "date": record.get("date"),
+        "product_id": _reference(record, "product", "productId", "productSku"),
+        "warehouse_id": _reference(record, "warehouse", "warehouseId", "warehouseName"),
+        "type": record.get("type"),
+        "quantity": record.get("quantity"),
+        "reference": record.get("reference"),
+    }
+    missing = [field for field in REQUIRED_FIELDS if item[field] in (None, "")]
+    if missing:
+        return {"id": item["id"], "error": f"Missing fields: {', '.join(missing)}"}
+    return item
@@ -1,16 +1,13 @@
 """Main application entry point"""
 from app.application.fast_api import create_app
 from app.application.handler import setup_routes
-from app.application.container import Container
-from app.infrastructure.driven_adapter.persistence.config.database import Database
+from app.application.container import container
 from app.application.settings import settings
 from app.application.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-container = Container()
-
-db = Database(database_url=settings.database_url)
+db = container.database()
 
 db.create_database()
 logger.info("Database initialized")
@@ -19,6 +16,14 @@ app = create_app()
 
 setup_routes(app, container)
 
+
+@app.on_event("shutdown")
+async def shutdown_database() -> None:
+    await db.dispose()
+    logger.info("Database connections closed")
+    container.password_pool().shutdown()
+
+
 logger.info("Application started successfully")
 
 if __name__ == "__main__":
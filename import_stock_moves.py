@@ -0,0 +1,63 @@
+"""Import stock moves from a CSV or NDJSON file"""
+import argparse
+import asyncio
+import hashlib
+import os
+
+from app.application.container import container
+from app.infrastructure.entry_point.utils.stock_import import (
+    detect_format, parse_stock_moves_in_threadpool
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Import stock moves in chunked transactions")
+    parser.add_argument("path", help="CSV or NDJSON file")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Defaults to the extension")
+    parser.add_argument(
+        "--job-id",
+        help="Import job to create or resume (default: derived from the file path, size and mtime)"
+    )
+    parser.add_argument("--chunk-size", type=int, help="Rows per transaction")
+    return parser.parse_args()
+
+
+def default_job_id(path: str) -> str:
+    # Same file, same job: re-running after a crash resumes from the last committed chunk
+    stat = os.stat(path)
+    fingerprint = f"{os.path.abspath(path)}:{stat.st_size}:{int(stat.st_mtime)}"
+    return f"file-{hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:16]}"
+
+
+async def main():
+    args = parse_args()
+    file_format = detect_format(args.path, args.format)
+    
+    db = container.database()
+    db.create_database()
+    
+    stock_use_case = container.stock_use_case()
+    if args.chunk_size:
+        stock_use_case.import_chunk_size = args.chunk_size
+    
+    with open(args.path, encoding="utf-8-sig", newline="") as lines:
+        result = await stock_use_case.import_stock_moves(
+            parse_stock_moves_in_threadpool(lines, file_format),
+            source=os.path.basename(args.path),
+            job_id=args.job_id or default_job_id(args.path)
+        )
+    
+    job = result.job
+    print(
+        f"Import {job.id} {job.status.value}: {job.rows_processed} rows, "
+        f"{job.created} created, {job.failed} failed in {result.elapsed_seconds:.1f}s "
+        f"({result.rows_per_second:.0f} rows/s)"
+    )
+    for error in result.errors:
+        print(f"  row {error.index}: {error.id} - {error.message}")
+    
+    await db.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+"""Rebuild stock balance snapshots"""
+import argparse
+import asyncio
+from datetime import date
+
+from app.application.container import container
+from app.application.settings import settings
+from app.domain.model.stock import Granularity
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Rebuild per-period stock balance snapshots")
+    parser.add_argument(
+        "--period",
+        choices=[period.value for period in Granularity],
+        default=settings.balance_snapshot_period,
+        help="Snapshot boundary (end of day, week or month)"
+    )
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        help="First date to rebuild (default: day after the latest snapshot)"
+    )
+    parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        help="Last date to rebuild (default: yesterday)"
+    )
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    
+    db = container.database()
+    db.create_database()
+    
+    stock_use_case = container.stock_use_case()
+    boundaries = await stock_use_case.rebuild_balance_snapshots(
+        Granularity(args.period), since=args.since, until=args.until
+    )
+    
+    if boundaries:
+        print(f"Rebuilt {len(boundaries)} snapshots: {boundaries[0]} .. {boundaries[-1]}")
+    else:
+        print("No snapshots to rebuild")
+    
+    await db.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""Seeded throwaway SQLite database for the benchmark scripts
+
+Importing this module points DATABASE_URL at a temporary file, so it has to come
+before any app import.
+"""
+import os
+import tempfile
+from datetime import date, timedelta
+
+BENCH_DIR = tempfile.mkdtemp(prefix="stock-api-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{BENCH_DIR}/bench.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+
+from app.application.container import container  # noqa: E402
+from app.domain.model.stock import Product, Warehouse, StockMove, StockMoveType  # noqa: E402
+
+MOVE_TYPES = list(StockMoveType)
+# Escaping-sensitive text, so serialisers are compared on more than plain ASCII
+REFERENCES = [
+    "Compra proveedor", "Devolución ñandú", "Envío 📦 \"urgente\"", "Ruta C:\\tmp\u2028"
+]
+
+
+async def seed(moves: int, products: int, warehouses: int) -> None:
+    container.database().create_database()
+    repository = container.stock_repository()
+    catalog = [
+        Product(id=f"P{i:04d}", name=f"Product {i}", sku=f"SKU-{i:04d}") for i in range(products)
+    ]
+    sites = [Warehouse(id=f"W{i:03d}", name=f"Warehouse {i}") for i in range(warehouses)]
+    for product in catalog:
+        await repository.create_product(product)
+    for warehouse in sites:
+        await repository.create_warehouse(warehouse)
+    await repository.create_stock_moves_bulk([
+        StockMove(
+            id=f"SM{index:06d}",
+            date=date(2025, 1, 1) + timedelta(days=index % 365),
+            product=catalog[index % products],
+            warehouse=sites[index % warehouses],
+            type=MOVE_TYPES[index % len(MOVE_TYPES)],
+            quantity=index % 50 + 1,
+            reference=f"{REFERENCES[index % len(REFERENCES)]} {index}"
+        )
+        for index in range(moves)
+    ])
@@ -0,0 +1,87 @@
+"""Benchmark serialising a stock move page: response_model path vs FastJSONResponse
+
+Run from the repository root: python -m scripts.bench_list_serialization
+"""
+import argparse
+import asyncio
+import time
+
+# Must precede the app imports: it points DATABASE_URL at a throwaway file
+from scripts.bench_database import container, seed  # noqa: I001
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from app.domain.model.pagination import CountMode
+from app.infrastructure.entry_point.mapper.stock_mapper import StockDTOMapper
+from app.infrastructure.entry_point.utils import fast_json
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-page cost of list response serialisation")
+    parser.add_argument("--moves", type=int, default=1000, help="Stock moves to seed")
+    parser.add_argument(
+        "--page-sizes", type=int, nargs="+", default=[10, 100], help="Page sizes to measure"
+    )
+    parser.add_argument("--repeat", type=int, default=2000, help="Timed iterations per variant")
+    return parser.parse_args()
+
+
+def list_route():
+    from app.main import app
+    return next(
+        route for route in app.routes
+        if getattr(route, "path", None) == "/stock-moves" and "GET" in route.methods
+    )
+
+
+async def time_per_call(render, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await render()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+async def main():
+    args = parse_args()
+    route = list_route()
+    await seed(args.moves, products=80, warehouses=6)
+    stock_use_case = container.stock_use_case()
+    
+    for page_size in args.page_sizes:
+        page = await stock_use_case.get_stock_moves(
+            page=1, page_size=page_size, count_mode=CountMode.EXACT
+        )
+        
+        async def default() -> bytes:
+            # What FastAPI does with response_model: build DTOs, validate, encode
+            content = await serialize_response(
+                field=route.response_field,
+                response_content=StockDTOMapper.paginated_to_list_response(page),
+                is_coroutine=True
+            )
+            return JSONResponse(content).body
+        
+        async def fast() -> bytes:
+            return fast_json.FastJSONResponse(StockDTOMapper.paginated_to_payload(page)).body
+        
+        baseline = await time_per_call(default, args.repeat)
+        timings = []
+        orjson = fast_json.orjson
+        for label, writer in (("orjson", orjson), ("stdlib json", None)):
+            if label == "orjson" and orjson is None:
+                continue
+            fast_json.orjson = writer
+            assert await fast() == await default(), f"{label} body differs from default"
+            timings.append((label, await time_per_call(fast, args.repeat)))
+        fast_json.orjson = orjson
+        
+        summary = ", ".join(
+            f"{label} {micros:.0f} us ({baseline / micros:.1f}x)" for label, micros in timings
+        )
+        print(f"{page_size:4} moves: default {baseline:.0f} us, {summary}")
+    
+    await container.database().dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+"""Benchmark mapping one page of stock moves with and without an IdentityMap
+
+Run from the repository root: python -m scripts.bench_page_mapping
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+# Must precede the app imports: it points DATABASE_URL at a throwaway file
+from scripts.bench_database import container, seed  # noqa: I001
+from sqlalchemy import select
+
+from app.domain.model.stock import Product, Warehouse
+from app.domain.model.util.identity_map import IdentityMap
+from app.infrastructure.driven_adapter.persistence.entity.stock_entity import StockMoveEntity
+from app.infrastructure.driven_adapter.persistence.stock_repository.stock_mapper import StockMapper
+from app.infrastructure.entry_point.dto.stock_dto import ProductDTO, WarehouseDTO
+from app.infrastructure.entry_point.mapper.stock_mapper import StockDTOMapper
+
+VARIANTS = [("without identity map", lambda: None), ("with identity map", IdentityMap)]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Allocation and latency of page mapping")
+    parser.add_argument("--moves", type=int, default=1000, help="Stock moves to seed")
+    parser.add_argument("--products", type=int, default=80, help="Products to seed")
+    parser.add_argument("--warehouses", type=int, default=6, help="Warehouses to seed")
+    parser.add_argument("--page-size", type=int, default=100, help="Moves per page")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed iterations per variant")
+    return parser.parse_args()
+
+
+def map_page(entities: list, new_map) -> tuple:
+    domain_map = new_map()
+    moves = [StockMapper.stock_move_to_domain(entity, domain_map) for entity in entities]
+    dto_map = new_map()
+    return moves, [StockDTOMapper.stock_move_to_dto(move, dto_map) for move in moves]
+
+
+def distinct(instances, kind: type) -> int:
+    return len({id(instance) for instance in instances if isinstance(instance, kind)})
+
+
+async def main():
+    args = parse_args()
+    await seed(args.moves, args.products, args.warehouses)
+    
+    repository = container.stock_repository()
+    async with container.database().async_session() as session:
+        result = await session.execute(
+            select(StockMoveEntity).options(*repository._stock_move_load_options()).order_by(
+                StockMoveEntity.date.desc(), StockMoveEntity.id.desc()
+            ).limit(args.page_size)
+        )
+        entities = list(result.scalars().all())
+    
+    print(f"page of {len(entities)} moves, {args.repeat} iterations per variant")
+    for label, new_map in VARIANTS:
+        gc.collect()
+        tracemalloc.start()
+        moves, dtos = map_page(entities, new_map)
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            map_page(entities, new_map)
+        elapsed = (time.perf_counter() - started) / args.repeat
+        
+        print(
+            f"  {label:22} Product {distinct((m.product for m in moves), Product):4} "
+            f"Warehouse {distinct((m.warehouse for m in moves), Warehouse):4} "
+            f"ProductDTO {distinct((d.product for d in dtos), ProductDTO):4} "
+            f"WarehouseDTO {distinct((d.warehouse for d in dtos), WarehouseDTO):4} "
+            f"retained {retained / 1024:7.1f} KiB  {elapsed * 1000:6.2f} ms/page"
+        )
+    
+    await container.database().dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -15,11 +15,11 @@ from app.domain.model.stock import Product, Warehouse, StockMove, StockMoveType
 from app.domain.usecase.util.security import SecurityService
 from app.application.settings import settings
 
-db = Database(database_url=settings.database_url)
+db = Database(database_url=settings.database_url, sqlite_pragmas=settings.get_sqlite_pragmas())
 db.create_database()
 
-user_repo = SQLAlchemyUserRepository(session_factory=db.session)
-stock_repo = SQLAlchemyStockRepository(session_factory=db.session)
+user_repo = SQLAlchemyUserRepository(session_factory=db.async_session)
+stock_repo = SQLAlchemyStockRepository(session_factory=db.async_session)
 
 security = SecurityService()
 
@@ -243,7 +243,7 @@ async def seed_stock_moves():
     ]
     
     start_date = date(2025, 1, 1)
-    created_count = 0
+    stock_moves = []
     
     for i in range(30):
         move_id = f"SM{str(i+1).zfill(3)}"
@@ -270,26 +270,23 @@ async def seed_stock_moves():
             quantity = random.randint(1, 30)
             reference = random.choice(adjust_references)
         
-        stock_move = StockMove(
-            id=move_id,
-            date=move_date,
-            product=product,
-            warehouse=warehouse,
-            type=move_type,
-            quantity=quantity,
-            reference=reference
+        stock_moves.append(
+            StockMove(
+                id=move_id,
+                date=move_date,
+                product=product,
+                warehouse=warehouse,
+                type=move_type,
+                quantity=quantity,
+                reference=reference
+            )
         )
-        
-        try:
-            existing = await stock_repo.find_stock_move_by_id(stock_move.id)
-            if not existing:
-                await stock_repo.create_stock_move(stock_move)
-                created_count += 1
-                
-        except Exception as e:
-            print(f"Error creating stock move {stock_move.id}: {e}")
     
-    print(f"{created_count} stock moves created")
+    result = await stock_repo.create_stock_moves_bulk(
+        stock_moves, chunk_size=settings.bulk_insert_chunk_size
+    )
+    
+    print(f"{len(result.created_ids)} stock moves created")
 
 
 async def main():
@@ -308,6 +305,8 @@ async def main():
     
     await seed_stock_moves()
     
+    await db.dispose()
+    
     print("\n" + "=" * 60)
     print("SEED COMPLETADO EXITOSAMENTE!")
     
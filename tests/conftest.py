@@ -0,0 +1,85 @@
+"""Shared fixtures: the app runs against a throwaway SQLite file seeded once per session"""
+import asyncio
+import os
+import tempfile
+from datetime import date, timedelta
+from typing import List
+
+import pytest
+
+TEST_DB_DIR = tempfile.mkdtemp(prefix="stock-api-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DB_DIR}/stock_api.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.domain.model.stock import Product, Warehouse, StockMove, StockMoveType  # noqa: E402
+from app.domain.usecase.util.jwt import JWTService  # noqa: E402
+
+PRODUCTS = [Product(id=f"P{i:03d}", name=f"Product {i}", sku=f"SKU-{i:03d}") for i in range(1, 7)]
+WAREHOUSES = [Warehouse(id=f"W{i:03d}", name=f"Warehouse {i}") for i in range(1, 4)]
+MOVE_TYPES = [StockMoveType.IN, StockMoveType.OUT, StockMoveType.ADJUST]
+SEED_MOVES = 360
+SEED_START_DATE = date(2025, 1, 1)
+
+
+def build_stock_moves(count: int, prefix: str = "SM") -> List[StockMove]:
+    return [
+        StockMove(
+            id=f"{prefix}{index:05d}",
+            date=SEED_START_DATE + timedelta(days=index % 90),
+            product=PRODUCTS[index % len(PRODUCTS)],
+            warehouse=WAREHOUSES[index % len(WAREHOUSES)],
+            type=MOVE_TYPES[index % len(MOVE_TYPES)],
+            quantity=index % 50 + 1,
+            reference=f"REF-{index:05d}"
+        )
+        for index in range(count)
+    ]
+
+
+async def _seed(container) -> None:
+    repository = container.stock_repository()
+    for product in PRODUCTS:
+        await repository.create_product(product)
+    for warehouse in WAREHOUSES:
+        await repository.create_warehouse(warehouse)
+    await repository.create_stock_moves_bulk(build_stock_moves(SEED_MOVES))
+    # Connections opened on this loop must not leak into the TestClient loop
+    await container.database().async_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def container():
+    from app.application.container import container as app_container
+    return app_container
+
+
+@pytest.fixture(scope="session")
+def client(container):
+    from app.main import app
+    
+    asyncio.run(_seed(container))
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    token = JWTService.create_access_token(data={"sub": "test-user"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def statements(container):
+    """SQL statements run on the async engine while the test is active"""
+    executed: List[str] = []
+    engine = container.database().async_engine.sync_engine
+    
+    def record(connection, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
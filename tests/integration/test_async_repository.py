@@ -0,0 +1,56 @@
+"""A slow query on one connection does not hold up other repository calls"""
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import text
+
+from app.infrastructure.driven_adapter.persistence.config.database import Database
+from app.infrastructure.driven_adapter.persistence.entity import stock_entity  # noqa: F401
+from app.infrastructure.driven_adapter.persistence.stock_repository.sqlalchemy_stock_repository import (
+    SQLAlchemyStockRepository
+)
+from tests.conftest import PRODUCTS, WAREHOUSES, build_stock_moves
+
+SLOW_QUERY = text(
+    "WITH RECURSIVE counter(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM counter WHERE n < :limit) "
+    "SELECT count(*) FROM counter"
+)
+CONCURRENT_LISTINGS = 5
+
+
+@pytest.fixture
+async def repository(tmp_path):
+    database = Database(database_url=f"sqlite:///{tmp_path / 'async.db'}")
+    database.create_database()
+    stock_repository = SQLAlchemyStockRepository(session_factory=database.async_session)
+    for product in PRODUCTS:
+        await stock_repository.create_product(product)
+    for warehouse in WAREHOUSES:
+        await stock_repository.create_warehouse(warehouse)
+    await stock_repository.create_stock_moves_bulk(build_stock_moves(100))
+    yield stock_repository
+    await database.dispose()
+
+
+@pytest.mark.integration
+async def test_listings_finish_while_slow_query_runs(repository):
+    finished = {}
+    
+    async def slow_query():
+        async with repository.session_factory() as session:
+            await session.scalar(SLOW_QUERY, {"limit": 3_000_000})
+        finished["slow"] = time.perf_counter()
+    
+    async def listing(index: int):
+        page = await repository.find_all_stock_moves(page=1, page_size=20)
+        assert len(page.data) == 20
+        finished[index] = time.perf_counter()
+    
+    slow = asyncio.create_task(slow_query())
+    await asyncio.sleep(0.05)
+    await asyncio.gather(*(listing(index) for index in range(CONCURRENT_LISTINGS)))
+    
+    assert not slow.done()
+    await slow
+    assert all(finished[index] < finished["slow"] for index in range(CONCURRENT_LISTINGS))
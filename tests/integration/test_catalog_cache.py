@@ -0,0 +1,159 @@
+"""The catalog cache fronts the first product and warehouse pages without serving stale rows"""
+import asyncio
+import os
+import sqlite3
+
+import pytest
+from sqlalchemy import event
+
+from app.domain.model.stock import Product, Warehouse
+from app.infrastructure.driven_adapter.persistence.config.database import Database
+from app.infrastructure.driven_adapter.persistence.stock_repository.sqlalchemy_stock_repository import (
+    SQLAlchemyStockRepository
+)
+
+
+def create_in_other_worker(*items) -> None:
+    # A second engine on the same file stands in for another worker process
+    async def create() -> None:
+        database = Database(database_url=os.environ["DATABASE_URL"])
+        repository = SQLAlchemyStockRepository(session_factory=database.async_session)
+        for item in items:
+            if isinstance(item, Product):
+                await repository.create_product(item)
+            else:
+                await repository.create_warehouse(item)
+        await database.dispose()
+    
+    asyncio.run(create())
+
+
+def catalog_stats(client) -> dict:
+    return client.get("/health/cache").json()["catalog"]
+
+
+def ids(response) -> list:
+    return [item["id"] for item in response.json()["data"]]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("path", ["/stock-moves/products", "/stock-moves/warehouses"])
+def test_repeated_first_page_is_served_from_cache(client, auth_headers, path):
+    first = client.get(path, headers=auth_headers)
+    before = catalog_stats(client)
+    
+    repeated = client.get(path, headers=auth_headers)
+    after = catalog_stats(client)
+    
+    assert repeated.json() == first.json()
+    assert after["hits"] == before["hits"] + 1
+    assert after["misses"] == before["misses"]
+
+
+@pytest.mark.integration
+def test_filtered_and_later_pages_are_not_cached(client, auth_headers):
+    before = catalog_stats(client)
+    
+    client.get("/stock-moves/products", headers=auth_headers, params={"prefix": "Product"})
+    client.get("/stock-moves/products", headers=auth_headers, params={"sort": "name"})
+    
+    after = catalog_stats(client)
+    assert (after["hits"], after["misses"]) == (before["hits"], before["misses"])
+
+
+@pytest.mark.integration
+def test_cached_page_shows_creates_from_other_workers(client, auth_headers):
+    client.get("/stock-moves/products", headers=auth_headers)
+    client.get("/stock-moves/warehouses", headers=auth_headers)
+    
+    create_in_other_worker(
+        Product(id="P100", name="Product 100", sku="SKU-100"),
+        Warehouse(id="W100", name="Warehouse 100")
+    )
+    
+    assert "P100" in ids(client.get("/stock-moves/products", headers=auth_headers))
+    assert "W100" in ids(client.get("/stock-moves/warehouses", headers=auth_headers))
+
+
+@pytest.mark.integration
+def test_import_accepts_references_created_by_other_workers(client, auth_headers):
+    client.get("/stock-moves/products", headers=auth_headers)
+    client.post(
+        "/stock-moves/import",
+        headers=auth_headers,
+        files={"file": ("warm.csv", b"id,date,productId,warehouseId,type,quantity,reference\n")}
+    )
+    
+    create_in_other_worker(
+        Product(id="P101", name="Product 101", sku="SKU-101"),
+        Warehouse(id="W101", name="Warehouse 101")
+    )
+    
+    response = client.post(
+        "/stock-moves/import",
+        headers=auth_headers,
+        files={"file": (
+            "moves.csv",
+            b"id,date,productId,warehouseId,type,quantity,reference\n"
+            b"IMP-CACHE-1,2025-03-01,P101,W101,IN,5,REF-CACHE-1\n"
+        )}
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["job"]["created"] == 1
+    assert response.json()["errors"] == []
+
+
+@pytest.mark.integration
+def test_cached_first_page_reads_the_data_version_once(client, auth_headers, statements):
+    client.get("/stock-moves/products", headers=auth_headers)
+    statements.clear()
+    
+    client.get("/stock-moves/products", headers=auth_headers)
+    
+    assert len(statements) == 1
+    assert "data_versions" in statements[0]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("prefix, expected", [
+    ("product 1", {"P001"}),
+    ("PRODUCT 1", {"P001"}),
+    ("sku-00", {"P001", "P002", "P003", "P004", "P005", "P006"}),
+    ("Product_", set()),
+    ("%", set()),
+])
+def test_prefix_filter_is_case_insensitive(client, auth_headers, prefix, expected):
+    response = client.get(
+        "/stock-moves/products", headers=auth_headers, params={"prefix": prefix, "pageSize": 1000}
+    )
+    
+    assert set(ids(response)) - {"P100", "P101"} == expected
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("path, indexes", [
+    ("/stock-moves/products", {"ix_products_lower_name", "ix_products_lower_sku"}),
+    ("/stock-moves/warehouses", {"ix_warehouses_lower_name"}),
+])
+def test_prefix_filter_walks_the_lower_indexes(client, auth_headers, container, path, indexes):
+    executed = []
+    
+    def record(connection, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+    
+    engine = container.database().async_engine.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        client.get(path, headers=auth_headers, params={"prefix": "Ware"})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    
+    statement, parameters = next(item for item in executed if "lower(" in item[0])
+    with sqlite3.connect(os.environ["DATABASE_URL"].removeprefix("sqlite:///")) as connection:
+        plan = " ".join(
+            row[-1] for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        )
+    
+    assert all(f"USING INDEX {index}" in plan for index in indexes)
+    assert "SCAN" not in plan
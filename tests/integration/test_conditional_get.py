@@ -0,0 +1,89 @@
+"""ETag handling on stock move reads"""
+import pytest
+
+
+@pytest.mark.integration
+def test_unknown_id_is_not_found_even_with_current_etag(client, auth_headers):
+    etag = client.get("/stock-moves/SM00001", headers=auth_headers).headers["ETag"]
+    
+    response = client.get(
+        "/stock-moves/DOES-NOT-EXIST", headers={**auth_headers, "If-None-Match": etag}
+    )
+    
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_known_id_with_current_etag_is_not_modified(client, auth_headers):
+    etag = client.get("/stock-moves/SM00001", headers=auth_headers).headers["ETag"]
+    
+    response = client.get("/stock-moves/SM00001", headers={**auth_headers, "If-None-Match": etag})
+    
+    assert response.status_code == 304
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("encoding", ["gzip", "identity"])
+def test_not_modified_repeats_the_etag_of_the_full_response(client, auth_headers, encoding):
+    headers = {**auth_headers, "Accept-Encoding": encoding}
+    full = client.get("/stock-moves", headers=headers, params={"pageSize": 100})
+    assert full.headers.get("Content-Encoding", "identity") == encoding
+    
+    revalidated = client.get(
+        "/stock-moves",
+        headers={**headers, "If-None-Match": full.headers["ETag"]},
+        params={"pageSize": 100}
+    )
+    
+    assert revalidated.status_code == 304
+    assert full.headers["ETag"].startswith('W/"')
+    assert revalidated.headers["ETag"] == full.headers["ETag"]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("path, tagged, other", [
+    ("/stock-moves", {"pageSize": 100}, {"pageSize": 7}),
+    ("/stock-moves", {"page": 1}, {"page": 2}),
+    ("/stock-moves", {"warehouse": "W001"}, {"warehouse": "W002"}),
+    ("/stock-moves", {}, {"fields": "id,quantity"}),
+    ("/stock-moves", {}, {"countMode": "has_more"}),
+    ("/stock-moves/products", {}, {"prefix": "Product 1"}),
+    ("/stock-moves/warehouses", {"sort": "id"}, {"sort": "-id"}),
+])
+def test_etag_from_one_query_does_not_match_another(client, auth_headers, path, tagged, other):
+    etag = client.get(path, headers=auth_headers, params=tagged).headers["ETag"]
+    
+    response = client.get(path, headers={**auth_headers, "If-None-Match": etag}, params=other)
+    
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.integration
+def test_etag_from_one_move_does_not_match_another(client, auth_headers):
+    etag = client.get("/stock-moves/SM00001", headers=auth_headers).headers["ETag"]
+    
+    response = client.get("/stock-moves/SM00002", headers={**auth_headers, "If-None-Match": etag})
+    
+    assert response.status_code == 200
+
+
+@pytest.mark.integration
+def test_query_parameter_order_keeps_the_etag(client, auth_headers):
+    etag = client.get("/stock-moves?pageSize=5&type=IN", headers=auth_headers).headers["ETag"]
+    
+    response = client.get(
+        "/stock-moves?type=IN&pageSize=5", headers={**auth_headers, "If-None-Match": etag}
+    )
+    
+    assert response.status_code == 304
+
+
+@pytest.mark.integration
+def test_if_modified_since_alone_never_answers_not_modified(client, auth_headers):
+    response = client.get(
+        "/stock-moves/SM00001",
+        headers={**auth_headers, "If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    )
+    
+    assert response.status_code == 200
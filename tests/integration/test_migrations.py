@@ -0,0 +1,110 @@
+"""Alembic revisions: baseline safety on existing databases and stock move index plans"""
+import sqlite3
+from datetime import date
+from itertools import product
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import select, or_, and_
+from sqlalchemy.dialects import sqlite
+
+from app.infrastructure.driven_adapter.persistence.entity.stock_entity import StockMoveEntity
+
+ROOT = Path(__file__).resolve().parents[2]
+
+LEGACY_SCHEMA = """
+CREATE TABLE users (id VARCHAR PRIMARY KEY, name VARCHAR NOT NULL, last_name VARCHAR NOT NULL,
+    email VARCHAR NOT NULL, password VARCHAR NOT NULL);
+CREATE TABLE products (id VARCHAR PRIMARY KEY, name VARCHAR NOT NULL, sku VARCHAR);
+CREATE TABLE warehouses (id VARCHAR PRIMARY KEY, name VARCHAR NOT NULL);
+CREATE TABLE stock_moves (id VARCHAR PRIMARY KEY, date DATE NOT NULL,
+    product_id VARCHAR NOT NULL REFERENCES products (id),
+    warehouse_id VARCHAR NOT NULL REFERENCES warehouses (id),
+    type VARCHAR(6) NOT NULL, quantity INTEGER NOT NULL, reference VARCHAR NOT NULL);
+INSERT INTO users VALUES ('U1', 'Ada', 'Lovelace', 'ada@example.com', 'x');
+INSERT INTO products VALUES ('P001', 'Product 1', 'SKU-001');
+INSERT INTO warehouses VALUES ('W001', 'Warehouse 1');
+INSERT INTO stock_moves VALUES ('SM001', '2025-01-01', 'P001', 'W001', 'IN', 5, 'REF-001');
+"""
+
+EXPECTED_INDEXES = {
+    (False, False): "ix_stock_moves_date_id",
+    (True, False): "ix_stock_moves_warehouse_date",
+    (False, True): "ix_stock_moves_type_date",
+    (True, True): "ix_stock_moves_warehouse_type_date",
+}
+
+
+def alembic_config(database_path: Path) -> Config:
+    # No ini file, so env.py leaves the application's logging configuration alone
+    config = Config()
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{database_path}")
+    return config
+
+
+def listing_sql(by_warehouse: bool, by_type: bool, after_cursor: bool) -> str:
+    conditions = []
+    if by_warehouse:
+        conditions.append(StockMoveEntity.warehouse_id == "W001")
+    if by_type:
+        conditions.append(StockMoveEntity.type == "IN")
+    if after_cursor:
+        conditions.append(or_(
+            StockMoveEntity.date < date(2025, 6, 1),
+            and_(StockMoveEntity.date == date(2025, 6, 1), StockMoveEntity.id < "SM500")
+        ))
+    statement = select(StockMoveEntity).where(*conditions).order_by(
+        StockMoveEntity.date.desc(), StockMoveEntity.id.desc()
+    ).limit(20)
+    return str(statement.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def query_plan(database_path: Path, sql: str) -> str:
+    with sqlite3.connect(database_path) as connection:
+        rows = connection.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.fixture
+def legacy_database(tmp_path) -> Path:
+    database_path = tmp_path / "legacy.db"
+    with sqlite3.connect(database_path) as connection:
+        connection.executescript(LEGACY_SCHEMA)
+    return database_path
+
+
+@pytest.mark.integration
+def test_baseline_downgrade_keeps_preexisting_tables(legacy_database):
+    config = alembic_config(legacy_database)
+    
+    command.upgrade(config, "0001")
+    command.downgrade(config, "base")
+    
+    with sqlite3.connect(legacy_database) as connection:
+        for table in ("users", "products", "warehouses", "stock_moves"):
+            assert connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone() == (1,)
+
+
+FILTER_COMBINATIONS = list(product([False, True], repeat=3))
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("by_warehouse,by_type,after_cursor", FILTER_COMBINATIONS)
+def test_listing_uses_stock_move_index_after_migration(
+    legacy_database, by_warehouse, by_type, after_cursor
+):
+    config = alembic_config(legacy_database)
+    sql = listing_sql(by_warehouse, by_type, after_cursor)
+    
+    command.upgrade(config, "0001")
+    before = query_plan(legacy_database, sql)
+    command.upgrade(config, "0002")
+    after = query_plan(legacy_database, sql)
+    
+    assert "ix_stock_moves_" not in before
+    assert "SCAN stock_moves" in before
+    assert f"USING INDEX {EXPECTED_INDEXES[by_warehouse, by_type]}" in after, after
+    assert "TEMP B-TREE" not in after, after
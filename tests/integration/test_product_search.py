@@ -0,0 +1,57 @@
+"""The SQLite products_search index follows products even after rowids move"""
+import sqlite3
+
+import pytest
+from alembic import command
+
+from app.infrastructure.driven_adapter.persistence.config.database import Database
+from app.infrastructure.driven_adapter.persistence.entity import stock_entity  # noqa: F401
+from tests.integration.test_migrations import LEGACY_SCHEMA, alembic_config
+
+
+def seed_products(connection: sqlite3.Connection) -> None:
+    connection.executemany(
+        "INSERT INTO products (id, name, sku) VALUES (?, ?, ?)",
+        [(f"X{index:03d}", f"Widget {index}", f"SKU-{index:03d}") for index in range(20)]
+    )
+    # Same state a VACUUM that renumbers products leaves behind
+    connection.execute("UPDATE products_search SET rowid = rowid + 1000")
+
+
+def edit_and_compare(connection: sqlite3.Connection) -> None:
+    connection.execute("UPDATE products SET name = 'Gadget renamed' WHERE id = 'X003'")
+    connection.execute("DELETE FROM products WHERE id IN ('X007', 'X011')")
+    
+    indexed = connection.execute(
+        "SELECT product_id, name, sku FROM products_search ORDER BY product_id"
+    ).fetchall()
+    products = connection.execute(
+        "SELECT id, name, coalesce(sku, '') FROM products ORDER BY id"
+    ).fetchall()
+    assert indexed == products
+    matches = connection.execute(
+        "SELECT product_id FROM products_search WHERE products_search MATCH '\"renamed\"'"
+    ).fetchall()
+    assert matches == [("X003",)]
+
+
+@pytest.mark.integration
+def test_create_all_schema_tracks_products_by_id(tmp_path):
+    database_path = tmp_path / "create_all.db"
+    Database(database_url=f"sqlite:///{database_path}").create_database()
+    
+    with sqlite3.connect(database_path) as connection:
+        seed_products(connection)
+        edit_and_compare(connection)
+
+
+@pytest.mark.integration
+def test_migrated_schema_tracks_products_by_id(tmp_path):
+    database_path = tmp_path / "migrated.db"
+    with sqlite3.connect(database_path) as connection:
+        connection.executescript(LEGACY_SCHEMA)
+    command.upgrade(alembic_config(database_path), "head")
+    
+    with sqlite3.connect(database_path) as connection:
+        seed_products(connection)
+        edit_and_compare(connection)
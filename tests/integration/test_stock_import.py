@@ -0,0 +1,110 @@
+"""Imports parse off the event loop and commit rows together with the job position"""
+import asyncio
+import io
+from datetime import datetime
+
+import pytest
+
+from app.domain.model.stock import StockImportJob
+from app.infrastructure.driven_adapter.persistence.config.database import Database
+from app.infrastructure.driven_adapter.persistence.entity import stock_entity  # noqa: F401
+from app.infrastructure.driven_adapter.persistence.stock_repository.sqlalchemy_stock_repository import (
+    SQLAlchemyStockRepository
+)
+from app.infrastructure.entry_point.utils.stock_import import parse_stock_moves_in_threadpool
+from tests.conftest import PRODUCTS, WAREHOUSES, build_stock_moves
+
+IMPORT_ROWS = 50000
+
+
+@pytest.fixture
+async def repository(tmp_path):
+    database = Database(database_url=f"sqlite:///{tmp_path / 'import.db'}")
+    database.create_database()
+    stock_repository = SQLAlchemyStockRepository(session_factory=database.async_session)
+    for product in PRODUCTS:
+        await stock_repository.create_product(product)
+    for warehouse in WAREHOUSES:
+        await stock_repository.create_warehouse(warehouse)
+    now = datetime.utcnow()
+    await stock_repository.save_import_job(
+        StockImportJob(id="job", source="test.csv", started_at=now, updated_at=now)
+    )
+    yield stock_repository
+    await database.dispose()
+
+
+def pass_everything_through(monkeypatch, repository) -> None:
+    # Same outcome as a concurrent insert landing between the existence check and the insert
+    async def unfiltered(session, chunk, seen_ids, errors, check_references=True):
+        return list(chunk)
+    
+    monkeypatch.setattr(repository, "_filter_insertable", unfiltered)
+
+
+async def stored_ids(repository, ids) -> set:
+    batch = await repository.find_stock_moves_by_ids(ids)
+    return {stock_move.id for stock_move in batch.data}
+
+
+@pytest.mark.integration
+async def test_parsing_leaves_the_event_loop_free():
+    lines = io.StringIO("id,date,productId,warehouseId,type,quantity,reference\n" + "".join(
+        f"IMP{index:06d},2025-01-01,P001,W001,IN,1,REF\n" for index in range(IMPORT_ROWS)
+    ))
+    ticks = 0
+    parsing = True
+    
+    async def tick():
+        nonlocal ticks
+        while parsing:
+            ticks += 1
+            await asyncio.sleep(0)
+    
+    ticker = asyncio.ensure_future(tick())
+    records = [record async for record in parse_stock_moves_in_threadpool(lines, "csv")]
+    parsing = False
+    await ticker
+    
+    assert len(records) == IMPORT_ROWS
+    assert ticks > IMPORT_ROWS // 1000
+
+
+@pytest.mark.integration
+async def test_chunk_fallback_commits_rows_with_the_job_position(repository, monkeypatch):
+    duplicate, first, second = build_stock_moves(3, prefix="IMP")
+    await repository.create_stock_move(duplicate)
+    pass_everything_through(monkeypatch, repository)
+    
+    result = await repository.import_stock_moves_chunk(
+        "job", [(0, duplicate), (1, first), (2, second)], rows_processed=3
+    )
+    
+    assert result.created_ids == [first.id, second.id]
+    assert [error.id for error in result.errors] == [duplicate.id]
+    job = await repository.find_import_job("job")
+    assert (job.rows_processed, job.created, job.failed) == (3, 2, 1)
+
+
+@pytest.mark.integration
+async def test_chunk_fallback_failure_commits_nothing(repository, monkeypatch):
+    duplicate, first, second = build_stock_moves(3, prefix="IMP")
+    await repository.create_stock_move(duplicate)
+    pass_everything_through(monkeypatch, repository)
+    apply = repository.aggregate_writer.apply
+    
+    async def crash_on_second(session, stock_moves):
+        if stock_moves[0].id == second.id:
+            raise RuntimeError("worker stopped")
+        await apply(session, stock_moves)
+    
+    monkeypatch.setattr(repository.aggregate_writer, "apply", crash_on_second)
+    
+    with pytest.raises(RuntimeError):
+        await repository.import_stock_moves_chunk(
+            "job", [(0, duplicate), (1, first), (2, second)], rows_processed=3
+        )
+    
+    assert await stored_ids(repository, [first.id, second.id]) == set()
+    job = await repository.find_import_job("job")
+    assert (job.rows_processed, job.created, job.failed) == (0, 0, 0)
@@ -0,0 +1,74 @@
+"""Pagination totals and cursors stay right across workers and page sizes"""
+import asyncio
+import os
+from datetime import date
+
+import pytest
+
+from app.domain.model.stock import StockMove, StockMoveType
+from app.infrastructure.driven_adapter.persistence.config.database import Database
+from app.infrastructure.driven_adapter.persistence.stock_repository.sqlalchemy_stock_repository import (
+    SQLAlchemyStockRepository
+)
+from tests.conftest import PRODUCTS, WAREHOUSES
+
+
+def create_in_other_worker(stock_move: StockMove) -> None:
+    # A second engine on the same file stands in for another worker process
+    async def create() -> None:
+        database = Database(database_url=os.environ["DATABASE_URL"])
+        repository = SQLAlchemyStockRepository(session_factory=database.async_session)
+        await repository.create_stock_move(stock_move)
+        await database.dispose()
+    
+    asyncio.run(create())
+
+
+def list_stock_moves(client, auth_headers, **params) -> dict:
+    response = client.get("/stock-moves", headers=auth_headers, params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.integration
+def test_cached_count_follows_writes_from_other_workers(client, auth_headers):
+    params = {"warehouse": "W002", "type": "ADJUST", "countMode": "cached"}
+    before = list_stock_moves(client, auth_headers, **params)["pagination"]["totalItems"]
+    
+    create_in_other_worker(StockMove(
+        id="SM-OTHER-WORKER",
+        date=date(2025, 6, 1),
+        product=PRODUCTS[0],
+        warehouse=WAREHOUSES[1],
+        type=StockMoveType.ADJUST,
+        quantity=3,
+        reference="REF-OTHER-WORKER"
+    ))
+    
+    after = list_stock_moves(client, auth_headers, **params)["pagination"]["totalItems"]
+    assert after == before + 1
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("count_mode", ["exact", "cached", "has_more"])
+def test_cursor_reused_with_larger_page_size_still_reports_more(client, auth_headers, count_mode):
+    params = {"warehouse": "W001", "countMode": count_mode}
+    pages = [
+        list_stock_moves(client, auth_headers, page=page, pageSize=100, **params) for page in (1, 2)
+    ]
+    expected = [item["id"] for page in pages for item in page["data"]]
+    assert len(expected) > 110
+    
+    first = list_stock_moves(client, auth_headers, pageSize=10, **params)
+    second = list_stock_moves(
+        client, auth_headers, pageSize=100, cursor=first["pagination"]["nextCursor"], **params
+    )
+    assert second["pagination"]["hasMore"] is True
+    third = list_stock_moves(
+        client, auth_headers, pageSize=100, cursor=second["pagination"]["nextCursor"], **params
+    )
+    assert third["pagination"]["hasMore"] is False
+    assert third["pagination"]["nextCursor"] is None
+    
+    collected = [item["id"] for page in (first, second, third) for item in page["data"]]
+    assert collected == expected
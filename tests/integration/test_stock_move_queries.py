@@ -0,0 +1,48 @@
+"""GET /stock-moves runs a fixed number of statements per page, whatever its size"""
+import pytest
+
+from app.application.settings import settings
+
+PAGE_SIZES = [5, 25, 100]
+
+# data version (ETag) + count + page, plus one IN query per relation with selectin
+EXPECTED_STATEMENTS = {
+    "joined": 3,
+    "selectin": 5,
+}
+
+
+@pytest.fixture(params=sorted(EXPECTED_STATEMENTS))
+def loader_strategy(request, container):
+    container.stock_repository.add_kwargs(loader_strategy=request.param)
+    yield request.param
+    container.stock_repository.add_kwargs(loader_strategy=settings.stock_move_loader_strategy)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("filters", [{}, {"warehouse": "W002"}, {"type": "OUT"}])
+def test_statement_count_does_not_grow_with_page_size(
+    client, auth_headers, statements, loader_strategy, filters
+):
+    counts = {}
+    for page_size in PAGE_SIZES:
+        statements.clear()
+        response = client.get(
+            "/stock-moves",
+            headers=auth_headers,
+            params={**filters, "pageSize": page_size, "countMode": "exact"}
+        )
+        
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == page_size
+        counts[page_size] = len(statements)
+    
+    assert set(counts.values()) == {EXPECTED_STATEMENTS[loader_strategy]}, counts
+
+
+@pytest.mark.integration
+def test_every_row_carries_its_product_and_warehouse(client, auth_headers, loader_strategy):
+    response = client.get("/stock-moves", headers=auth_headers, params={"pageSize": 100})
+    
+    moves = response.json()["data"]
+    assert all(move["product"]["name"] and move["warehouse"]["name"] for move in moves)
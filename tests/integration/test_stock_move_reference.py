@@ -0,0 +1,26 @@
+"""PATCH /stock-moves/{id} returns the move with its own product and warehouse"""
+import pytest
+
+from app.domain.model.util.exceptions import InvalidReferenceException
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("stock_move_id", ["SM00004", "SM00011"])
+def test_updated_move_keeps_its_catalog_rows(client, auth_headers, stock_move_id):
+    before = client.get(f"/stock-moves/{stock_move_id}", headers=auth_headers).json()
+    
+    response = client.patch(
+        f"/stock-moves/{stock_move_id}", headers=auth_headers, json={"reference": "RENAMED-REF"}
+    )
+    
+    assert response.status_code == 200
+    updated = response.json()
+    assert updated["reference"] == "RENAMED-REF"
+    assert updated["product"] == before["product"]
+    assert updated["warehouse"] == before["warehouse"]
+
+
+@pytest.mark.integration
+async def test_use_case_rejects_short_reference(container):
+    with pytest.raises(InvalidReferenceException):
+        await container.stock_use_case().update_stock_move_reference("SM00004", "x")